@@ -0,0 +1,205 @@
+import threading
+import time
+from typing import Callable, Iterator, Optional, Protocol
+
+import board
+import rules
+import transposition
+
+WIN_SCORE = 1000000
+INFINITY = 2 * WIN_SCORE
+
+
+class SearchStopped(Exception):
+    pass
+
+
+class Player(Protocol):
+
+    player: int
+
+    def search(
+        self,
+        board_: board.Board,
+        player: int,
+        cancelled: Optional[threading.Event] = None,
+    ) -> Optional[int]: ...
+
+
+class ComputerPlayer:
+
+    def __init__(
+        self,
+        player: int,
+        depth: int = 6,
+        time_budget: Optional[float] = None,
+        table_megabytes: float = 16,
+    ):
+        self.player = player
+        self.depth = depth
+        self.time_budget = time_budget
+        self.transposition_table = transposition.TranspositionTable(table_megabytes)
+        self.move_order = []
+        self.nodes = 0
+        self.deadline = None
+        self.cancelled = None
+        self.best_column = None
+        self.best_score = None
+
+    def choose_column(self, game_rules: rules.Rules) -> int:
+        return self.search(game_rules.board, game_rules.current_player)
+
+    def search(
+        self,
+        board_: board.Board,
+        player: int,
+        cancelled: Optional[threading.Event] = None,
+    ) -> Optional[int]:
+        board_ = board_.copy()
+        self.move_order = sorted(
+            range(board_.columns),
+            key=lambda column: abs(2 * column - board_.columns + 1),
+        )
+        self.cancelled = cancelled
+        self.deadline = None
+        if self.time_budget is not None:
+            self.deadline = time.perf_counter() + self.time_budget
+        self.best_column = None
+        self.best_score = None
+        key = board_.get_search_hash(player)
+        for depth in range(1, self.depth + 1):
+            if cancelled is not None and cancelled.is_set():
+                break
+            try:
+                score = self.negamax(board_, player, depth, -INFINITY, INFINITY)
+            except SearchStopped:
+                break
+            self.best_column = board_.get_canonical_column(
+                self.transposition_table.get(key)[3]
+            )
+            self.best_score = score
+            if abs(score) >= WIN_SCORE:
+                break
+        return self.best_column
+
+    def check_stop(self) -> None:
+        if self.cancelled is not None and self.cancelled.is_set():
+            raise SearchStopped
+        # Only give up on the clock once a move from a finished depth exists.
+        if (
+            self.deadline is not None
+            and self.best_column is not None
+            and time.perf_counter() > self.deadline
+        ):
+            raise SearchStopped
+
+    def negamax(
+        self, board_: board.Board, player: int, depth: int, alpha: int, beta: int
+    ) -> int:
+        self.nodes += 1
+        if not self.nodes & 1023:
+            self.check_stop()
+        if board_.board_full():
+            return 0
+        if depth == 0:
+            return self.evaluate(board_, player)
+        key = board_.get_search_hash(player)
+        entry = self.transposition_table.get(key)
+        best_column = None
+        if entry is not None:
+            entry_depth, flag, value, best_column = entry
+            best_column = board_.get_canonical_column(best_column)
+            if entry_depth >= depth:
+                if flag == transposition.EXACT:
+                    return value
+                if flag == transposition.LOWER_BOUND:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+        original_alpha = alpha
+        best_score = -INFINITY
+        for column in self.get_moves(board_, best_column):
+            board_.drop_disk_in_column(column, player)
+            if board_.has_four_in_a_row(player):
+                # Prefer the quickest win, which is the one with most depth left.
+                score = WIN_SCORE + depth
+            else:
+                score = -self.negamax(
+                    board_, board.OPPONENTS[player], depth - 1, -beta, -alpha
+                )
+            board_.undo_drop(column)
+            if score > best_score:
+                best_score = score
+                best_column = column
+                alpha = max(alpha, score)
+                if alpha >= beta:
+                    break
+        if best_score <= original_alpha:
+            flag = transposition.UPPER_BOUND
+        elif best_score >= beta:
+            flag = transposition.LOWER_BOUND
+        else:
+            flag = transposition.EXACT
+        self.transposition_table.put(
+            key, depth, flag, best_score, board_.get_canonical_column(best_column)
+        )
+        return best_score
+
+    def get_moves(
+        self, board_: board.Board, first_column: Optional[int]
+    ) -> Iterator[int]:
+        if first_column is not None:
+            yield first_column
+        for column in self.move_order:
+            if column != first_column and not board_.column_full(column):
+                yield column
+
+    def evaluate(self, board_: board.Board, player: int) -> int:
+        return self.count_threats(board_, player) - self.count_threats(
+            board_, board.OPPONENTS[player]
+        )
+
+    def count_threats(self, board_: board.Board, player: int) -> int:
+        return bin(board_.get_winning_cells(player)).count("1")
+
+
+class BackgroundSearch:
+
+    def __init__(
+        self,
+        computer_player: Player,
+        game_rules: rules.Rules,
+        on_done: Optional[Callable[[], None]] = None,
+    ):
+        self.computer_player = computer_player
+        self.board = game_rules.board.copy()
+        self.player = game_rules.current_player
+        self.on_done = on_done
+        self.column = None
+        self.cancelled = threading.Event()
+        self.finished = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self) -> None:
+        self.thread.start()
+
+    def run(self) -> None:
+        # Finish even if the search raises, or the game would wait forever
+        # for a move; column is then left as None.
+        try:
+            self.column = self.computer_player.search(
+                self.board, self.player, self.cancelled
+            )
+        finally:
+            self.finished.set()
+            if not self.cancelled.is_set() and self.on_done is not None:
+                self.on_done()
+
+    def done(self) -> bool:
+        return self.finished.is_set()
+
+    def cancel(self) -> None:
+        self.cancelled.set()
+        self.thread.join()
@@ -0,0 +1,126 @@
+from typing import Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+
+import board
+
+EMPTY = 0
+NO_WINNER = -1
+
+
+def to_array(boards: Iterable[board.Board]) -> np.ndarray:
+    boards = list(boards)
+    if not boards:
+        return np.zeros((0, 7, 7), dtype=np.int8)
+    array = np.zeros((len(boards), boards[0].columns, boards[0].rows), dtype=np.int8)
+    for index, board_ in enumerate(boards):
+        for column in range(board_.columns):
+            for row in range(board_.rows):
+                player = board_.get_disk(column, row)
+                if player is not None:
+                    array[index, column, row] = player + 1
+    return array
+
+
+def open_boards(path: str, columns: int = 7, rows: int = 7) -> np.memmap:
+    return np.memmap(path, dtype=np.int8, mode="r").reshape(-1, columns, rows)
+
+
+def four_in_a_row(
+    boards: np.ndarray,
+    connect: int = 4,
+    chunk_size: int = 65536,
+    winners: Optional[np.ndarray] = None,
+    lines: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    # boards holds EMPTY or player + 1 per (board, column, row), with row 0 at
+    # the top like Board. Chunks are copied in one at a time, so memory-mapped
+    # input larger than RAM streams through; pass memory-mapped winners and
+    # lines too, or use iter_four_in_a_row, to keep the results out of RAM.
+    count = len(boards)
+    if winners is None:
+        winners = np.empty(count, dtype=np.int8)
+    if lines is None:
+        lines = np.empty((count, connect, 2), dtype=np.int16)
+    if winners.shape != (count,) or lines.shape != (count, connect, 2):
+        raise ValueError("winners and lines must have a row per board")
+    for start, chunk_winners, chunk_lines in iter_four_in_a_row(
+        boards, connect, chunk_size
+    ):
+        winners[start : start + len(chunk_winners)] = chunk_winners
+        lines[start : start + len(chunk_lines)] = chunk_lines
+    return winners, lines
+
+
+def iter_four_in_a_row(
+    boards: np.ndarray, connect: int = 4, chunk_size: int = 65536
+) -> Iterator[Tuple[int, np.ndarray, np.ndarray]]:
+    # Yields the index of each chunk's first board with its results.
+    for start in range(0, len(boards), chunk_size):
+        chunk = np.asarray(boards[start : start + chunk_size])
+        yield (start, *four_in_a_row_chunk(chunk, connect))
+
+
+def four_in_a_row_chunk(
+    boards: np.ndarray, connect: int = 4
+) -> Tuple[np.ndarray, np.ndarray]:
+    count, columns, rows = boards.shape
+    span = connect - 1
+    winners = np.full(count, NO_WINNER, dtype=np.int8)
+    lines = np.full((count, connect, 2), -1, dtype=np.int16)
+    unsolved = np.ones(count, dtype=bool)
+    # Each direction is (column step, row step, first row offset); windows are
+    # indexed by the topmost row and leftmost column of the line so argmax
+    # reports the same line as Board's scans: topmost, then leftmost.
+    for column_step, row_step, row_offset in (
+        (1, 0, 0),
+        (0, 1, 0),
+        (1, 1, 0),
+        (1, -1, span),
+    ):
+        window_columns = columns - span * column_step
+        window_rows = rows - span * abs(row_step)
+        if window_columns <= 0 or window_rows <= 0:
+            continue
+        first = get_window(
+            boards, 0, column_step, row_step, row_offset, window_columns, window_rows
+        )
+        same = first != EMPTY
+        for offset in range(1, connect):
+            same &= first == get_window(
+                boards,
+                offset,
+                column_step,
+                row_step,
+                row_offset,
+                window_columns,
+                window_rows,
+            )
+        # (board, row, column) so a flat argmax walks rows first.
+        found = same.transpose(0, 2, 1).reshape(count, -1)
+        has_line = found.any(axis=1) & unsolved
+        if not has_line.any():
+            continue
+        index = found[has_line].argmax(axis=1)
+        top_row, left_column = np.divmod(index, window_columns)
+        first_row = top_row + row_offset
+        winners[has_line] = boards[has_line, left_column, first_row] - 1
+        for offset in range(connect):
+            lines[has_line, offset, 0] = left_column + offset * column_step
+            lines[has_line, offset, 1] = first_row + offset * row_step
+        unsolved &= ~has_line
+    return winners, lines
+
+
+def get_window(
+    boards: np.ndarray,
+    offset: int,
+    column_step: int,
+    row_step: int,
+    row_offset: int,
+    window_columns: int,
+    window_rows: int,
+) -> np.ndarray:
+    column = offset * column_step
+    row = row_offset + offset * row_step
+    return boards[:, column : column + window_columns, row : row + window_rows]
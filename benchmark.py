@@ -0,0 +1,159 @@
+import argparse
+import json
+import os
+import random
+import sys
+import timeit
+from typing import Callable, Dict, List, Tuple
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import board
+import game
+import rules
+
+
+def get_boards(seed: int = 0) -> Dict[str, board.Board]:
+    generator = random.Random(seed)
+    boards = {}
+    for name, moves in (("empty", 0), ("mid-game", 24), ("near-full", 45)):
+        board_ = board.Board()
+        player = board.RED
+        for _ in range(moves):
+            column = generator.choice(
+                [
+                    column
+                    for column in range(board_.columns)
+                    if not board_.column_full(column)
+                ]
+            )
+            board_.drop_disk_in_column(column, player)
+            player = board.OPPONENTS[player]
+        boards[name] = board_
+    return boards
+
+
+def get_benchmarks(game_: game.Game) -> Dict[str, Callable[[], object]]:
+    benchmarks = {}
+    for name, board_ in get_boards().items():
+        for function in (
+            board_.four_in_a_row,
+            board_.four_in_a_row_horizontal,
+            board_.four_in_a_row_vertical,
+            board_.four_in_a_row_diagonal_descending,
+            board_.four_in_a_row_diagonal_ascending,
+        ):
+            benchmarks[f"{function.__name__} {name}"] = function
+        column = min(range(board_.columns), key=lambda column: board_.heights[column])
+        benchmarks[f"drop_disk_in_column {name}"] = get_drop(board_, column)
+        benchmarks[f"column_full {name}"] = get_column_full(board_)
+        benchmarks[f"render {name}"] = get_render(game_, board_)
+    benchmarks["get_grid"] = rules.Rules().get_grid
+    return benchmarks
+
+
+def get_drop(board_: board.Board, column: int) -> Callable[[], None]:
+    board_ = board_.copy()
+
+    def drop() -> None:
+        board_.drop_disk_in_column(column, board.RED)
+        board_.undo_drop(column)
+
+    return drop
+
+
+def get_column_full(board_: board.Board) -> Callable[[], None]:
+    def column_full() -> None:
+        for column in range(board_.columns):
+            board_.column_full(column)
+
+    return column_full
+
+
+def get_render(game_: game.Game, board_: board.Board) -> Callable[[], None]:
+    def render() -> None:
+        game_.rules.board = board_
+        game_.redraw_all = True
+        game_.render()
+
+    return render
+
+
+def time_benchmark(
+    function: Callable[[], object], repeat: int, min_time: float
+) -> float:
+    # Calibrate the loop count so each of the repeats runs for about min_time,
+    # then keep the fastest, which is the least disturbed by other processes.
+    timer = timeit.Timer(function)
+    number = 1
+    while True:
+        seconds = timer.timeit(number)
+        if seconds >= min_time / 10:
+            break
+        number *= 10
+    number = max(1, int(number * min_time / seconds))
+    return min(timer.repeat(repeat, number)) / number
+
+
+def run_benchmarks(repeat: int, min_time: float) -> Dict[str, float]:
+    game_ = game.Game(idle=False)
+    return {
+        name: time_benchmark(function, repeat, min_time)
+        for name, function in get_benchmarks(game_).items()
+    }
+
+
+def find_regressions(
+    results: Dict[str, float], baseline: Dict[str, float], threshold: float
+) -> List[Tuple[str, float, float]]:
+    return [
+        (name, baseline[name], seconds)
+        for name, seconds in results.items()
+        if name in baseline and seconds > baseline[name] * (1 + threshold)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time the Connect Four hot paths")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.05,
+        help="seconds each repeat of a benchmark runs for",
+    )
+    parser.add_argument(
+        "--save", metavar="PATH", help="write the results to this JSON baseline"
+    )
+    parser.add_argument(
+        "--compare", metavar="PATH", help="fail if slower than this JSON baseline"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="fraction slower than the baseline that counts as a regression",
+    )
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.repeat, args.min_time)
+    for name, seconds in results.items():
+        print(f"{name:<45} {seconds * 1e6:10.3f} us")
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        regressions = find_regressions(results, baseline, args.threshold)
+        for name, before, after in regressions:
+            print(
+                f"regression: {name} {before * 1e6:.3f} us -> {after * 1e6:.3f} us",
+                file=sys.stderr,
+            )
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
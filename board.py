@@ -0,0 +1,326 @@
+import random
+from typing import Iterable, List, Optional, Tuple
+
+RED = 0
+BLUE = 1
+OPPONENTS = (BLUE, RED)
+
+# Random 64 bit numbers for each board size: one for the empty board, then one
+# per player per bit, then one for each player to move. A position's hash is
+# the empty board's number xored with the numbers of its disks.
+ZOBRIST_KEYS = {}
+
+
+def get_zobrist_keys(
+    columns: int, rows: int
+) -> Tuple[int, List[List[int]], Tuple[int, int]]:
+    keys = ZOBRIST_KEYS.get((columns, rows))
+    if keys is None:
+        generator = random.Random(columns << 8 | rows)
+        bits = columns * (rows + 1)
+        keys = (
+            generator.getrandbits(64) | 1,
+            [[generator.getrandbits(64) for _ in range(bits)] for _ in (RED, BLUE)],
+            (0, generator.getrandbits(64)),
+        )
+        ZOBRIST_KEYS[(columns, rows)] = keys
+    return keys
+
+
+class Board:
+
+    # Each player's disks are one int. Column c occupies bits
+    # c * (rows + 1) to c * (rows + 1) + rows - 1, counted from the bottom of
+    # the column, and the extra bit on top of every column stays empty so
+    # shifted lines can never wrap into the next column.
+
+    def __init__(self, columns: int = 7, rows: int = 7, connect: int = 4):
+        self.columns = columns
+        self.rows = rows
+        self.connect = connect
+        self.column_stride = rows + 1
+        self.cells_mask = sum(
+            ((1 << rows) - 1) << column * self.column_stride
+            for column in range(columns)
+        )
+        self.bottom_mask = sum(
+            1 << column * self.column_stride for column in range(columns)
+        )
+        self.line_shifts = (
+            self.column_stride,
+            1,
+            self.column_stride - 1,
+            self.column_stride + 1,
+        )
+        # A run of n is found by doubling the run length each step, so it costs
+        # log2(n) shifts per direction whatever the board size.
+        self.run_steps = []
+        length = 1
+        while length < connect:
+            step = min(length, connect - length)
+            self.run_steps.append(step)
+            length += step
+        self.run_shifts = [
+            [step * shift for step in self.run_steps] for shift in self.line_shifts
+        ]
+        self.line_offsets = [
+            range(shift, (connect - 1) * shift + 1, shift) for shift in self.line_shifts
+        ]
+        # Where each column's bits land on the board mirrored left to right.
+        self.mirror_shifts = [
+            (columns - 1 - column) * self.column_stride for column in range(columns)
+        ]
+        self.disks = [0, 0]
+        self.heights = [0] * columns
+        self.key = 0
+        self.mirrored_key = 0
+        self.empty_hash, self.zobrist_keys, self.player_hashes = get_zobrist_keys(
+            columns, rows
+        )
+        self.hash = self.mirrored_hash = self.empty_hash
+
+    def clear(self) -> None:
+        self.disks = [0, 0]
+        self.heights = [0] * self.columns
+        self.key = 0
+        self.mirrored_key = 0
+        self.hash = self.mirrored_hash = self.empty_hash
+
+    def copy(self) -> "Board":
+        # Skips __init__: the masks, shifts and Zobrist keys depend only on the
+        # size and are never changed, so the copy shares them.
+        board = Board.__new__(Board)
+        board.__dict__.update(self.__dict__)
+        board.disks = self.disks[:]
+        board.heights = self.heights[:]
+        return board
+
+    def get_key(self) -> int:
+        # Unique for any position reached by dropping disks: adding red's
+        # disks to the occupied cells carries each column into a distinct
+        # pattern, so no separate move counter is needed. Dropping a disk
+        # adds its bit to the occupied cells and, for red, to red's disks, so
+        # the key is kept up to date by each drop and undo.
+        return self.key
+
+    def get_canonical_key(self) -> int:
+        # A position and its mirror image have the same value, so caches keyed
+        # by this hold one entry for both. Columns stored with such an entry
+        # are for the smaller key's side; see get_canonical_column.
+        return min(self.key, self.mirrored_key)
+
+    def get_canonical_hash(self) -> int:
+        # A fixed-size stand-in for get_canonical_key, taken from the same side
+        # of the mirror so stored columns line up with get_canonical_column.
+        if self.mirrored_key < self.key:
+            return self.mirrored_hash
+        return self.hash
+
+    def get_search_hash(self, player: int) -> int:
+        # The disks alone do not say whose turn it is: after a win the loser
+        # opens the next game, so searches key positions by the player too.
+        return self.get_canonical_hash() ^ self.player_hashes[player]
+
+    def is_mirrored(self) -> bool:
+        return self.mirrored_key < self.key
+
+    def get_canonical_column(self, column: int) -> int:
+        # Maps a column between this position and its canonical orientation,
+        # in either direction.
+        if self.mirrored_key < self.key:
+            return self.columns - 1 - column
+        return column
+
+    def update_keys(self) -> None:
+        mirrored = [0, 0]
+        column_mask = (1 << self.column_stride) - 1
+        for column, shift in enumerate(self.mirror_shifts):
+            for player, disks in enumerate(self.disks):
+                column_disks = disks >> column * self.column_stride & column_mask
+                mirrored[player] |= column_disks << shift
+        self.key = self.disks[RED] + (self.disks[RED] | self.disks[BLUE])
+        self.mirrored_key = mirrored[RED] + (mirrored[RED] | mirrored[BLUE])
+        self.hash = self.get_hash(self.disks)
+        self.mirrored_hash = self.get_hash(mirrored)
+
+    def get_hash(self, disks: List[int]) -> int:
+        hash_ = self.empty_hash
+        for keys, player_disks in zip(self.zobrist_keys, disks):
+            while player_disks:
+                lowest = player_disks & -player_disks
+                player_disks ^= lowest
+                hash_ ^= keys[lowest.bit_length() - 1]
+        return hash_
+
+    def get_bit(self, column: int, row: int) -> int:
+        return column * self.column_stride + self.rows - 1 - row
+
+    def get_cell(self, bit: int) -> Tuple[int, int]:
+        column, height = divmod(bit, self.column_stride)
+        return column, self.rows - 1 - height
+
+    def get_disk(self, column: int, row: int) -> Optional[int]:
+        bit = 1 << self.get_bit(column, row)
+        for player, disks in enumerate(self.disks):
+            if disks & bit:
+                return player
+        return None
+
+    def set_disk(self, column: int, row: int, player: Optional[int]) -> None:
+        bit = 1 << self.get_bit(column, row)
+        self.disks = [disks & ~bit for disks in self.disks]
+        if player is not None:
+            self.disks[player] |= bit
+        column_disks = (self.disks[RED] | self.disks[BLUE]) >> (
+            column * self.column_stride
+        )
+        self.heights[column] = (column_disks & ((1 << self.rows) - 1)).bit_length()
+        self.update_keys()
+
+    def column_full(self, column: int) -> bool:
+        return self.heights[column] == self.rows
+
+    def drop_disk_in_column(self, column: int, player: int) -> Tuple[int, int]:
+        height = self.heights[column]
+        index = column * self.column_stride + height
+        mirrored_index = self.mirror_shifts[column] + height
+        bit = 1 << index
+        self.disks[player] |= bit
+        self.heights[column] = height + 1
+        # Red's disks count twice in the key, once as red and once as occupied.
+        self.key += bit << 1 - player
+        self.mirrored_key += 1 << mirrored_index + 1 - player
+        keys = self.zobrist_keys[player]
+        self.hash ^= keys[index]
+        self.mirrored_hash ^= keys[mirrored_index]
+        return column, self.rows - 1 - height
+
+    def undo_drop(self, column: int) -> None:
+        height = self.heights[column] - 1
+        index = column * self.column_stride + height
+        mirrored_index = self.mirror_shifts[column] + height
+        bit = 1 << index
+        red = 1 if self.disks[RED] & bit else 0
+        self.disks[RED] &= ~bit
+        self.disks[BLUE] &= ~bit
+        self.heights[column] = height
+        self.key -= bit << red
+        self.mirrored_key -= 1 << mirrored_index + red
+        keys = self.zobrist_keys[BLUE - red]
+        self.hash ^= keys[index]
+        self.mirrored_hash ^= keys[mirrored_index]
+
+    def board_full(self) -> bool:
+        return all(height == self.rows for height in self.heights)
+
+    def get_playable_cells(self) -> int:
+        return (
+            (self.disks[RED] | self.disks[BLUE]) + self.bottom_mask
+        ) & self.cells_mask
+
+    def get_winning_cells(self, player: int) -> int:
+        disks = self.disks[player]
+        cells = 0
+        for offsets in self.line_offsets:
+            # A cell with k of the player's disks just before it along the
+            # line and the rest just after it completes a line.
+            behind = [-1]
+            for offset in offsets:
+                behind.append(behind[-1] & (disks << offset))
+            ahead = -1
+            for offset in offsets:
+                cells |= behind.pop() & ahead
+                ahead &= disks >> offset
+            cells |= ahead
+        return cells & self.cells_mask & ~(self.disks[RED] | self.disks[BLUE])
+
+    def has_four_in_a_row(self, player: int) -> bool:
+        disks = self.disks[player]
+        for run_shifts in self.run_shifts:
+            lines = disks
+            for shift in run_shifts:
+                lines &= lines >> shift
+            if lines:
+                return True
+        return False
+
+    def four_in_a_row(self) -> Optional[List[Tuple[int, int]]]:
+        for function in [
+            self.four_in_a_row_horizontal,
+            self.four_in_a_row_vertical,
+            self.four_in_a_row_diagonal_descending,
+            self.four_in_a_row_diagonal_ascending,
+        ]:
+            disks = function()
+            if disks is not None:
+                return disks
+        return None
+
+    def four_in_a_row_horizontal(self) -> Optional[List[Tuple[int, int]]]:
+        return self.find_line(self.column_stride)
+
+    def four_in_a_row_vertical(self) -> Optional[List[Tuple[int, int]]]:
+        return self.find_line(1)
+
+    def four_in_a_row_diagonal_descending(self) -> Optional[List[Tuple[int, int]]]:
+        return self.find_line(self.column_stride - 1)
+
+    def four_in_a_row_diagonal_ascending(self) -> Optional[List[Tuple[int, int]]]:
+        return self.find_line(self.column_stride + 1)
+
+    def four_in_a_row_through(
+        self, disk: Tuple[int, int]
+    ) -> Optional[List[Tuple[int, int]]]:
+        bit = self.get_bit(*disk)
+        player = self.get_disk(*disk)
+        if player is None:
+            return None
+        disks = self.disks[player]
+        for shift in self.line_shifts:
+            first = bit
+            while first >= shift and disks >> (first - shift) & 1:
+                first -= shift
+            last = bit
+            while disks >> (last + shift) & 1:
+                last += shift
+            span = (self.connect - 1) * shift
+            if last - first >= span:
+                return self.get_first_line(range(first, last - span + 1, shift), shift)
+        return None
+
+    def find_line(self, shift: int) -> Optional[List[Tuple[int, int]]]:
+        starts = []
+        for disks in self.disks:
+            lines = self.get_line_starts(disks, shift)
+            while lines:
+                lowest = lines & -lines
+                lines ^= lowest
+                starts.append(lowest.bit_length() - 1)
+        return self.get_first_line(starts, shift)
+
+    def get_line_starts(self, disks: int, shift: int) -> int:
+        lines = disks
+        for step in self.run_steps:
+            lines &= lines >> (step * shift)
+        return lines
+
+    def get_first_line(
+        self, starts: Iterable[int], shift: int
+    ) -> Optional[List[Tuple[int, int]]]:
+        lines = [
+            [self.get_cell(start + offset * shift) for offset in range(self.connect)]
+            for start in starts
+        ]
+        if not lines:
+            return None
+        # Report the same line the grid scan found first: topmost, then leftmost.
+        line = min(
+            lines,
+            key=lambda line: (
+                min(row for _, row in line),
+                min(column for column, _ in line),
+            ),
+        )
+        if shift == 1:
+            line.reverse()
+        return line
@@ -0,0 +1,119 @@
+import argparse
+import struct
+import threading
+import time
+from typing import Optional, Tuple
+
+import ai
+import board
+import perft
+import rules
+import solver
+
+# A book file has the solution table's layout with a different magic and
+# entries of an unsigned 8 byte position key, the column to play as a byte and
+# the search score of the position for the player to move as 4 signed bytes.
+MAGIC = b"C4OB\x01"
+ENTRY = struct.Struct("<QBi")
+
+
+class OpeningBook(solver.SolutionTable):
+
+    magic = MAGIC
+    entry = ENTRY
+
+    def get_move(self, board_: board.Board) -> Optional[Tuple[int, int]]:
+        if not self.entries or not self.matches(board_):
+            return None
+        entry = self.find(board_.get_canonical_key())
+        if entry is None:
+            return None
+        return board_.get_canonical_column(entry[1]), entry[2]
+
+
+class BookPlayer:
+
+    def __init__(self, book: OpeningBook, fallback: ai.Player):
+        self.player = fallback.player
+        self.book = book
+        self.fallback = fallback
+        self.book_moves = 0
+
+    def choose_column(self, game_rules: rules.Rules) -> int:
+        return self.search(game_rules.board, game_rules.current_player)
+
+    def search(
+        self,
+        board_: board.Board,
+        player: int,
+        cancelled: Optional[threading.Event] = None,
+    ) -> Optional[int]:
+        # The book is built with red moving first, but after a win the loser
+        # opens, and then the book's moves are for the other side.
+        move = None
+        if player == solver.get_player(board_):
+            move = self.book.get_move(board_)
+        if move is not None:
+            self.book_moves += 1
+            return move[0]
+        return self.fallback.search(board_, player, cancelled)
+
+
+def build_book(book: OpeningBook, board_: board.Board, plies: int, depth: int) -> int:
+    # Searches every position up to plies moves on that still has a move to
+    # make, so the returned count excludes won and full positions.
+    # Each position's player follows from its parity, so one searcher per side
+    # can keep its table between related positions.
+    computer_players = [
+        ai.ComputerPlayer(player, depth=depth) for player in (board.RED, board.BLUE)
+    ]
+    moves = {}
+    for position in solver.get_positions(board_, plies):
+        player = solver.get_player(position)
+        if position.board_full() or position.has_four_in_a_row(board.OPPONENTS[player]):
+            continue
+        computer_player = computer_players[player]
+        column = computer_player.search(position, player)
+        moves[solver.get_table_key(position)] = (
+            position.get_canonical_column(column),
+            computer_player.best_score,
+        )
+    book.write(board_, moves)
+    return len(moves)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build a Connect Four opening book")
+    parser.add_argument("path", help="book file to create or add to")
+    parser.add_argument(
+        "--plies",
+        type=int,
+        default=4,
+        help="add every position up to this many moves from the start",
+    )
+    parser.add_argument(
+        "--depth", type=int, default=8, help="how deep to search each position"
+    )
+    parser.add_argument("--columns", type=int, default=7)
+    parser.add_argument("--rows", type=int, default=7)
+    parser.add_argument("--connect", type=int, default=4)
+    parser.add_argument(
+        "--moves",
+        default="",
+        help="columns played to reach the starting position, as digits",
+    )
+    args = parser.parse_args()
+
+    board_, _ = perft.get_position(
+        args.columns, args.rows, args.connect, [int(column) for column in args.moves]
+    )
+    start = time.perf_counter()
+    with OpeningBook(args.path) as book:
+        added = build_book(book, board_, args.plies, args.depth)
+        print(f"searched: {added} positions")
+        print(f"book:     {len(book)} positions")
+    print(f"seconds:  {time.perf_counter() - start:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,221 +1,466 @@
+import argparse
 import sys
-import itertools
-from typing import Optional, List
+import time
+from typing import Iterable, Optional, Tuple
 
 import pygame
 
+import ai
+import board
+import book
 import inputmanager
+import mcts
+import profiler
+import records
+import rules
+import textcache
 
 
 class Game:
 
-    def __init__(self):
+    def __init__(
+        self,
+        idle: bool = True,
+        computer_players: Iterable[ai.Player] = (),
+        columns: int = 7,
+        rows: int = 7,
+        connect: int = 4,
+        recorder: Optional[records.GameWriter] = None,
+    ):
         pygame.init()
         self.fps_clock = pygame.time.Clock()
         self.fps = 30
+        self.idle = idle
+        self.idle_timeout = 0
         window_size = (640, 480)
         self.displaysurf = pygame.display.set_mode(window_size)
-        self.cell_size = (64, 64)
-        self.rect_locations = (16, 80, 144, 208, 272, 336, 400)
-        self.grid = []
+        # The grid is fitted into the same 448 pixel square whatever its size.
+        grid_origin = (16, 16)
+        grid_size = 448
+        cell_length = min(grid_size // columns, grid_size // rows)
+        self.cell_size = (cell_length, cell_length)
+        self.column_locations = tuple(
+            grid_origin[0] + column * cell_length for column in range(columns)
+        )
+        self.row_locations = tuple(
+            grid_origin[1] + row * cell_length for row in range(rows)
+        )
+        self.rules = rules.Rules(columns=columns, rows=rows, connect=connect)
+        self.cell_rects = [
+            [pygame.Rect((x, y), self.cell_size) for y in self.row_locations]
+            for x in self.column_locations
+        ]
         self.black = (0, 0, 0)
         self.blue = (0, 0, 255)
         self.red = (255, 0, 0)
         self.green = (0, 255, 0)
         self.yellow = (255, 255, 0)
         self.column_rects = [
-            pygame.Rect(16, 16, 64, 448),
-            pygame.Rect(80, 16, 64, 448),
-            pygame.Rect(144, 16, 64, 448),
-            pygame.Rect(208, 16, 64, 448),
-            pygame.Rect(272, 16, 64, 448),
-            pygame.Rect(336, 16, 64, 448),
-            pygame.Rect(400, 16, 64, 448),
+            pygame.Rect(x, grid_origin[1], cell_length, rows * cell_length)
+            for x in self.column_locations
         ]
         self.refresh_button_rect = pygame.Rect(480, 16, 128, 64)
+        self.undo_button_rect = pygame.Rect(480, 88, 60, 40)
+        self.redo_button_rect = pygame.Rect(548, 88, 60, 40)
+        self.move_buttons = (
+            (self.undo_button_rect, "Undo"),
+            (self.redo_button_rect, "Redo"),
+        )
         self.red_score_rect = pygame.Rect(480, 144, 64, 64)
         self.blue_score_rect = pygame.Rect(544, 144, 64, 64)
+        self.profiler_rect = pygame.Rect(480, 224, 144, 72)
         self.rect_to_highlight = None
-        self.current_players_disk_color = self.red
-        self.red_score = 0
-        self.blue_score = 0
-        self.game_over = False
+        self.input_manager = inputmanager.InputManager()
+        self.computer_players = {
+            computer_player.player: computer_player
+            for computer_player in computer_players
+        }
+        self.recorder = recorder
+        self.input_recording_path = None
+        self.profiler = None
+        self.search = None
+        self.search_done_event = pygame.event.custom_type()
+        self.disk_colors = {board.RED: self.red, board.BLUE: self.blue}
+        self.text_cache = textcache.TextCache()
+        self.disk_sprites = {
+            color: self.get_disk_sprite(color)
+            for color in (self.black, self.red, self.blue, self.green)
+        }
+        self.background = self.get_background()
+        self.highlight_layers = {}
+        self.redraw_all = True
+        self.dirty_rects = []
+        self.drawn_highlight = None
+        self.drawn_board_state = None
+        self.drawn_scores = None
+        self.drawn_disk_colors = [
+            [None] * len(column_cell_rects) for column_cell_rects in self.cell_rects
+        ]
         pygame.display.set_caption("Connect Four")
 
     def main(self) -> None:
         self.get_grid()
+        if self.profiler is None:
+            run_frame = self.run_frame
+        else:
+            run_frame = self.run_profiled_frame
         while True:
-            self.get_input()
-            self.handle_input()
-            self.render()
-            self.fps_clock.tick(self.fps)
+            run_frame()
+
+    def run_frame(self) -> None:
+        self.get_input()
+        self.handle_input()
+        self.render()
+        self.fps_clock.tick(self.fps)
+
+    def run_profiled_frame(self) -> None:
+        # A quit inside handle_input never returns, so each phase is added
+        # as soon as it is done and only whole frames are counted.
+        frame_profiler = self.profiler
+        timer = time.perf_counter
+        start = timer()
+        self.get_input()
+        input_done = timer()
+        frame_profiler.add("get_input", input_done - start)
+        self.handle_input()
+        update_done = timer()
+        frame_profiler.add("handle_input", update_done - input_done)
+        self.render()
+        render_done = timer()
+        frame_profiler.add("render", render_done - update_done)
+        self.fps_clock.tick(self.fps)
+        end = timer()
+        frame_profiler.add("tick", end - render_done)
+        frame_profiler.end_frame(render_done - start, end - start)
+
+    def enable_profiling(
+        self, overlay: bool = False, dump_path: Optional[str] = None
+    ) -> None:
+        # The draw methods are only wrapped here, so an unprofiled game runs
+        # exactly the code it did before.
+        self.profiler = profiler.FrameProfiler(
+            self.fps, dump_path=dump_path, overlay=overlay
+        )
+        for phase in ("get_input", "handle_input", "render", "tick"):
+            self.profiler.get_samples(phase)
+        for name in dir(self):
+            if name.startswith("draw_"):
+                setattr(self, name, self.profiler.timed(name, getattr(self, name)))
+
+    def record_input(self, path: str) -> None:
+        self.input_recording_path = path
+        self.input_manager.start_recording()
+
+    def replay_input(self, path: str) -> None:
+        # Profile against the normal frame budget before uncapping the clock.
+        if self.profiler is None:
+            self.enable_profiling()
+        self.input_manager.load_replay(path)
+        self.idle = False
+        self.fps = 0
+
+    def report_timings(self) -> None:
+        print("\n".join(self.profiler.get_report()))
+        if self.profiler.dump_path is not None:
+            self.profiler.dump()
+
+    @property
+    def current_players_disk_color(self) -> Tuple[int, int, int]:
+        return self.disk_colors[self.rules.current_player]
 
     def get_grid(self) -> None:
-        self.grid = []
-        for column, x in enumerate(self.rect_locations):
-            self.grid.append([])
-            for y in self.rect_locations:
-                self.grid[column].append(
-                    {"color": self.black, "rect": pygame.Rect((x, y), self.cell_size)}
-                )
+        self.cancel_search()
+        if self.recorder is not None and self.recorder.in_game:
+            self.recorder.end_game()
+        self.rules.get_grid()
 
     def get_input(self) -> None:
-        inputmanager.InputManager.get_events()
-        inputmanager.InputManager.check_for_quit_event()
-        inputmanager.InputManager.update_keyboard_key_state()
-        inputmanager.InputManager.get_keyboard_input()
-        inputmanager.InputManager.update_mouse_button_state()
-        inputmanager.InputManager.get_mouse_input()
+        if self.idle and not (self.computer_to_move() and self.search is None):
+            self.input_manager.wait_for_events(self.idle_timeout)
+        else:
+            self.input_manager.get_events()
+        self.input_manager.dispatch_events()
+        if self.input_manager.exposed:
+            self.redraw_all = True
 
     def handle_input(self) -> None:
-        if inputmanager.InputManager.quit:
+        if self.input_manager.quit:
             self.terminate()
         self.rect_to_highlight = None
-        for column_rect, column in zip(self.column_rects, self.grid):
-            if column_rect.collidepoint(inputmanager.InputManager.cursor_location):
+        for column, column_rect in enumerate(self.column_rects):
+            if column_rect.collidepoint(self.input_manager.cursor_location):
                 if (
-                    inputmanager.InputManager.mouse[1]
-                    == inputmanager.InputManager.pressed
-                    and not self.game_over
+                    self.input_manager.mouse.get(1) == self.input_manager.pressed
+                    and not self.rules.game_over
+                    and not self.computer_to_move()
                 ):
-                    if not self.column_full(column):
-                        self.drop_disk_in_column(column)
-                        disks = self.four_in_a_row()
-                        if disks is not None:
-                            self.color_disks_green(disks)
-                            self.increment_score()
-                            self.game_over = True
-                        self.swap_current_players_disk_color()
+                    if not self.rules.column_full(column):
+                        self.play_column(column)
                 self.rect_to_highlight = column_rect
                 break
         else:
-            if self.refresh_button_rect.collidepoint(
-                inputmanager.InputManager.cursor_location
+            for button_rect, action in (
+                (self.refresh_button_rect, self.get_grid),
+                (self.undo_button_rect, self.take_back_move),
+                (self.redo_button_rect, self.redo_move),
             ):
-                if (
-                    inputmanager.InputManager.mouse[1]
-                    == inputmanager.InputManager.pressed
-                ):
-                    self.get_grid()
-                    self.game_over = False
-                self.rect_to_highlight = self.refresh_button_rect
+                if button_rect.collidepoint(self.input_manager.cursor_location):
+                    if self.input_manager.mouse.get(1) == self.input_manager.pressed:
+                        action()
+                    self.rect_to_highlight = button_rect
+                    break
+        if self.computer_to_move():
+            self.play_computer_move()
+
+    def play_computer_move(self) -> None:
+        if self.search is None:
+            self.search = ai.BackgroundSearch(
+                self.computer_players[self.rules.current_player],
+                self.rules,
+                on_done=self.post_search_done_event,
+            )
+            self.search.start()
+        elif self.search.done():
+            column = self.search.column
+            self.search = None
+            if column is None:
+                # The search failed, so play the first open column.
+                column = next(
+                    column
+                    for column in range(self.rules.board.columns)
+                    if not self.rules.column_full(column)
+                )
+            self.play_column(column)
+
+    def play_column(self, column: int) -> None:
+        self.record_move(column)
+        self.rules.play_column(column)
+        self.record_game_end()
+
+    def take_back_move(self) -> None:
+        # Against the computer, take back its reply too so it is the human's
+        # turn again.
+        self.cancel_search()
+        while self.rules.undo_move() is not None:
+            if self.recorder is not None and self.recorder.in_game:
+                self.recorder.take_back_move()
+            if not self.computer_to_move() or len(self.computer_players) > 1:
+                break
+
+    def redo_move(self) -> None:
+        self.cancel_search()
+        while self.rules.undone_moves:
+            self.record_move(self.rules.undone_moves[-1])
+            self.rules.redo_move()
+            self.record_game_end()
+            if not self.computer_to_move() or len(self.computer_players) > 1:
+                break
+
+    def record_move(self, column: int) -> None:
+        if self.recorder is None:
+            return
+        if not self.recorder.in_game:
+            # A game played on after taking back its last move is recorded
+            # again from the start.
+            board_ = self.rules.board
+            first_player = self.rules.current_player
+            if len(self.rules.moves) % 2:
+                first_player = board.OPPONENTS[first_player]
+            self.recorder.start_game(
+                board_.columns,
+                board_.rows,
+                board_.connect,
+                self.get_player_name(board.RED),
+                self.get_player_name(board.BLUE),
+                first_player,
+            )
+            for earlier_column, _ in self.rules.moves:
+                self.recorder.write_move(earlier_column)
+        self.recorder.write_move(column)
+
+    def record_game_end(self) -> None:
+        if self.recorder is not None and (
+            self.rules.game_over or self.rules.board_full()
+        ):
+            self.recorder.end_game()
+
+    def get_player_name(self, player: int) -> str:
+        computer_player = self.computer_players.get(player)
+        if computer_player is None:
+            return "human"
+        return type(computer_player).__name__
+
+    def post_search_done_event(self) -> None:
+        pygame.event.post(pygame.event.Event(self.search_done_event))
+
+    def cancel_search(self) -> None:
+        if self.search is not None:
+            self.search.cancel()
+            self.search = None
+
+    def computer_to_move(self) -> bool:
+        return (
+            self.rules.current_player in self.computer_players
+            and not self.rules.game_over
+            and not self.rules.board_full()
+        )
 
     def terminate(self) -> None:
+        self.cancel_search()
+        if self.recorder is not None:
+            self.recorder.close()
+        if self.input_recording_path is not None:
+            self.input_manager.save_recording(self.input_recording_path)
+        if self.profiler is not None and self.profiler.frames:
+            self.report_timings()
         pygame.quit()
         sys.exit()
 
-    def column_full(self, column: List) -> bool:
-        for disk in column:
-            if disk["color"] == self.black:
-                return False
-        return True
+    def get_disk_color(self, column: int, row: int) -> Tuple[int, int, int]:
+        if (column, row) in self.rules.winning_disks:
+            return self.green
+        player = self.rules.board.get_disk(column, row)
+        if player is None:
+            return self.black
+        return self.disk_colors[player]
 
-    def drop_disk_in_column(self, column: List) -> None:
-        for disk in reversed(column):
-            if disk["color"] == self.black:
-                disk["color"] = self.current_players_disk_color
-                break
+    def get_disk_sprite(self, color: Tuple[int, int, int]) -> pygame.Surface:
+        sprite = pygame.Surface(self.cell_size, pygame.SRCALPHA)
+        pygame.draw.ellipse(sprite, color, sprite.get_rect())
+        return sprite.convert_alpha()
 
-    def four_in_a_row(self) -> Optional[List]:
-        for function in [
-            self.four_in_a_row_horizontal,
-            self.four_in_a_row_vertical,
-            self.four_in_a_row_diagonal_descending,
-            self.four_in_a_row_diagonal_ascending,
-        ]:
-            disks = function()
-            if disks is not None:
-                return disks
-        return None
-
-    def four_in_a_row_horizontal(self) -> Optional[List]:
-        for row in range(len(self.grid)):
-            disks = []
-            for column in self.grid:
-                disks.append(column[row])
-                if (
-                    disks[-1]["color"] == self.black
-                    or len(disks) >= 2
-                    and disks[-1]["color"] != disks[-2]["color"]
-                ):
-                    disks = [column[row]]
-                if len(disks) == 4:
-                    return disks
-        return None
-
-    def four_in_a_row_vertical(self) -> Optional[List]:
-        for row, column in itertools.product(range(4), self.grid):
-            disks = column[row : 4 + row]
-            disk_colors = {disk["color"] for disk in disks}
-            if len(disk_colors) == 1 and self.black not in disk_colors:
-                return disks
-        return None
-
-    def four_in_a_row_diagonal_descending(self) -> Optional[List]:
-        disks = []
-        for x, y in itertools.product(range(4), range(4)):
-            for column, row in zip(
-                self.grid[0 + y : 4 + y], itertools.cycle(range(0 + x, 4 + x))
-            ):
-                disks.append(column[row])
-                if len(disks) == 4:
-                    disk_colors = {disk["color"] for disk in disks}
-                    if self.black not in disk_colors and len(disk_colors) == 1:
-                        return disks
-                    disks = []
-        return None
-
-    def four_in_a_row_diagonal_ascending(self) -> Optional[List]:
-        disks = []
-        for x, y in itertools.product(range(4), range(4)):
-            for column, row in zip(
-                self.grid[0 + y : 4 + y], itertools.cycle(reversed(range(0 + x, 4 + x)))
-            ):
-                disks.append(column[row])
-                if len(disks) == 4:
-                    disk_colors = {disk["color"] for disk in disks}
-                    if self.black not in disk_colors and len(disk_colors) == 1:
-                        return disks
-                    disks = []
-        return None
-
-    def color_disks_green(self, disks: List) -> None:
-        for disk in disks:
-            disk["color"] = self.green
-
-    def increment_score(self) -> None:
-        if self.current_players_disk_color == self.red:
-            self.red_score += 1
-        else:
-            self.blue_score += 1
+    def get_background(self) -> pygame.Surface:
+        background = pygame.Surface(self.displaysurf.get_size())
+        self.draw_grid(background)
+        self.draw_refresh_button_rect(background)
+        self.draw_refresh_button_text(background)
+        self.draw_move_buttons(background)
+        for column_cell_rects in self.cell_rects:
+            for cell_rect in column_cell_rects:
+                background.blit(self.disk_sprites[self.black], cell_rect)
+        return background.convert()
 
-    def swap_current_players_disk_color(self) -> None:
-        if self.current_players_disk_color == self.red:
-            self.current_players_disk_color = self.blue
-        else:
-            self.current_players_disk_color = self.red
+    def get_highlight_layer(
+        self, rect: pygame.Rect, color: Tuple[int, int, int]
+    ) -> pygame.Surface:
+        key = (tuple(rect), color)
+        layer = self.highlight_layers.get(key)
+        if layer is None:
+            layer = pygame.Surface(rect.size)
+            layer.fill(color)
+            if rect == self.refresh_button_rect:
+                self.draw_refresh_button_text(layer, rect.topleft)
+            elif rect in (self.undo_button_rect, self.redo_button_rect):
+                for button_rect, label in self.move_buttons:
+                    if button_rect == rect:
+                        self.draw_button_text(layer, rect, label, rect.topleft)
+            else:
+                for cell_rect in self.cell_rects[self.column_rects.index(rect)]:
+                    layer.blit(
+                        self.disk_sprites[self.black], cell_rect.move(-rect.x, -rect.y)
+                    )
+            layer = layer.convert()
+            self.highlight_layers[key] = layer
+        return layer
 
     def render(self) -> None:
-        self.draw_grid()
-        self.draw_refresh_button_rect()
-        self.draw_score()
+        redraw_all = self.redraw_all
+        highlight = None
         if self.rect_to_highlight is not None:
-            self.highlight_rect(self.rect_to_highlight)
-        self.draw_refresh_button_text()
-        self.draw_disks()
-        pygame.display.update()
+            highlight = (self.rect_to_highlight, self.current_players_disk_color)
+        board_state = (tuple(self.rules.board.disks), tuple(self.rules.winning_disks))
+        scores = (self.rules.red_score, self.rules.blue_score)
+        self.dirty_rects = []
+        if self.redraw_all:
+            self.displaysurf.blit(self.background, (0, 0))
+            self.draw_score()
+            if self.rect_to_highlight is not None:
+                self.highlight_rect(self.rect_to_highlight)
+            self.draw_disks()
+            self.dirty_rects.append(self.displaysurf.get_rect())
+            self.redraw_all = False
+        else:
+            if highlight != self.drawn_highlight:
+                for drawn in (self.drawn_highlight, highlight):
+                    if drawn is not None:
+                        self.draw_region(drawn[0])
+            if board_state != self.drawn_board_state:
+                self.draw_changed_disks()
+            if scores != self.drawn_scores:
+                self.draw_score()
+                self.dirty_rects.extend((self.red_score_rect, self.blue_score_rect))
+        self.drawn_highlight = highlight
+        self.drawn_board_state = board_state
+        self.drawn_scores = scores
+        if self.profiler is not None and self.profiler.overlay:
+            if redraw_all or not self.profiler.frames % 30:
+                self.draw_profiler_overlay()
+        if self.dirty_rects:
+            pygame.display.update(self.dirty_rects)
 
-    def draw_grid(self) -> None:
+    def draw_region(self, rect: pygame.Rect) -> None:
+        if rect == self.rect_to_highlight:
+            self.highlight_rect(rect)
+        else:
+            self.displaysurf.blit(self.background, rect, rect)
+        if rect in self.column_rects:
+            column = self.column_rects.index(rect)
+            for row in range(len(self.cell_rects[column])):
+                self.draw_disk(column, row)
+        self.dirty_rects.append(rect)
+
+    def draw_changed_disks(self) -> None:
+        for column, column_cell_rects in enumerate(self.cell_rects):
+            for row, cell_rect in enumerate(column_cell_rects):
+                if (
+                    self.get_disk_color(column, row)
+                    != self.drawn_disk_colors[column][row]
+                ):
+                    self.draw_cell_background(column, row)
+                    self.draw_disk(column, row)
+                    self.dirty_rects.append(cell_rect)
+
+    def draw_cell_background(self, column: int, row: int) -> None:
+        column_rect = self.column_rects[column]
+        cell_rect = self.cell_rects[column][row]
+        if column_rect == self.rect_to_highlight:
+            layer = self.get_highlight_layer(
+                column_rect, self.current_players_disk_color
+            )
+            self.displaysurf.blit(
+                layer, cell_rect, cell_rect.move(-column_rect.x, -column_rect.y)
+            )
+        else:
+            self.displaysurf.blit(self.background, cell_rect, cell_rect)
+
+    def draw_grid(self, surface: pygame.Surface) -> None:
         for coulmn_rect in self.column_rects:
-            pygame.draw.rect(self.displaysurf, self.yellow, coulmn_rect)
+            pygame.draw.rect(surface, self.yellow, coulmn_rect)
+
+    def draw_refresh_button_rect(self, surface: pygame.Surface) -> None:
+        pygame.draw.rect(surface, self.yellow, self.refresh_button_rect)
 
-    def draw_refresh_button_rect(self) -> None:
-        pygame.draw.rect(self.displaysurf, self.yellow, self.refresh_button_rect)
+    def draw_move_buttons(self, surface: pygame.Surface) -> None:
+        for button_rect, label in self.move_buttons:
+            pygame.draw.rect(surface, self.yellow, button_rect)
+            self.draw_button_text(surface, button_rect, label)
+
+    def draw_button_text(
+        self,
+        surface: pygame.Surface,
+        rect: pygame.Rect,
+        label: str,
+        origin: Tuple[int, int] = (0, 0),
+    ) -> None:
+        text = self.text_cache.render(label, self.black)
+        text_rect = text.get_rect(center=rect.center)
+        surface.blit(text, text_rect.move(-origin[0], -origin[1]))
 
     def draw_score(self) -> None:
-        font = pygame.font.Font(None, 24)
-        red_score_text = font.render(str(self.red_score), True, self.yellow)
-        blue_score_text = font.render(str(self.blue_score), True, self.yellow)
+        red_score_text = self.text_cache.render(str(self.rules.red_score), self.yellow)
+        blue_score_text = self.text_cache.render(
+            str(self.rules.blue_score), self.yellow
+        )
         pygame.draw.rect(self.displaysurf, self.red, self.red_score_rect)
         pygame.draw.rect(self.displaysurf, self.blue, self.blue_score_rect)
         self.displaysurf.blit(
@@ -237,27 +482,152 @@ class Game:
             ),
         )
 
-    def highlight_rect(self, rect: pygame.Rect) -> None:
-        pygame.draw.rect(self.displaysurf, self.current_players_disk_color, rect)
+    def draw_profiler_overlay(self) -> None:
+        self.displaysurf.blit(self.background, self.profiler_rect, self.profiler_rect)
+        for line_number, line in enumerate(self.profiler.get_summary()):
+            text = self.text_cache.render(line, self.yellow, size=18)
+            self.displaysurf.blit(
+                text, (self.profiler_rect.x, self.profiler_rect.y + line_number * 18)
+            )
+        self.dirty_rects.append(self.profiler_rect)
 
-    def draw_refresh_button_text(self) -> None:
-        font = pygame.font.Font(None, 24)
-        text = font.render("Refresh", True, self.black)
+    def highlight_rect(self, rect: pygame.Rect) -> None:
         self.displaysurf.blit(
+            self.get_highlight_layer(rect, self.current_players_disk_color), rect
+        )
+
+    def draw_refresh_button_text(
+        self, surface: pygame.Surface, origin: Tuple[int, int] = (0, 0)
+    ) -> None:
+        text = self.text_cache.render("Refresh", self.black)
+        surface.blit(
             text,
             (
                 self.refresh_button_rect.centerx
-                - self.refresh_button_rect.centerx / self.refresh_button_rect.y,
+                - self.refresh_button_rect.centerx / self.refresh_button_rect.y
+                - origin[0],
                 self.refresh_button_rect.centery
-                - self.refresh_button_rect.centery / self.refresh_button_rect.x,
+                - self.refresh_button_rect.centery / self.refresh_button_rect.x
+                - origin[1],
             ),
         )
 
     def draw_disks(self) -> None:
-        for column in self.grid:
-            for disk in column:
-                pygame.draw.ellipse(self.displaysurf, disk["color"], disk["rect"])
+        for column, column_cell_rects in enumerate(self.cell_rects):
+            for row in range(len(column_cell_rects)):
+                self.draw_disk(column, row)
+
+    def draw_disk(self, column: int, row: int) -> None:
+        color = self.get_disk_color(column, row)
+        if color != self.black:
+            self.displaysurf.blit(
+                self.disk_sprites[color], self.cell_rects[column][row]
+            )
+        self.drawn_disk_colors[column][row] = color
 
 
 if __name__ == "__main__":
-    Game().main()
+    parser = argparse.ArgumentParser(description="Connect Four")
+    parser.add_argument(
+        "--computer",
+        choices=("red", "blue"),
+        action="append",
+        default=[],
+        help="let the computer play this color (may be given twice)",
+    )
+    parser.add_argument(
+        "--strategy",
+        choices=("alphabeta", "mcts"),
+        default="alphabeta",
+        help="how the computer picks its moves",
+    )
+    parser.add_argument(
+        "--depth",
+        type=int,
+        default=6,
+        help="the deepest the computer searches, in plies",
+    )
+    parser.add_argument(
+        "--think-time",
+        type=float,
+        default=None,
+        help="seconds the computer may think per move",
+    )
+    parser.add_argument(
+        "--book",
+        metavar="PATH",
+        help="play moves from this opening book before searching",
+    )
+    parser.add_argument("--columns", type=int, default=7)
+    parser.add_argument("--rows", type=int, default=7)
+    parser.add_argument(
+        "--connect",
+        type=int,
+        default=4,
+        help="how many disks in a row win",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="PATH",
+        help="append every game played to this archive",
+    )
+    parser.add_argument(
+        "--record-input",
+        metavar="PATH",
+        help="save every frame's input events to this file on exit",
+    )
+    parser.add_argument(
+        "--replay-input",
+        metavar="PATH",
+        help="play back recorded input with the frame rate uncapped and"
+        " report frame timings",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="time each frame phase and draw call and report them on exit",
+    )
+    parser.add_argument(
+        "--profile-overlay",
+        action="store_true",
+        help="show frame time percentiles while playing",
+    )
+    parser.add_argument(
+        "--profile-dump",
+        metavar="PATH",
+        help="append a timing report to this file every 300 frames",
+    )
+    args = parser.parse_args()
+    players = {"red": board.RED, "blue": board.BLUE}
+    if args.strategy == "mcts":
+        computer_players = [
+            mcts.MonteCarloPlayer(players[color], time_budget=args.think_time or 1.0)
+            for color in args.computer
+        ]
+    else:
+        computer_players = [
+            ai.ComputerPlayer(
+                players[color], depth=args.depth, time_budget=args.think_time
+            )
+            for color in args.computer
+        ]
+    if args.book:
+        opening_book = book.OpeningBook(args.book)
+        computer_players = [
+            book.BookPlayer(opening_book, computer_player)
+            for computer_player in computer_players
+        ]
+    game = Game(
+        computer_players=computer_players,
+        columns=args.columns,
+        rows=args.rows,
+        connect=args.connect,
+        recorder=records.GameWriter(args.record) if args.record else None,
+    )
+    if args.profile or args.profile_overlay or args.profile_dump:
+        game.enable_profiling(overlay=args.profile_overlay, dump_path=args.profile_dump)
+    if args.record_input:
+        game.record_input(args.record_input)
+    if args.replay_input:
+        game.replay_input(args.replay_input)
+    game.main()
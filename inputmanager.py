@@ -1,62 +1,147 @@
-import collections
+import json
 
 import pygame
 
 
 class InputManager:
 
-    keyboard = collections.defaultdict(lambda: None)
-    mouse = collections.defaultdict(lambda: None)
-    cursor_location = None
-    quit = False
-    events = []
+    __slots__ = (
+        'keyboard',
+        'mouse',
+        'cursor_location',
+        'quit',
+        'exposed',
+        'events',
+        'changed_keys',
+        'changed_buttons',
+        'handlers',
+        'recorded_frames',
+        'replay_frames',
+    )
     pressed = 'pressed'
     held = 'held'
     released = 'released'
 
-    @classmethod
-    def get_events(cls) -> None:
-        cls.events = pygame.event.get()
-
-    @classmethod
-    def check_for_quit_event(cls) -> None:
-        for event in cls.events:
-            if event.type == pygame.QUIT:
-                cls.quit = True
-                break
-
-    @classmethod
-    def update_keyboard_key_state(cls) -> None:
-        for key, state in cls.keyboard.items():
-            if state == cls.pressed:
-                cls.keyboard[key] = cls.held
-            elif state == cls.released:
-                cls.keyboard[key] = None
-
-    @classmethod
-    def get_keyboard_input(cls) -> None:
-        for event in cls.events:
-            if event.type == pygame.KEYDOWN:
-                if cls.keyboard[event.key] is None:
-                    cls.keyboard[event.key] = cls.pressed
-            elif event.type == pygame.KEYUP:
-                cls.keyboard[event.key] = cls.released
-
-    @classmethod
-    def update_mouse_button_state(cls) -> None:
-        for button, state in cls.mouse.items():
-            if state == cls.pressed:
-                cls.mouse[button] = cls.held
-            elif state == cls.released:
-                cls.mouse[button] = None
-
-    @classmethod
-    def get_mouse_input(cls) -> None:
-        for event in cls.events:
-            if event.type == pygame.MOUSEMOTION:
-                cls.cursor_location = event.pos
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if cls.mouse[event.button] is None:
-                    cls.mouse[event.button] = cls.pressed
-            elif event.type == pygame.MOUSEBUTTONUP:
-                cls.mouse[event.button] = cls.released
+    def __init__(self):
+        self.keyboard = {}
+        self.mouse = {}
+        self.cursor_location = (-1, -1)
+        self.quit = False
+        self.exposed = False
+        self.events = []
+        self.changed_keys = set()
+        self.changed_buttons = set()
+        self.handlers = {
+            pygame.QUIT: self.handle_quit,
+            pygame.VIDEOEXPOSE: self.handle_expose,
+            pygame.WINDOWEXPOSED: self.handle_expose,
+            pygame.KEYDOWN: self.handle_key_down,
+            pygame.KEYUP: self.handle_key_up,
+            pygame.MOUSEMOTION: self.handle_mouse_motion,
+            pygame.MOUSEBUTTONDOWN: self.handle_mouse_button_down,
+            pygame.MOUSEBUTTONUP: self.handle_mouse_button_up,
+        }
+        self.recorded_frames = None
+        self.replay_frames = None
+
+    def get_events(self) -> None:
+        if self.replay_frames is not None:
+            self.replay_frame()
+            return
+        self.events = pygame.event.get()
+        self.record_frame()
+
+    def wait_for_events(self, timeout: int = 0) -> None:
+        if self.replay_frames is not None:
+            self.replay_frame()
+            return
+        event = pygame.event.wait(timeout)
+        if event.type == pygame.NOEVENT:
+            self.events = []
+        else:
+            self.events = [event] + pygame.event.get()
+        self.record_frame()
+
+    def start_recording(self) -> None:
+        self.recorded_frames = []
+
+    def record_frame(self) -> None:
+        if self.recorded_frames is not None:
+            self.recorded_frames.append(
+                [[event.type, event.dict] for event in self.events]
+            )
+
+    def save_recording(self, path: str) -> None:
+        with open(path, 'w') as file:
+            json.dump(self.recorded_frames, file, default=list)
+
+    def load_replay(self, path: str) -> None:
+        with open(path) as file:
+            frames = json.load(file)
+        self.replay_frames = iter(
+            [
+                pygame.event.Event(event_type, self.get_event_attributes(attributes))
+                for event_type, attributes in frame
+            ]
+            for frame in frames
+        )
+
+    def get_event_attributes(self, attributes: dict) -> dict:
+        return {
+            name: tuple(value) if isinstance(value, list) else value
+            for name, value in attributes.items()
+        }
+
+    def replay_frame(self) -> None:
+        # Live events are dropped so the replay alone drives the frame, and
+        # the end of the recording quits like closing the window.
+        pygame.event.clear()
+        events = next(self.replay_frames, None)
+        if events is None:
+            events = [pygame.event.Event(pygame.QUIT)]
+        self.events = events
+
+    def dispatch_events(self) -> None:
+        self.update_state(self.keyboard, self.changed_keys)
+        self.update_state(self.mouse, self.changed_buttons)
+        self.exposed = False
+        handlers = self.handlers
+        for event in self.events:
+            handler = handlers.get(event.type)
+            if handler is not None:
+                handler(event)
+
+    def update_state(self, states: dict, changed: set) -> None:
+        for key in changed:
+            if states[key] == self.pressed:
+                states[key] = self.held
+            elif states[key] == self.released:
+                del states[key]
+        changed.clear()
+
+    def handle_quit(self, event: pygame.event.Event) -> None:
+        self.quit = True
+
+    def handle_expose(self, event: pygame.event.Event) -> None:
+        self.exposed = True
+
+    def handle_key_down(self, event: pygame.event.Event) -> None:
+        if event.key not in self.keyboard:
+            self.keyboard[event.key] = self.pressed
+            self.changed_keys.add(event.key)
+
+    def handle_key_up(self, event: pygame.event.Event) -> None:
+        self.keyboard[event.key] = self.released
+        self.changed_keys.add(event.key)
+
+    def handle_mouse_motion(self, event: pygame.event.Event) -> None:
+        self.cursor_location = event.pos
+
+    def handle_mouse_button_down(self, event: pygame.event.Event) -> None:
+        if event.button not in self.mouse:
+            self.mouse[event.button] = self.pressed
+            self.changed_buttons.add(event.button)
+
+    def handle_mouse_button_up(self, event: pygame.event.Event) -> None:
+        self.mouse[event.button] = self.released
+        self.changed_buttons.add(event.button)
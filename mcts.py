@@ -0,0 +1,168 @@
+import math
+import random
+import threading
+import time
+from typing import Optional
+
+import board
+import rules
+
+
+class Node:
+
+    __slots__ = (
+        "column",
+        "mover",
+        "parent",
+        "children",
+        "untried_columns",
+        "visits",
+        "wins",
+        "winner",
+        "draw",
+    )
+
+    def __init__(
+        self,
+        column: Optional[int],
+        mover: int,
+        parent: Optional["Node"],
+        board_: board.Board,
+    ):
+        self.column = column
+        self.mover = mover
+        self.parent = parent
+        self.children = {}
+        self.visits = 0
+        self.wins = 0.0
+        self.winner = None
+        self.draw = False
+        if column is not None and board_.has_four_in_a_row(mover):
+            self.winner = mover
+        elif board_.board_full():
+            self.draw = True
+        if self.winner is None and not self.draw:
+            self.untried_columns = [
+                column
+                for column in range(board_.columns)
+                if not board_.column_full(column)
+            ]
+        else:
+            self.untried_columns = []
+
+
+class MonteCarloPlayer:
+
+    def __init__(
+        self,
+        player: int,
+        time_budget: float = 1.0,
+        exploration: float = math.sqrt(2),
+        seed: Optional[int] = None,
+    ):
+        self.player = player
+        self.time_budget = time_budget
+        self.exploration = exploration
+        self.random = random.Random(seed)
+        self.root = None
+        self.root_board = None
+        self.playouts = 0
+        self.playouts_per_second = 0.0
+
+    def choose_column(self, game_rules: rules.Rules) -> int:
+        return self.search(game_rules.board, game_rules.current_player)
+
+    def search(
+        self,
+        board_: board.Board,
+        player: int,
+        cancelled: Optional[threading.Event] = None,
+    ) -> Optional[int]:
+        self.root = self.find_subtree(board_, player)
+        self.root_board = board_.copy()
+        start = time.perf_counter()
+        deadline = start + self.time_budget
+        playouts = 0
+        while True:
+            if cancelled is not None and cancelled.is_set():
+                return None
+            self.run_playout()
+            playouts += 1
+            if time.perf_counter() > deadline:
+                break
+        elapsed = time.perf_counter() - start
+        self.playouts = playouts
+        self.playouts_per_second = playouts / elapsed if elapsed else 0.0
+        return max(self.root.children.values(), key=lambda node: node.visits).column
+
+    def find_subtree(self, board_: board.Board, player: int) -> Node:
+        key = board_.get_key()
+        if self.root is not None and self.root.mover != player:
+            if self.root_board.get_key() == key:
+                return self.root
+            # Our last move followed by any opponent reply.
+            for child in self.root.children.values():
+                self.root_board.drop_disk_in_column(child.column, child.mover)
+                for grandchild in child.children.values():
+                    self.root_board.drop_disk_in_column(
+                        grandchild.column, grandchild.mover
+                    )
+                    found = self.root_board.get_key() == key
+                    self.root_board.undo_drop(grandchild.column)
+                    if found:
+                        grandchild.parent = None
+                        return grandchild
+                self.root_board.undo_drop(child.column)
+        return Node(None, board.OPPONENTS[player], None, board_)
+
+    def run_playout(self) -> None:
+        board_ = self.root_board.copy()
+        node = self.root
+        while not node.untried_columns and node.children:
+            node = self.select_child(node)
+            board_.drop_disk_in_column(node.column, node.mover)
+        if node.untried_columns:
+            column = node.untried_columns.pop(
+                self.random.randrange(len(node.untried_columns))
+            )
+            mover = board.OPPONENTS[node.mover]
+            board_.drop_disk_in_column(column, mover)
+            child = Node(column, mover, node, board_)
+            node.children[column] = child
+            node = child
+        if node.winner is not None:
+            winner = node.winner
+        elif node.draw:
+            winner = None
+        else:
+            winner = self.simulate(board_, board.OPPONENTS[node.mover])
+        while node is not None:
+            node.visits += 1
+            if winner is None:
+                node.wins += 0.5
+            elif winner == node.mover:
+                node.wins += 1
+            node = node.parent
+
+    def select_child(self, node: Node) -> Node:
+        log_visits = math.log(node.visits)
+        exploration = self.exploration
+        return max(
+            node.children.values(),
+            key=lambda child: child.wins / child.visits
+            + exploration * math.sqrt(log_visits / child.visits),
+        )
+
+    def simulate(self, board_: board.Board, player: int) -> Optional[int]:
+        columns = [
+            column for column in range(board_.columns) if not board_.column_full(column)
+        ]
+        while columns:
+            column = self.random.choice(columns)
+            board_.drop_disk_in_column(column, player)
+            if board_.has_four_in_a_row(player):
+                return player
+            if board_.column_full(column):
+                columns.remove(column)
+            player = board.OPPONENTS[player]
+        return None
@@ -0,0 +1,134 @@
+import argparse
+import multiprocessing
+import time
+from typing import List, Optional, Sequence, Tuple
+
+import board
+
+# Positions after each ply from the empty board, for checking a new board
+# representation against.
+REFERENCE_COUNTS = {
+    (7, 6, 4): [7, 49, 343, 2401, 16807, 117649, 823536, 5673234],
+}
+
+
+def get_position(
+    columns: int, rows: int, connect: int, moves: Sequence[int]
+) -> Tuple[board.Board, int]:
+    board_ = board.Board(columns=columns, rows=rows, connect=connect)
+    player = board.RED
+    for column in moves:
+        if board_.column_full(column):
+            raise ValueError(f"column {column} is full")
+        board_.drop_disk_in_column(column, player)
+        player = board.OPPONENTS[player]
+    return board_, player
+
+
+def perft(board_: board.Board, player: int, depth: int) -> List[int]:
+    counts = [0] * depth
+    if depth and not board_.has_four_in_a_row(board.OPPONENTS[player]):
+        count_nodes(board_, player, depth, counts, 0)
+    return counts
+
+
+def count_nodes(
+    board_: board.Board, player: int, depth: int, counts: List[int], ply: int
+) -> None:
+    # A won game has no continuations, and neither has a full board, which
+    # simply offers no columns.
+    opponent = board.OPPONENTS[player]
+    for column in range(board_.columns):
+        if board_.column_full(column):
+            continue
+        board_.drop_disk_in_column(column, player)
+        counts[ply] += 1
+        if depth > 1 and not board_.has_four_in_a_row(player):
+            count_nodes(board_, opponent, depth - 1, counts, ply + 1)
+        board_.undo_drop(column)
+
+
+def perft_root_move(task: Tuple[int, int, int, Tuple[int, ...], int]) -> List[int]:
+    columns, rows, connect, moves, depth = task
+    board_, player = get_position(columns, rows, connect, moves)
+    return perft(board_, player, depth)
+
+
+def perft_parallel(
+    columns: int,
+    rows: int,
+    connect: int,
+    moves: Sequence[int],
+    depth: int,
+    processes: Optional[int] = None,
+) -> List[int]:
+    board_, player = get_position(columns, rows, connect, moves)
+    if depth == 0 or board_.has_four_in_a_row(board.OPPONENTS[player]):
+        return [0] * depth
+    tasks = [
+        (columns, rows, connect, tuple(moves) + (column,), depth - 1)
+        for column in range(columns)
+        if not board_.column_full(column)
+    ]
+    counts = [len(tasks)] + [0] * (depth - 1)
+    # Spawned workers rebuild the position themselves, and unlike forked ones
+    # they never inherit a lock held by another thread of this process.
+    with multiprocessing.get_context("spawn").Pool(processes) as pool:
+        for child_counts in pool.imap_unordered(perft_root_move, tasks):
+            for ply, count in enumerate(child_counts, 1):
+                counts[ply] += count
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Count every continuation of a Connect Four position"
+    )
+    parser.add_argument("--depth", type=int, default=6)
+    parser.add_argument("--columns", type=int, default=7)
+    parser.add_argument("--rows", type=int, default=6)
+    parser.add_argument("--connect", type=int, default=4)
+    parser.add_argument(
+        "--moves",
+        default="",
+        help="columns played to reach the position, as digits, e.g. 3342",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=0,
+        help="split the root moves over this many processes",
+    )
+    args = parser.parse_args()
+
+    moves = [int(column) for column in args.moves]
+    start = time.perf_counter()
+    if args.processes:
+        counts = perft_parallel(
+            args.columns, args.rows, args.connect, moves, args.depth, args.processes
+        )
+    else:
+        board_, player = get_position(args.columns, args.rows, args.connect, moves)
+        counts = perft(board_, player, args.depth)
+    elapsed = time.perf_counter() - start
+
+    reference = []
+    if not moves:
+        reference = REFERENCE_COUNTS.get((args.columns, args.rows, args.connect), [])
+    for ply, count in enumerate(counts, 1):
+        line = f"ply {ply:>2}: {count:>12}"
+        if ply <= len(reference):
+            line += (
+                "  ok"
+                if count == reference[ply - 1]
+                else f"  expected {reference[ply - 1]}"
+            )
+        print(line)
+    nodes = sum(counts)
+    print(f"nodes:         {nodes}")
+    print(f"seconds:       {elapsed:.3f}")
+    print(f"nodes/second:  {nodes / elapsed:.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+import collections
+import time
+from typing import Callable, Deque, List, Optional
+
+
+class FrameProfiler:
+
+    def __init__(
+        self,
+        fps: int,
+        window: int = 600,
+        dump_path: Optional[str] = None,
+        dump_frames: int = 300,
+        overlay: bool = False,
+    ):
+        self.fps = fps
+        self.window = window
+        self.dump_path = dump_path
+        self.dump_frames = dump_frames
+        self.overlay = overlay
+        self.frames = 0
+        self.dropped_frames = 0
+        self.elapsed = 0.0
+        self.frame_times = collections.deque(maxlen=window)
+        self.samples = {}
+        self.totals = {}
+
+    def get_samples(self, name: str) -> Deque[float]:
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = collections.deque(maxlen=self.window)
+            self.samples[name] = samples
+            self.totals[name] = 0.0
+        return samples
+
+    def add(self, name: str, seconds: float) -> None:
+        self.get_samples(name).append(seconds)
+        self.totals[name] += seconds
+
+    def timed(self, name: str, function: Callable) -> Callable:
+        samples = self.get_samples(name)
+        totals = self.totals
+        timer = time.perf_counter
+
+        def timed_function(*args, **kwargs):
+            start = timer()
+            result = function(*args, **kwargs)
+            seconds = timer() - start
+            samples.append(seconds)
+            totals[name] += seconds
+            return result
+
+        return timed_function
+
+    def end_frame(self, seconds: float, elapsed: float) -> None:
+        # seconds is the work done in the frame, without the clock's wait, so
+        # a frame is dropped when the work alone overruns the frame budget.
+        self.frames += 1
+        self.elapsed += elapsed
+        self.frame_times.append(seconds)
+        if self.fps and seconds > 1 / self.fps:
+            self.dropped_frames += 1
+        if self.dump_path is not None and not self.frames % self.dump_frames:
+            self.dump()
+
+    def get_percentiles(self, samples: Deque[float]) -> List[float]:
+        ordered = sorted(samples)
+        if not ordered:
+            return [0.0, 0.0, 0.0]
+        return [
+            ordered[min(len(ordered) - 1, len(ordered) * percent // 100)]
+            for percent in (50, 95, 99)
+        ]
+
+    def get_summary(self) -> List[str]:
+        p50, p95, p99 = self.get_percentiles(self.frame_times)
+        return [
+            f"frame p50 {p50 * 1000:.2f} ms",
+            f"frame p95 {p95 * 1000:.2f} ms",
+            f"frame p99 {p99 * 1000:.2f} ms",
+            f"dropped {self.dropped_frames}/{self.frames}",
+        ]
+
+    def get_report(self) -> List[str]:
+        lines = [f"frames:         {self.frames}"]
+        if self.elapsed:
+            lines.append(f"frames/second:  {self.frames / self.elapsed:.1f}")
+        lines.append(f"dropped frames: {self.dropped_frames}")
+        p50, p95, p99 = self.get_percentiles(self.frame_times)
+        lines.append(
+            f"frame time:     p50 {p50 * 1000:.3f} ms, p95 {p95 * 1000:.3f} ms,"
+            f" p99 {p99 * 1000:.3f} ms"
+        )
+        for name, samples in self.samples.items():
+            p50, p95, p99 = self.get_percentiles(samples)
+            lines.append(
+                f"{name + ':':<26} {self.totals[name] * 1000:.1f} ms total,"
+                f" p50 {p50 * 1000:.3f} ms, p95 {p95 * 1000:.3f} ms,"
+                f" p99 {p99 * 1000:.3f} ms"
+            )
+        return lines
+
+    def dump(self) -> None:
+        with open(self.dump_path, "a") as file:
+            file.write("\n".join(self.get_report()) + "\n\n")
@@ -0,0 +1,179 @@
+import mmap
+import os
+import struct
+from typing import Iterator, Optional, Tuple
+
+import board
+import rules
+
+# An archive starts with MAGIC. Each game is a header of columns, rows,
+# connect and the player who moved first as bytes, then the red and blue
+# player names as a length byte and UTF-8, then one byte per move holding its
+# column, then END_OF_GAME. The index file alongside holds the archive offset
+# of every game as a little-endian 8 byte integer, so game K is found with one
+# seek.
+MAGIC = b"C4GR\x02"
+END_OF_GAME = 0xFF
+HEADER = struct.Struct("<BBBB")
+OFFSET = struct.Struct("<Q")
+
+
+class GameRecord:
+
+    __slots__ = ("columns", "rows", "connect", "first_player", "red", "blue", "moves")
+
+    def __init__(
+        self,
+        columns: int,
+        rows: int,
+        connect: int,
+        first_player: int,
+        red: str,
+        blue: str,
+        moves: bytes,
+    ):
+        self.columns = columns
+        self.rows = rows
+        self.connect = connect
+        self.first_player = first_player
+        self.red = red
+        self.blue = blue
+        self.moves = moves
+
+    def replay(self) -> rules.Rules:
+        game_rules = rules.Rules(
+            columns=self.columns, rows=self.rows, connect=self.connect
+        )
+        # The loser of a game opens the next one, so blue may move first.
+        game_rules.current_player = self.first_player
+        for column in self.moves:
+            game_rules.play_column(column)
+        return game_rules
+
+
+class GameWriter:
+
+    def __init__(self, path: str, index_path: Optional[str] = None):
+        self.file = open(path, "ab")
+        self.index = open(index_path or get_index_path(path), "ab")
+        if self.file.tell() == 0:
+            self.file.write(MAGIC)
+        self.in_game = False
+        self.moves = 0
+
+    def __enter__(self) -> "GameWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def start_game(
+        self,
+        columns: int,
+        rows: int,
+        connect: int,
+        red: str,
+        blue: str,
+        first_player: int = board.RED,
+    ) -> None:
+        if self.in_game:
+            self.end_game()
+        if columns >= END_OF_GAME:
+            raise ValueError(f"cannot record {columns} columns")
+        self.index.write(OFFSET.pack(self.file.tell()))
+        self.file.write(HEADER.pack(columns, rows, connect, first_player))
+        for name in (red, blue):
+            encoded = name.encode()[:255]
+            self.file.write(bytes((len(encoded),)) + encoded)
+        self.in_game = True
+        self.moves = 0
+
+    def write_move(self, column: int) -> None:
+        self.file.write(bytes((column,)))
+        self.moves += 1
+
+    def take_back_move(self) -> None:
+        # Moves are the last bytes of the archive until the game ends, so
+        # taking one back is cutting the archive one byte short.
+        if not self.in_game or not self.moves:
+            raise ValueError("no move to take back")
+        self.file.flush()
+        self.file.truncate(self.file.tell() - 1)
+        self.file.seek(0, os.SEEK_END)
+        self.moves -= 1
+
+    def end_game(self) -> None:
+        self.file.write(bytes((END_OF_GAME,)))
+        self.in_game = False
+        # Flush the index after the game so it never points past the archive.
+        self.file.flush()
+        self.index.flush()
+
+    def close(self) -> None:
+        if self.in_game:
+            self.end_game()
+        self.file.close()
+        self.index.close()
+
+
+def get_index_path(path: str) -> str:
+    return path + ".idx"
+
+
+def read_games(path: str) -> Iterator[GameRecord]:
+    with open_archive(path) as archive:
+        position = len(MAGIC)
+        while position < len(archive):
+            record, position = read_record(archive, position)
+            yield record
+
+
+def read_game(path: str, number: int, index_path: Optional[str] = None) -> GameRecord:
+    with open(index_path or get_index_path(path), "rb") as index:
+        index.seek(number * OFFSET.size)
+        entry = index.read(OFFSET.size)
+    if len(entry) < OFFSET.size:
+        raise IndexError(f"no game {number} in {path}")
+    with open_archive(path) as archive:
+        return read_record(archive, OFFSET.unpack(entry)[0])[0]
+
+
+def count_games(path: str, index_path: Optional[str] = None) -> int:
+    return os.path.getsize(index_path or get_index_path(path)) // OFFSET.size
+
+
+def build_index(path: str, index_path: Optional[str] = None) -> int:
+    games = 0
+    with open_archive(path) as archive, open(
+        index_path or get_index_path(path), "wb"
+    ) as index:
+        position = len(MAGIC)
+        while position < len(archive):
+            index.write(OFFSET.pack(position))
+            position = read_record(archive, position)[1]
+            games += 1
+    return games
+
+
+def open_archive(path: str) -> mmap.mmap:
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a game archive")
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def read_record(archive: mmap.mmap, position: int) -> Tuple[GameRecord, int]:
+    columns, rows, connect, first_player = HEADER.unpack_from(archive, position)
+    position += HEADER.size
+    names = []
+    for _ in range(2):
+        length = archive[position]
+        names.append(archive[position + 1 : position + 1 + length].decode())
+        position += 1 + length
+    end = archive.find(bytes((END_OF_GAME,)), position)
+    if end == -1:
+        raise ValueError(f"game at offset {position} is truncated")
+    record = GameRecord(
+        columns, rows, connect, first_player, names[0], names[1], archive[position:end]
+    )
+    return record, end + 1
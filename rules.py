@@ -0,0 +1,92 @@
+from typing import List, Optional, Tuple
+
+import board
+
+
+class Rules:
+
+    def __init__(self, columns: int = 7, rows: int = 7, connect: int = 4):
+        self.board = board.Board(columns=columns, rows=rows, connect=connect)
+        self.current_player = board.RED
+        self.red_score = 0
+        self.blue_score = 0
+        self.game_over = False
+        self.winning_disks = []
+        # Each move played is kept as its column and the line it made, if
+        # any, which is all undo_move needs to restore the position before it.
+        self.moves = []
+        self.undone_moves = []
+
+    def get_grid(self) -> None:
+        self.board.clear()
+        self.winning_disks = []
+        self.game_over = False
+        self.moves = []
+        self.undone_moves = []
+
+    def column_full(self, column: int) -> bool:
+        return self.board.column_full(column)
+
+    def board_full(self) -> bool:
+        return self.board.board_full()
+
+    def drop_disk_in_column(self, column: int) -> Tuple[int, int]:
+        return self.board.drop_disk_in_column(column, self.current_player)
+
+    def play_column(self, column: int) -> Optional[List[Tuple[int, int]]]:
+        disks = self.make_move(column)
+        self.undone_moves = []
+        return disks
+
+    def make_move(self, column: int) -> Optional[List[Tuple[int, int]]]:
+        if self.game_over:
+            raise ValueError("the game is over")
+        if self.column_full(column):
+            raise ValueError(f"column {column} is full")
+        disk = self.drop_disk_in_column(column)
+        disks = self.board.four_in_a_row_through(disk)
+        if disks is not None:
+            self.winning_disks = disks
+            self.increment_score()
+            self.game_over = True
+        self.swap_current_player()
+        self.moves.append((column, disks))
+        return disks
+
+    def undo_move(self) -> Optional[int]:
+        if not self.moves:
+            return None
+        column, disks = self.moves.pop()
+        self.swap_current_player()
+        if disks is not None:
+            self.decrement_score()
+            self.winning_disks = []
+            self.game_over = False
+        self.board.undo_drop(column)
+        self.undone_moves.append(column)
+        return column
+
+    def redo_move(self) -> Optional[int]:
+        if not self.undone_moves:
+            return None
+        column = self.undone_moves.pop()
+        self.make_move(column)
+        return column
+
+    def increment_score(self) -> None:
+        if self.current_player == board.RED:
+            self.red_score += 1
+        else:
+            self.blue_score += 1
+
+    def decrement_score(self) -> None:
+        if self.current_player == board.RED:
+            self.red_score -= 1
+        else:
+            self.blue_score -= 1
+
+    def swap_current_player(self) -> None:
+        if self.current_player == board.RED:
+            self.current_player = board.BLUE
+        else:
+            self.current_player = board.RED
@@ -0,0 +1,156 @@
+import argparse
+import multiprocessing
+import random
+import threading
+import time
+from typing import Iterator, List, Optional, Tuple
+
+import ai
+import board
+import mcts
+import rules
+
+POLICIES = ("random", "greedy", "search", "mcts")
+
+
+class RandomPlayer:
+
+    def __init__(self, player: int, seed: Optional[int] = None):
+        self.player = player
+        self.random = random.Random(seed)
+
+    def search(
+        self,
+        board_: board.Board,
+        player: int,
+        cancelled: Optional[threading.Event] = None,
+    ) -> Optional[int]:
+        return self.random.choice(get_open_columns(board_))
+
+
+class GreedyPlayer(RandomPlayer):
+
+    def search(
+        self,
+        board_: board.Board,
+        player: int,
+        cancelled: Optional[threading.Event] = None,
+    ) -> Optional[int]:
+        columns = get_open_columns(board_)
+        for mover in (player, board.OPPONENTS[player]):
+            for column in columns:
+                board_.drop_disk_in_column(column, mover)
+                wins = board_.has_four_in_a_row(mover)
+                board_.undo_drop(column)
+                if wins:
+                    return column
+        return self.random.choice(columns)
+
+
+def get_open_columns(board_: board.Board) -> List[int]:
+    return [
+        column for column in range(board_.columns) if not board_.column_full(column)
+    ]
+
+
+def make_player(
+    policy: str, player: int, seed: int, depth: int, think_time: Optional[float]
+) -> ai.Player:
+    if policy == "random":
+        return RandomPlayer(player, seed)
+    if policy == "greedy":
+        return GreedyPlayer(player, seed)
+    if policy == "search":
+        return ai.ComputerPlayer(player, depth=depth, time_budget=think_time)
+    if policy == "mcts":
+        return mcts.MonteCarloPlayer(player, time_budget=think_time or 0.1, seed=seed)
+    raise ValueError(f"unknown policy {policy!r}")
+
+
+def play_chunk(
+    task: Tuple[str, str, int, int, int, Optional[float], int],
+) -> Tuple[int, int, int, int, int]:
+    red_policy, blue_policy, games, seed, depth, think_time, opening_plies = task
+    players = {
+        board.RED: make_player(red_policy, board.RED, seed, depth, think_time),
+        board.BLUE: make_player(blue_policy, board.BLUE, seed + 1, depth, think_time),
+    }
+    opening = random.Random(seed)
+    game_rules = rules.Rules()
+    draws = 0
+    moves = 0
+    for _ in range(games):
+        game_rules.get_grid()
+        game_rules.current_player = board.RED
+        while not game_rules.game_over and not game_rules.board_full():
+            if moves_in_game(game_rules) < opening_plies:
+                column = opening.choice(get_open_columns(game_rules.board))
+            else:
+                column = players[game_rules.current_player].search(
+                    game_rules.board, game_rules.current_player
+                )
+            game_rules.play_column(column)
+        moves += moves_in_game(game_rules)
+        if not game_rules.game_over:
+            draws += 1
+    return games, game_rules.red_score, game_rules.blue_score, draws, moves
+
+
+def moves_in_game(game_rules: rules.Rules) -> int:
+    return sum(game_rules.board.heights)
+
+
+def get_tasks(
+    args: argparse.Namespace,
+) -> Iterator[Tuple[str, str, int, int, int, Optional[float], int]]:
+    for first_game in range(0, args.games, args.chunk_size):
+        yield (
+            args.red,
+            args.blue,
+            min(args.chunk_size, args.games - first_game),
+            args.seed + 2 * first_game,
+            args.depth,
+            args.think_time,
+            args.opening_plies,
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Play Connect Four games in bulk")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--red", choices=POLICIES, default="random")
+    parser.add_argument("--blue", choices=POLICIES, default="random")
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--think-time", type=float, default=None)
+    parser.add_argument(
+        "--opening-plies",
+        type=int,
+        default=2,
+        help="random moves played before the policies take over",
+    )
+    parser.add_argument("--processes", type=int, default=multiprocessing.cpu_count())
+    parser.add_argument("--chunk-size", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    games = red_wins = blue_wins = draws = moves = 0
+    start = time.perf_counter()
+    with multiprocessing.Pool(args.processes) as pool:
+        for chunk in pool.imap_unordered(play_chunk, get_tasks(args)):
+            games += chunk[0]
+            red_wins += chunk[1]
+            blue_wins += chunk[2]
+            draws += chunk[3]
+            moves += chunk[4]
+    elapsed = time.perf_counter() - start
+
+    print(f"games:          {games}")
+    print(f"games/second:   {games / elapsed:.1f}")
+    print(f"red wins:       {red_wins / games:.1%}")
+    print(f"blue wins:      {blue_wins / games:.1%}")
+    print(f"draws:          {draws / games:.1%}")
+    print(f"average length: {moves / games:.1f} moves")
+
+
+if __name__ == "__main__":
+    main()
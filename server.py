@@ -0,0 +1,360 @@
+import argparse
+import asyncio
+import collections
+import json
+import random
+import resource
+import sys
+import time
+from typing import Dict, List, Optional
+
+import board
+import rules
+
+# Requests and replies are JSON objects, one per line. Every request names an
+# "op" and may carry an "id", which is echoed in its reply so a client can
+# pipeline. Moves are also pushed to the other seat of the match as
+# {"event": "move", ...} lines without an id.
+
+# Each board size builds Zobrist keys that are kept for good, so clients may
+# only ask for sizes up to the largest variant, 20 by 20.
+MAX_SIZE = 20
+
+
+class Match:
+
+    __slots__ = ("number", "rules", "seats")
+
+    def __init__(self, number: int, columns: int, rows: int, connect: int):
+        self.number = number
+        self.rules = rules.Rules(columns=columns, rows=rows, connect=connect)
+        self.seats = [None, None]
+
+    def get_state(self) -> dict:
+        board_ = self.rules.board
+        return {
+            "match": self.number,
+            "columns": board_.columns,
+            "rows": board_.rows,
+            "connect": board_.connect,
+            "disks": [
+                [board_.get_disk(column, row) for row in range(board_.rows)]
+                for column in range(board_.columns)
+            ],
+            "current_player": self.rules.current_player,
+            "game_over": self.rules.game_over,
+            "scores": [self.rules.red_score, self.rules.blue_score],
+        }
+
+
+class Connection:
+
+    __slots__ = ("writer", "matches")
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.writer = writer
+        self.matches = set()
+
+    def send(self, message: dict) -> None:
+        self.writer.write(json.dumps(message).encode() + b"\n")
+
+
+class GameServer:
+
+    def __init__(self, latency_samples: int = 10000):
+        self.matches = {}
+        self.next_match = 0
+        self.moves = 0
+        self.latencies = collections.deque(maxlen=latency_samples)
+        self.handlers = {
+            "new": self.handle_new,
+            "join": self.handle_join,
+            "play": self.handle_play,
+            "reset": self.handle_reset,
+            "state": self.handle_state,
+            "leave": self.handle_leave,
+            "stats": self.handle_stats,
+        }
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        connection = Connection(writer)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                connection.send(self.handle_line(connection, line))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for number in list(connection.matches):
+                self.leave(connection, number)
+            writer.close()
+
+    def handle_line(self, connection: Connection, line: bytes) -> dict:
+        request = {}
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                request = {}
+                raise ValueError("requests must be JSON objects")
+            handler = self.handlers.get(request.get("op"))
+            if handler is None:
+                raise ValueError(f"unknown op {request.get('op')!r}")
+            reply = handler(connection, request)
+            reply["ok"] = True
+        except (ValueError, KeyError, TypeError) as error:
+            reply = {"ok": False, "error": str(error)}
+        if "id" in request:
+            reply["id"] = request["id"]
+        return reply
+
+    def get_match(self, request: dict) -> Match:
+        number = get_int(request, "match")
+        match = self.matches.get(number)
+        if match is None:
+            raise ValueError(f"no match {number}")
+        return match
+
+    def handle_new(self, connection: Connection, request: dict) -> dict:
+        columns = get_int(request, "columns", 7)
+        rows = get_int(request, "rows", 7)
+        connect = get_int(request, "connect", 4)
+        if not (
+            0 < columns <= MAX_SIZE
+            and 0 < rows <= MAX_SIZE
+            and 2 <= connect <= max(columns, rows)
+        ):
+            raise ValueError("bad board size")
+        match = Match(self.next_match, columns, rows, connect)
+        self.next_match += 1
+        self.matches[match.number] = match
+        match.seats[board.RED] = connection
+        connection.matches.add(match.number)
+        return {"match": match.number, "player": board.RED}
+
+    def handle_join(self, connection: Connection, request: dict) -> dict:
+        match = self.get_match(request)
+        if match.seats[board.BLUE] is not None:
+            raise ValueError(f"match {match.number} is full")
+        match.seats[board.BLUE] = connection
+        connection.matches.add(match.number)
+        return {"match": match.number, "player": board.BLUE}
+
+    def handle_play(self, connection: Connection, request: dict) -> dict:
+        start = time.perf_counter()
+        match = self.get_match(request)
+        player = match.rules.current_player
+        if match.seats[player] is not connection:
+            raise ValueError("not your turn")
+        column = get_int(request, "column")
+        if not 0 <= column < match.rules.board.columns:
+            raise ValueError(f"no column {column}")
+        # play_column checks for a finished game and a full column itself.
+        winning_disks = match.rules.play_column(column)
+        event = {
+            "event": "move",
+            "match": match.number,
+            "player": player,
+            "column": column,
+            "winning_disks": winning_disks,
+            "game_over": match.rules.game_over,
+            "board_full": match.rules.board_full(),
+            "scores": [match.rules.red_score, match.rules.blue_score],
+        }
+        opponent = match.seats[board.OPPONENTS[player]]
+        if opponent is not None and opponent is not connection:
+            opponent.send(event)
+        self.moves += 1
+        self.latencies.append(time.perf_counter() - start)
+        return event
+
+    def handle_reset(self, connection: Connection, request: dict) -> dict:
+        match = self.get_match(request)
+        if connection not in match.seats:
+            raise ValueError(f"not seated in match {match.number}")
+        match.rules.get_grid()
+        return {"match": match.number}
+
+    def handle_state(self, connection: Connection, request: dict) -> dict:
+        return self.get_match(request).get_state()
+
+    def handle_leave(self, connection: Connection, request: dict) -> dict:
+        self.leave(connection, request["match"])
+        return {"match": request["match"]}
+
+    def leave(self, connection: Connection, number: int) -> None:
+        match = self.matches.get(number)
+        connection.matches.discard(number)
+        if match is None:
+            return
+        match.seats = [None if seat is connection else seat for seat in match.seats]
+        if match.seats == [None, None]:
+            del self.matches[number]
+
+    def handle_stats(self, connection: Connection, request: dict) -> dict:
+        latencies = sorted(self.latencies)
+        return {
+            "matches": len(self.matches),
+            "moves": self.moves,
+            "match_bytes": get_match_bytes(self.matches),
+            "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            "move_latency_us": {
+                "p50": get_percentile(latencies, 50) * 1e6,
+                "p99": get_percentile(latencies, 99) * 1e6,
+            },
+        }
+
+
+def get_percentile(ordered: List[float], percent: int) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, len(ordered) * percent // 100)]
+
+
+def get_int(request: dict, name: str, default: Optional[int] = None) -> int:
+    value = request.get(name, default)
+    # JSON true and false are ints to Python, so turn them away explicitly.
+    if type(value) is not int:
+        raise TypeError(f"{name} must be an integer")
+    return value
+
+
+def get_match_bytes(matches: Dict[int, Match]) -> int:
+    # Average deep size of the matches, not counting the shared connections
+    # or the Zobrist numbers every board of a size shares.
+    if not matches:
+        return 0
+    shared = {id(value) for keys in board.ZOBRIST_KEYS.values() for value in keys}
+    sample = list(matches.values())[:100]
+    return sum(get_size(match, set(shared)) for match in sample) // len(sample)
+
+
+def get_size(value: object, seen: set) -> int:
+    if id(value) in seen or isinstance(value, Connection):
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(
+            get_size(key, seen) + get_size(item, seen) for key, item in value.items()
+        )
+    elif isinstance(value, (list, tuple, set)):
+        size += sum(get_size(item, seen) for item in value)
+    elif hasattr(value, "__dict__"):
+        size += get_size(vars(value), seen)
+    elif hasattr(value, "__slots__"):
+        size += sum(get_size(getattr(value, name), seen) for name in value.__slots__)
+    return size
+
+
+class Client:
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.next_id = 0
+        self.replies = {}
+        self.events = []
+        self.reading = asyncio.ensure_future(self.read())
+
+    @classmethod
+    async def connect(cls, host: str, port: int) -> "Client":
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def read(self) -> None:
+        while True:
+            line = await self.reader.readline()
+            if not line:
+                break
+            message = json.loads(line)
+            future = self.replies.pop(message.get("id"), None)
+            if future is None:
+                self.events.append(message)
+            else:
+                future.set_result(message)
+
+    async def request(self, op: str, **arguments) -> dict:
+        self.next_id += 1
+        future = asyncio.get_running_loop().create_future()
+        self.replies[self.next_id] = future
+        self.writer.write(
+            json.dumps({"op": op, "id": self.next_id, **arguments}).encode() + b"\n"
+        )
+        await self.writer.drain()
+        return await future
+
+    async def close(self) -> None:
+        self.writer.close()
+        await self.writer.wait_closed()
+        self.reading.cancel()
+
+
+async def run_load(
+    host: str, port: int, matches: int, moves: int, seed: Optional[int] = None
+) -> dict:
+    generator = random.Random(seed)
+    client = await Client.connect(host, port)
+    numbers = []
+    for _ in range(matches):
+        number = (await client.request("new"))["match"]
+        await client.request("join", match=number)
+        numbers.append(number)
+    heights = {number: [0] * 7 for number in numbers}
+    latencies = []
+    for _ in range(moves):
+        number = generator.choice(numbers)
+        column = generator.choice(
+            [column for column, height in enumerate(heights[number]) if height < 7]
+        )
+        start = time.perf_counter()
+        reply = await client.request("play", match=number, column=column)
+        latencies.append(time.perf_counter() - start)
+        heights[number][column] += 1
+        if reply["game_over"] or reply["board_full"]:
+            await client.request("reset", match=number)
+            heights[number] = [0] * 7
+    stats = await client.request("stats")
+    await client.close()
+    latencies.sort()
+    stats["round_trip_us"] = {
+        "p50": get_percentile(latencies, 50) * 1e6,
+        "p99": get_percentile(latencies, 99) * 1e6,
+    }
+    return stats
+
+
+async def serve(host: str, port: int) -> None:
+    game_server = GameServer()
+    server = await asyncio.start_server(game_server.handle_connection, host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Host Connect Four matches")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4444)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("serve", help="run the server")
+    load = subparsers.add_parser("load", help="open matches and play random moves")
+    load.add_argument("--matches", type=int, default=1000)
+    load.add_argument("--moves", type=int, default=10000)
+    load.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        asyncio.run(serve(args.host, args.port))
+    else:
+        stats = asyncio.run(
+            run_load(args.host, args.port, args.matches, args.moves, args.seed)
+        )
+        print(json.dumps(stats, indent=2))
+
+
+if __name__ == "__main__":
+    main()
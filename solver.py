@@ -0,0 +1,374 @@
+import argparse
+import mmap
+import os
+import struct
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import board
+import perft
+import transposition
+
+# Scores are for the player to move and depend only on when the game ends:
+# winning with the disk that brings the board to m disks scores
+# (cells + 2 - m) // 2, losing scores the negation and a draw scores 0. So a
+# quicker win scores more and a parent's score is minus its best child's.
+
+# A table file is MAGIC, the board's columns, rows and connect as bytes, then
+# entries of an unsigned 8 byte position key and a signed byte score sorted by
+# key, so a lookup is a binary search over the memory map.
+MAGIC = b"C4ST\x01"
+HEADER = struct.Struct("<BBB")
+ENTRY = struct.Struct("<Qb")
+
+
+class SolutionTable:
+
+    magic = MAGIC
+    entry = ENTRY
+
+    def __init__(self, path: str):
+        self.path = path
+        self.columns = self.rows = self.connect = None
+        self.entries = 0
+        self.file = None
+        self.map = None
+        if os.path.exists(path) and os.path.getsize(path):
+            self.file = open(path, "rb")
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            if self.map[: len(self.magic)] != self.magic:
+                self.close()
+                raise ValueError(f"{path} is not in the {type(self).__name__} format")
+            self.columns, self.rows, self.connect = HEADER.unpack_from(
+                self.map, len(self.magic)
+            )
+            self.entries = (
+                len(self.map) - len(self.magic) - HEADER.size
+            ) // self.entry.size
+
+    def __enter__(self) -> "SolutionTable":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.entries
+
+    def close(self) -> None:
+        if self.map is not None:
+            self.map.close()
+            self.file.close()
+            self.map = self.file = None
+
+    def matches(self, board_: board.Board) -> bool:
+        return self.entries == 0 or (self.columns, self.rows, self.connect) == (
+            board_.columns,
+            board_.rows,
+            board_.connect,
+        )
+
+    def get_entry(self, index: int) -> tuple:
+        return self.entry.unpack_from(
+            self.map, len(self.magic) + HEADER.size + index * self.entry.size
+        )
+
+    def find(self, key: int) -> Optional[tuple]:
+        low = 0
+        high = self.entries
+        while low < high:
+            middle = (low + high) // 2
+            entry = self.get_entry(middle)
+            if entry[0] == key:
+                return entry
+            if entry[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    def get(self, key: int) -> Optional[int]:
+        entry = self.find(key)
+        return None if entry is None else entry[1]
+
+    def items(self) -> Iterator[tuple]:
+        for index in range(self.entries):
+            yield self.get_entry(index)
+
+    def add(self, board_: board.Board, scores: Dict[int, int]) -> None:
+        self.write(board_, {key: (score,) for key, score in scores.items()})
+
+    def write(self, board_: board.Board, values: Dict[int, tuple]) -> None:
+        # Merges into a new file and swaps it in, so readers that already
+        # mapped the old table keep a consistent copy.
+        if not self.matches(board_):
+            raise ValueError(f"{self.path} holds a different board size")
+        merged = {entry[0]: entry[1:] for entry in self.items()}
+        merged.update(values)
+        temporary_path = self.path + ".tmp"
+        with open(temporary_path, "wb") as file:
+            file.write(self.magic)
+            file.write(HEADER.pack(board_.columns, board_.rows, board_.connect))
+            for key in sorted(merged):
+                file.write(self.entry.pack(key, *merged[key]))
+        self.close()
+        os.replace(temporary_path, self.path)
+        self.__init__(self.path)
+
+
+class Solver:
+
+    def __init__(
+        self, table: Optional[SolutionTable] = None, table_megabytes: float = 16
+    ):
+        self.table = table
+        self.transposition_table = transposition.TranspositionTable(table_megabytes)
+        self.solved = {}
+        self.nodes = 0
+        self.size = None
+        self.cells = 0
+        self.column_masks = []
+        self.move_order = []
+
+    def solve(self, board_: board.Board, player: Optional[int] = None) -> int:
+        # Positions are keyed and solved with red having moved first, so when
+        # blue opened the colours are swapped; the score is the same.
+        if player is not None and player != get_player(board_):
+            board_ = get_swapped(board_)
+        key = get_table_key(board_)
+        if key in self.solved:
+            return self.solved[key]
+        if self.table is not None and self.table.matches(board_):
+            score = self.table.get(key)
+            if score is not None:
+                return score
+        self.prepare(board_)
+        score = self.search(board_.copy(), get_player(board_))
+        self.solved[key] = score
+        return score
+
+    def prepare(self, board_: board.Board) -> None:
+        # The transposition table only holds positions of one board size.
+        size = (board_.columns, board_.rows, board_.connect)
+        if size == self.size:
+            return
+        self.size = size
+        self.cells = board_.columns * board_.rows
+        self.transposition_table.clear()
+        self.column_masks = [
+            ((1 << board_.rows) - 1) << column * board_.column_stride
+            for column in range(board_.columns)
+        ]
+        self.move_order = sorted(
+            range(board_.columns),
+            key=lambda column: abs(2 * column - board_.columns + 1),
+        )
+
+    def search(self, board_: board.Board, player: int) -> int:
+        moves = sum(board_.heights)
+        if board_.has_four_in_a_row(board.OPPONENTS[player]):
+            return -((self.cells + 2 - moves) // 2)
+        if board_.board_full():
+            return 0
+        if board_.get_winning_cells(player) & board_.get_playable_cells():
+            return (self.cells + 1 - moves) // 2
+        # Narrow a null window onto the exact score, trying draws and the
+        # extremes first, as in a binary search over the possible scores.
+        low = -((self.cells - moves) // 2)
+        high = (self.cells + 1 - moves) // 2
+        while low < high:
+            middle = low + (high - low) // 2
+            if middle <= 0 and low // 2 < middle:
+                middle = low // 2
+            elif middle >= 0 and high // 2 > middle:
+                middle = high // 2
+            score = self.negamax(board_, player, moves, middle, middle + 1)
+            if score <= middle:
+                high = score
+            else:
+                low = score
+        return low
+
+    def negamax(
+        self, board_: board.Board, player: int, moves: int, alpha: int, beta: int
+    ) -> int:
+        # The player to move never has a winning move here: the caller only
+        # plays moves that leave none.
+        self.nodes += 1
+        opponent = board.OPPONENTS[player]
+        candidates = self.get_non_losing_moves(board_, player, opponent)
+        if not candidates:
+            return -((self.cells - moves) // 2)
+        if moves >= self.cells - 2:
+            return 0
+        lowest = -((self.cells - 2 - moves) // 2)
+        if alpha < lowest:
+            alpha = lowest
+            if alpha >= beta:
+                return alpha
+        highest = (self.cells - 1 - moves) // 2
+        # Only upper bounds are stored, with the number of empty cells as the
+        # depth so that positions nearer the root are the ones kept.
+        key = board_.get_canonical_hash()
+        entry = self.transposition_table.get(key)
+        if entry is not None:
+            highest = entry[2]
+        if beta > highest:
+            beta = highest
+            if alpha >= beta:
+                return beta
+        for column in self.get_ordered_columns(board_, player, candidates):
+            board_.drop_disk_in_column(column, player)
+            score = -self.negamax(board_, opponent, moves + 1, -beta, -alpha)
+            board_.undo_drop(column)
+            if score >= beta:
+                return score
+            if score > alpha:
+                alpha = score
+        self.transposition_table.put(
+            key, self.cells - moves, transposition.UPPER_BOUND, alpha, None
+        )
+        return alpha
+
+    def get_non_losing_moves(
+        self, board_: board.Board, player: int, opponent: int
+    ) -> int:
+        playable = board_.get_playable_cells()
+        opponent_wins = board_.get_winning_cells(opponent)
+        forced = playable & opponent_wins
+        if forced:
+            if forced & (forced - 1):
+                return 0
+            playable = forced
+        # Never play directly under a cell that would win for the opponent.
+        return playable & ~(opponent_wins >> 1)
+
+    def get_ordered_columns(
+        self, board_: board.Board, player: int, candidates: int
+    ) -> List[int]:
+        # Moves that make the most new threats first, center first on ties.
+        scored = []
+        for order, column in enumerate(self.move_order):
+            if candidates & self.column_masks[column]:
+                board_.drop_disk_in_column(column, player)
+                threats = bin(board_.get_winning_cells(player)).count("1")
+                board_.undo_drop(column)
+                scored.append((-threats, order, column))
+        scored.sort()
+        return [column for _, _, column in scored]
+
+
+def get_player(board_: board.Board) -> int:
+    return board.RED if sum(board_.heights) % 2 == 0 else board.BLUE
+
+
+def get_swapped(board_: board.Board) -> board.Board:
+    swapped = board_.copy()
+    swapped.disks = swapped.disks[::-1]
+    swapped.update_keys()
+    return swapped
+
+
+def get_table_key(board_: board.Board) -> int:
+    if board_.columns * board_.column_stride > 64:
+        raise ValueError("the board is too big for a solution table")
+    return board_.get_canonical_key()
+
+
+def get_result(board_: board.Board, score: int) -> Tuple[str, int]:
+    # Turns a score back into the outcome for the player to move and how many
+    # more disks are played before it.
+    moves = sum(board_.heights)
+    cells = board_.columns * board_.rows
+    if score == 0:
+        return "draw", cells - moves
+    winner_moves = moves + 1 if score > 0 else moves
+    end = cells + 2 - 2 * abs(score)
+    if end % 2 != (winner_moves % 2):
+        end -= 1
+    return ("win" if score > 0 else "loss"), end - moves
+
+
+def analyse(
+    board_: board.Board,
+    table: Optional[SolutionTable] = None,
+    player: Optional[int] = None,
+) -> Tuple[str, int]:
+    return get_result(board_, Solver(table).solve(board_, player))
+
+
+def get_positions(
+    board_: board.Board, plies: int, seen: Optional[set] = None
+) -> Iterator[board.Board]:
+    if seen is None:
+        seen = set()
+    key = board_.get_canonical_key()
+    if key in seen:
+        return
+    seen.add(key)
+    yield board_.copy()
+    player = get_player(board_)
+    if plies == 0 or board_.has_four_in_a_row(board.OPPONENTS[player]):
+        return
+    for column in range(board_.columns):
+        if not board_.column_full(column):
+            board_.drop_disk_in_column(column, player)
+            yield from get_positions(board_, plies - 1, seen)
+            board_.undo_drop(column)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Solve Connect Four positions")
+    parser.add_argument("--columns", type=int, default=7)
+    parser.add_argument("--rows", type=int, default=6)
+    parser.add_argument("--connect", type=int, default=4)
+    parser.add_argument(
+        "--moves",
+        default="",
+        help="columns played to reach the position, as digits, e.g. 3342",
+    )
+    parser.add_argument("--table", metavar="PATH", help="solution table to use")
+    parser.add_argument(
+        "--plies",
+        type=int,
+        default=0,
+        help="also solve every position up to this many moves further on",
+    )
+    parser.add_argument(
+        "--save", action="store_true", help="add the solved positions to the table"
+    )
+    parser.add_argument(
+        "--cache-megabytes",
+        type=float,
+        default=16,
+        help="memory for the transposition table",
+    )
+    args = parser.parse_args()
+
+    board_, _ = perft.get_position(
+        args.columns, args.rows, args.connect, [int(column) for column in args.moves]
+    )
+    table = SolutionTable(args.table) if args.table else None
+    solver = Solver(table, args.cache_megabytes)
+    start = time.perf_counter()
+    for position in get_positions(board_, args.plies):
+        solver.solve(position)
+    score = solver.solve(board_)
+    elapsed = time.perf_counter() - start
+    outcome, distance = get_result(board_, score)
+    print(f"result:   {outcome} for the player to move in {distance} moves")
+    print(f"score:    {score}")
+    print(f"solved:   {len(solver.solved)} positions, {solver.nodes} nodes")
+    print(f"seconds:  {elapsed:.3f}")
+    stats = solver.transposition_table.get_stats()
+    print(
+        f"cache:    {stats['used']}/{stats['slots']} slots used,"
+        f" {stats['hit_rate']:.1%} hits, {stats['overwrites']} overwrites"
+    )
+    if table is not None and args.save and solver.solved:
+        table.add(board_, solver.solved)
+        print(f"table:    {len(table)} positions")
+
+
+if __name__ == "__main__":
+    main()
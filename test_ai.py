@@ -0,0 +1,154 @@
+import threading
+import time
+import unittest
+import unittest.mock
+
+import ai
+import board
+import rules
+
+
+class FailingPlayer:
+
+    player = board.RED
+
+    def search(self, board_, player, cancelled=None):
+        raise OverflowError("depth out of range")
+
+
+class TestChooseColumn(unittest.TestCase):
+
+    def setUp(self):
+        self.rules = rules.Rules()
+
+    def play(self, *columns):
+        for column in columns:
+            self.rules.play_column(column)
+
+    def test_opens_in_the_center_column(self):
+        computer_player = ai.ComputerPlayer(board.RED, depth=4)
+        self.assertEqual(computer_player.choose_column(self.rules), 3)
+
+    def test_takes_a_winning_move(self):
+        self.play(0, 6, 1, 6, 2, 5)
+        computer_player = ai.ComputerPlayer(board.RED, depth=4)
+        self.assertEqual(computer_player.choose_column(self.rules), 3)
+
+    def test_blocks_the_opponents_winning_move(self):
+        self.play(0, 6, 1, 6, 2)
+        computer_player = ai.ComputerPlayer(board.BLUE, depth=4)
+        self.assertEqual(computer_player.choose_column(self.rules), 3)
+
+    def test_does_not_change_the_board(self):
+        self.play(3, 3, 2)
+        disks = self.rules.board.disks[:]
+        heights = self.rules.board.heights[:]
+        ai.ComputerPlayer(board.BLUE, depth=4).choose_column(self.rules)
+        self.assertEqual(self.rules.board.disks, disks)
+        self.assertEqual(self.rules.board.heights, heights)
+
+    def test_never_chooses_a_full_column(self):
+        self.play(*[3] * self.rules.board.rows)
+        computer_player = ai.ComputerPlayer(board.BLUE, depth=4)
+        self.assertFalse(
+            self.rules.column_full(computer_player.choose_column(self.rules))
+        )
+
+    def test_fills_the_transposition_table(self):
+        computer_player = ai.ComputerPlayer(board.RED, depth=4)
+        computer_player.choose_column(self.rules)
+        self.assertGreater(len(computer_player.transposition_table), 0)
+
+    def test_searches_for_either_side_do_not_share_entries(self):
+        # After a win the loser opens, so the same disks can be searched with
+        # either player to move.
+        board_ = board.Board()
+        for column in (0, 1, 2):
+            board_.drop_disk_in_column(column, board.RED)
+        for _ in range(3):
+            board_.drop_disk_in_column(6, board.BLUE)
+        computer_player = ai.ComputerPlayer(board.BLUE, depth=4)
+        self.assertEqual(computer_player.search(board_, board.RED), 3)
+        self.assertEqual(computer_player.search(board_, board.BLUE), 6)
+
+
+class TestCountThreats(unittest.TestCase):
+
+    def test_counts_the_empty_cells_that_complete_a_line(self):
+        board_ = board.Board()
+        for column in (1, 2, 3):
+            board_.drop_disk_in_column(column, board.RED)
+        computer_player = ai.ComputerPlayer(board.RED)
+        self.assertEqual(computer_player.count_threats(board_, board.RED), 2)
+        self.assertEqual(computer_player.count_threats(board_, board.BLUE), 0)
+
+
+class TestSearch(unittest.TestCase):
+
+    def test_stops_after_the_time_budget_with_a_move(self):
+        computer_player = ai.ComputerPlayer(board.RED, depth=42, time_budget=0.05)
+        start = time.perf_counter()
+        column = computer_player.search(board.Board(), board.RED)
+        self.assertLess(time.perf_counter() - start, 1)
+        self.assertIn(column, range(7))
+
+    def test_returns_none_when_cancelled_before_starting(self):
+        cancelled = threading.Event()
+        cancelled.set()
+        computer_player = ai.ComputerPlayer(board.RED, depth=42)
+        self.assertIsNone(computer_player.search(board.Board(), board.RED, cancelled))
+
+    def test_stops_deepening_once_a_win_is_found(self):
+        board_ = board.Board()
+        for column in (0, 1, 2):
+            board_.drop_disk_in_column(column, board.RED)
+        computer_player = ai.ComputerPlayer(board.RED, depth=42)
+        self.assertEqual(computer_player.search(board_, board.RED), 3)
+
+
+class TestBackgroundSearch(unittest.TestCase):
+
+    def test_finds_a_move_and_calls_back(self):
+        calls = []
+        search = ai.BackgroundSearch(
+            ai.ComputerPlayer(board.RED, depth=4),
+            rules.Rules(),
+            on_done=lambda: calls.append(True),
+        )
+        search.start()
+        search.thread.join()
+        self.assertTrue(search.done())
+        self.assertEqual(search.column, 3)
+        self.assertEqual(calls, [True])
+
+    def test_finishes_and_calls_back_when_the_search_fails(self):
+        calls = []
+        search = ai.BackgroundSearch(
+            FailingPlayer(), rules.Rules(), on_done=lambda: calls.append(True)
+        )
+        with unittest.mock.patch.object(threading, "excepthook"):
+            search.start()
+            search.thread.join()
+        self.assertTrue(search.done())
+        self.assertIsNone(search.column)
+        self.assertEqual(calls, [True])
+
+    def test_cancel_stops_the_thread_without_calling_back(self):
+        calls = []
+        search = ai.BackgroundSearch(
+            ai.ComputerPlayer(board.RED, depth=42),
+            rules.Rules(),
+            on_done=lambda: calls.append(True),
+        )
+        search.start()
+        search.cancel()
+        self.assertFalse(search.thread.is_alive())
+        self.assertEqual(calls, [])
+
+    def test_searches_a_snapshot_of_the_board(self):
+        game_rules = rules.Rules()
+        search = ai.BackgroundSearch(ai.ComputerPlayer(board.RED, depth=2), game_rules)
+        game_rules.play_column(0)
+        search.start()
+        search.thread.join()
+        self.assertEqual(search.board.disks, [0, 0])
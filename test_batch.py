@@ -0,0 +1,120 @@
+import os
+import random
+import tempfile
+import unittest
+
+import numpy as np
+
+import batch
+import board
+
+
+def random_board(generator: random.Random, moves: int) -> board.Board:
+    board_ = board.Board()
+    player = board.RED
+    for _ in range(moves):
+        columns = [
+            column for column in range(board_.columns) if not board_.column_full(column)
+        ]
+        if not columns:
+            break
+        board_.drop_disk_in_column(generator.choice(columns), player)
+        player = board.OPPONENTS[player]
+    return board_
+
+
+class TestFourInARow(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        generator = random.Random(0)
+        cls.boards = [
+            random_board(generator, generator.randrange(50)) for _ in range(500)
+        ]
+        cls.array = batch.to_array(cls.boards)
+
+    def assert_matches_board(self, winners, lines):
+        for board_, winner, line in zip(self.boards, winners, lines):
+            expected = board_.four_in_a_row()
+            if expected is None:
+                self.assertEqual(winner, batch.NO_WINNER)
+                self.assertTrue((line == -1).all())
+            else:
+                self.assertEqual(winner, board_.get_disk(*expected[0]))
+                self.assertEqual([tuple(cell) for cell in line.tolist()], expected)
+
+    def test_matches_the_board_scans(self):
+        self.assert_matches_board(*batch.four_in_a_row(self.array))
+
+    def test_chunking_does_not_change_the_result(self):
+        self.assert_matches_board(*batch.four_in_a_row(self.array, chunk_size=7))
+
+    def test_reads_memory_mapped_boards(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "boards.bin")
+            self.array.tofile(path)
+            boards = batch.open_boards(path)
+            self.assertEqual(boards.shape, self.array.shape)
+            self.assert_matches_board(*batch.four_in_a_row(boards, chunk_size=64))
+            del boards
+
+    def test_writes_into_memory_mapped_results(self):
+        with tempfile.TemporaryDirectory() as directory:
+            winners = np.memmap(
+                os.path.join(directory, "winners.bin"),
+                dtype=np.int8,
+                mode="w+",
+                shape=(len(self.array),),
+            )
+            lines = np.memmap(
+                os.path.join(directory, "lines.bin"),
+                dtype=np.int16,
+                mode="w+",
+                shape=(len(self.array), 4, 2),
+            )
+            results = batch.four_in_a_row(
+                self.array, chunk_size=64, winners=winners, lines=lines
+            )
+            self.assertIs(results[0], winners)
+            self.assertIs(results[1], lines)
+            self.assert_matches_board(winners, lines)
+            del results, winners, lines
+
+    def test_rejects_results_of_the_wrong_size(self):
+        with self.assertRaises(ValueError):
+            batch.four_in_a_row(self.array, winners=np.empty(3, dtype=np.int8))
+
+    def test_iterates_over_chunks(self):
+        starts = []
+        winners = []
+        lines = []
+        for start, chunk_winners, chunk_lines in batch.iter_four_in_a_row(
+            self.array, chunk_size=64
+        ):
+            starts.append(start)
+            self.assertLessEqual(len(chunk_winners), 64)
+            winners.append(chunk_winners)
+            lines.append(chunk_lines)
+        self.assertEqual(starts, list(range(0, len(self.array), 64)))
+        self.assert_matches_board(np.concatenate(winners), np.concatenate(lines))
+
+    def test_empty_input(self):
+        winners, lines = batch.four_in_a_row(np.zeros((0, 7, 7), dtype=np.int8))
+        self.assertEqual(winners.shape, (0,))
+        self.assertEqual(lines.shape, (0, 4, 2))
+
+    def test_ascending_line(self):
+        array = np.zeros((1, 7, 7), dtype=np.int8)
+        for offset in range(4):
+            array[0, offset, 6 - offset] = board.BLUE + 1
+        winners, lines = batch.four_in_a_row(array)
+        self.assertEqual(winners[0], board.BLUE)
+        self.assertEqual(lines[0].tolist(), [[0, 6], [1, 5], [2, 4], [3, 3]])
+
+    def test_connect_sets_the_run_length(self):
+        array = np.zeros((2, 20, 20), dtype=np.int8)
+        array[0, 2:7, 19] = board.RED + 1
+        array[1, 2:8, 19] = board.RED + 1
+        winners, lines = batch.four_in_a_row(array, connect=6)
+        self.assertEqual(winners.tolist(), [batch.NO_WINNER, board.RED])
+        self.assertEqual(lines[1].tolist(), [[column, 19] for column in range(2, 8)])
@@ -0,0 +1,53 @@
+import unittest
+
+import benchmark
+import game
+
+
+class TestGetBoards(unittest.TestCase):
+
+    def test_boards_fill_up_in_order(self):
+        boards = benchmark.get_boards()
+        moves = [sum(board_.heights) for board_ in boards.values()]
+        self.assertEqual(list(boards), ["empty", "mid-game", "near-full"])
+        self.assertEqual(moves, sorted(moves))
+        self.assertFalse(boards["near-full"].board_full())
+
+
+class TestGetBenchmarks(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.benchmarks = benchmark.get_benchmarks(game.Game(idle=False))
+
+    def test_covers_every_hot_path_on_every_board(self):
+        for name in ("empty", "mid-game", "near-full"):
+            for function in (
+                "four_in_a_row",
+                "four_in_a_row_horizontal",
+                "four_in_a_row_vertical",
+                "four_in_a_row_diagonal_descending",
+                "four_in_a_row_diagonal_ascending",
+                "drop_disk_in_column",
+                "column_full",
+                "render",
+            ):
+                self.assertIn(f"{function} {name}", self.benchmarks)
+        self.assertIn("get_grid", self.benchmarks)
+
+    def test_times_are_per_call(self):
+        seconds = benchmark.time_benchmark(
+            self.benchmarks["get_grid"], repeat=2, min_time=0.001
+        )
+        self.assertGreater(seconds, 0)
+        self.assertLess(seconds, 0.001)
+
+
+class TestFindRegressions(unittest.TestCase):
+
+    def test_reports_only_benchmarks_slower_than_the_threshold(self):
+        baseline = {"fast": 1.0, "slow": 1.0, "removed": 1.0}
+        results = {"fast": 1.2, "slow": 1.3, "new": 5.0}
+        self.assertEqual(
+            benchmark.find_regressions(results, baseline, 0.25), [("slow", 1.0, 1.3)]
+        )
@@ -0,0 +1,904 @@
+import unittest
+
+import board
+
+
+class TestDropDiskInColumn(unittest.TestCase):
+
+    def setUp(self):
+        self.board = board.Board()
+
+    def test_returns_the_cell_the_disk_landed_in(self):
+        self.assertEqual(self.board.drop_disk_in_column(2, board.RED), (2, 6))
+        self.assertEqual(self.board.drop_disk_in_column(2, board.BLUE), (2, 5))
+
+    def test_disk_belongs_to_the_dropping_player(self):
+        self.board.drop_disk_in_column(3, board.BLUE)
+        self.assertEqual(self.board.get_disk(3, 6), board.BLUE)
+        self.assertIsNone(self.board.get_disk(3, 5))
+
+    def test_column_becomes_full_after_rows_drops(self):
+        for _ in range(self.board.rows):
+            self.assertFalse(self.board.column_full(0))
+            self.board.drop_disk_in_column(0, board.RED)
+        self.assertTrue(self.board.column_full(0))
+
+
+class TestSetDisk(unittest.TestCase):
+
+    def setUp(self):
+        self.board = board.Board()
+
+    def test_replaces_the_other_players_disk(self):
+        self.board.set_disk(0, 6, board.RED)
+        self.board.set_disk(0, 6, board.BLUE)
+        self.assertEqual(self.board.get_disk(0, 6), board.BLUE)
+
+    def test_none_empties_the_cell(self):
+        self.board.set_disk(0, 6, board.RED)
+        self.board.set_disk(0, 6, None)
+        self.assertIsNone(self.board.get_disk(0, 6))
+        self.assertEqual(self.board.heights[0], 0)
+
+    def test_height_follows_the_highest_disk_in_the_column(self):
+        self.board.set_disk(1, 4, board.RED)
+        self.assertEqual(self.board.heights[1], 3)
+
+
+class TestFindLine(unittest.TestCase):
+
+    def setUp(self):
+        self.board = board.Board()
+
+    def test_lines_do_not_wrap_between_columns(self):
+        self.board.set_disk(0, 1, board.RED)
+        self.board.set_disk(0, 0, board.RED)
+        self.board.set_disk(1, 6, board.RED)
+        self.board.set_disk(1, 5, board.RED)
+        self.assertIsNone(self.board.four_in_a_row())
+
+    def test_returns_the_first_line_when_both_players_have_one(self):
+        for column in range(4):
+            self.board.set_disk(column, 6, board.RED)
+            self.board.set_disk(column, 5, board.BLUE)
+        self.assertEqual(self.board.four_in_a_row(), [(0, 5), (1, 5), (2, 5), (3, 5)])
+
+
+class TestFourInARowThrough(unittest.TestCase):
+
+    def setUp(self):
+        self.board = board.Board()
+
+    def test_returns_none_for_an_empty_cell(self):
+        self.assertIsNone(self.board.four_in_a_row_through((0, 6)))
+
+    def test_returns_none_when_the_disk_completes_no_line(self):
+        for column in (0, 1, 2):
+            self.board.drop_disk_in_column(column, board.RED)
+        disk = self.board.drop_disk_in_column(4, board.RED)
+        self.assertIsNone(self.board.four_in_a_row_through(disk))
+
+    def test_finds_a_horizontal_line_completed_in_the_middle(self):
+        for column in (0, 1, 3):
+            self.board.drop_disk_in_column(column, board.BLUE)
+        disk = self.board.drop_disk_in_column(2, board.BLUE)
+        self.assertEqual(
+            self.board.four_in_a_row_through(disk), [(0, 6), (1, 6), (2, 6), (3, 6)]
+        )
+
+    def test_finds_a_vertical_line_ending_at_the_dropped_disk(self):
+        self.board.drop_disk_in_column(5, board.BLUE)
+        for _ in range(3):
+            self.board.drop_disk_in_column(5, board.RED)
+        disk = self.board.drop_disk_in_column(5, board.RED)
+        self.assertEqual(
+            self.board.four_in_a_row_through(disk), [(5, 2), (5, 3), (5, 4), (5, 5)]
+        )
+
+    def test_ignores_lines_of_the_other_player(self):
+        for column in range(4):
+            self.board.set_disk(column, 6, board.RED)
+        self.board.set_disk(4, 6, board.BLUE)
+        self.assertIsNone(self.board.four_in_a_row_through((4, 6)))
+
+    def test_matches_the_full_scan_for_every_disk_of_a_long_diagonal(self):
+        for offset in range(5):
+            self.board.set_disk(offset, 6 - offset, board.RED)
+            self.board.set_disk(1 + offset, offset, board.BLUE)
+        for offset in range(5):
+            self.assertEqual(
+                self.board.four_in_a_row_through((offset, 6 - offset)),
+                self.board.four_in_a_row_diagonal_ascending(),
+            )
+            self.assertEqual(
+                self.board.four_in_a_row_through((1 + offset, offset)),
+                self.board.four_in_a_row_diagonal_descending(),
+            )
+
+
+class TestFourInARow(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.board = board.Board()
+
+    def setUp(self):
+        self.board.clear()
+
+    def test_returns_none_when_grid_is_empty(self):
+        self.assertIs(self.board.four_in_a_row(), None)
+
+    def test_returns_none_when_grid_is_not_empty_but_has_no_four_in_a_row(self):
+        self.board.set_disk(0, 0, board.RED)
+        self.board.set_disk(0, 6, board.RED)
+        self.board.set_disk(6, 1, board.RED)
+        self.board.set_disk(6, 0, board.RED)
+        self.assertIs(self.board.four_in_a_row(), None)
+
+    def test_returns_expected_disks_when_grid_has_4_horizontally_adjacent_of_the_same_color(
+        self,
+    ):
+        expected_disks = [
+            (0, 6),
+            (1, 6),
+            (2, 6),
+            (3, 6),
+        ]
+        self.board.set_disk(0, 6, board.RED)
+        self.board.set_disk(1, 6, board.RED)
+        self.board.set_disk(2, 6, board.RED)
+        self.board.set_disk(3, 6, board.RED)
+        self.assertEqual(self.board.four_in_a_row(), expected_disks)
+
+    def test_returns_expected_disks_when_grid_has_4_vertically_adjacent_disks_of_the_same_color(
+        self,
+    ):
+        expected_disks = [
+            (0, 3),
+            (0, 4),
+            (0, 5),
+            (0, 6),
+        ]
+        self.board.set_disk(0, 6, board.RED)
+        self.board.set_disk(0, 5, board.RED)
+        self.board.set_disk(0, 4, board.RED)
+        self.board.set_disk(0, 3, board.RED)
+        self.assertEqual(self.board.four_in_a_row(), expected_disks)
+
+    def test_returns_expected_disks_when_grid_has_4_diagonally_descending_adjacent_disks_of_the_same_color(
+        self,
+    ):
+        expected_disks = [
+            (0, 3),
+            (1, 4),
+            (2, 5),
+            (3, 6),
+        ]
+        self.board.set_disk(0, 3, board.RED)
+        self.board.set_disk(1, 4, board.RED)
+        self.board.set_disk(2, 5, board.RED)
+        self.board.set_disk(3, 6, board.RED)
+        self.assertEqual(self.board.four_in_a_row(), expected_disks)
+
+    def test_returns_expected_disks_when_grid_has_4_diagonally_ascending_adjacent_disks_of_the_same_color(
+        self,
+    ):
+        expected_disks = [
+            (0, 6),
+            (1, 5),
+            (2, 4),
+            (3, 3),
+        ]
+        self.board.set_disk(0, 6, board.RED)
+        self.board.set_disk(1, 5, board.RED)
+        self.board.set_disk(2, 4, board.RED)
+        self.board.set_disk(3, 3, board.RED)
+        self.assertEqual(self.board.four_in_a_row(), expected_disks)
+
+
+class TestFourInARowHorizontal(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.board = board.Board()
+
+    def setUp(self):
+        self.board.clear()
+
+    def test_returns_none_when_grid_is_empty(self):
+        self.assertIs(self.board.four_in_a_row_horizontal(), None)
+
+    def test_returns_none_when_row_has_3_horizontally_adjacent_disks_of_the_same_color(
+        self,
+    ):
+        self.board.set_disk(0, 6, board.BLUE)
+        self.board.set_disk(1, 6, board.BLUE)
+        self.board.set_disk(2, 6, board.BLUE)
+        self.assertIs(self.board.four_in_a_row_horizontal(), None)
+
+    def test_returns_none_when_row_has_4_horizontally_adjacent_disks_of_different_colors(
+        self,
+    ):
+        self.board.set_disk(0, 6, board.RED)
+        self.board.set_disk(1, 6, board.BLUE)
+        self.board.set_disk(2, 6, board.RED)
+        self.board.set_disk(3, 6, board.BLUE)
+        self.assertIs(self.board.four_in_a_row_horizontal(), None)
+
+    def test_returns_expected_disks_when_row_has_4_horizontally_adjacent_disks_of_the_same_color(
+        self,
+    ):
+        expected_disks = [
+            (0, 6),
+            (1, 6),
+            (2, 6),
+            (3, 6),
+        ]
+        self.board.set_disk(0, 6, board.RED)
+        self.board.set_disk(1, 6, board.RED)
+        self.board.set_disk(2, 6, board.RED)
+        self.board.set_disk(3, 6, board.RED)
+        self.assertEqual(self.board.four_in_a_row_horizontal(), expected_disks)
+
+    def test_returns_expected_disks_row_has_4_horizontally_adjacent_disks_of_the_same_color_in_the_last_row(
+        self,
+    ):
+        expected_disks = [
+            (3, 0),
+            (4, 0),
+            (5, 0),
+            (6, 0),
+        ]
+        self.board.set_disk(3, 0, board.RED)
+        self.board.set_disk(4, 0, board.RED)
+        self.board.set_disk(5, 0, board.RED)
+        self.board.set_disk(6, 0, board.RED)
+        self.assertEqual(self.board.four_in_a_row_horizontal(), expected_disks)
+
+    def test_returns_expected_disks_when_row_has_4_horizontally_adjacent_disks_of_the_same_color_preceded_by_3_disks_of_varying_color(
+        self,
+    ):
+        expected_disks = [
+            (3, 6),
+            (4, 6),
+            (5, 6),
+            (6, 6),
+        ]
+        self.board.set_disk(0, 6, board.RED)
+        self.board.set_disk(1, 6, board.BLUE)
+        self.board.set_disk(2, 6, board.RED)
+        self.board.set_disk(3, 6, board.BLUE)
+        self.board.set_disk(4, 6, board.BLUE)
+        self.board.set_disk(5, 6, board.BLUE)
+        self.board.set_disk(6, 6, board.BLUE)
+        self.assertEqual(self.board.four_in_a_row_horizontal(), expected_disks)
+
+    def test_returns_none_when_one_row_has_2_disks_at_the_end_and_another_has_2_disks_at_the_beginning_of_the_same_color(
+        self,
+    ):
+        self.board.set_disk(5, 0, board.RED)
+        self.board.set_disk(6, 0, board.RED)
+        self.board.set_disk(0, 1, board.RED)
+        self.board.set_disk(1, 1, board.RED)
+        self.assertIs(self.board.four_in_a_row_horizontal(), None)
+
+    def test_returns_expected_disks_when_row_has_5_horizontally_adjacent_disks_of_the_same_color(
+        self,
+    ):
+        expected_disks = [
+            (0, 6),
+            (1, 6),
+            (2, 6),
+            (3, 6),
+        ]
+        self.board.set_disk(0, 6, board.BLUE)
+        self.board.set_disk(1, 6, board.BLUE)
+        self.board.set_disk(2, 6, board.BLUE)
+        self.board.set_disk(3, 6, board.BLUE)
+        self.board.set_disk(4, 6, board.BLUE)
+        self.assertEqual(self.board.four_in_a_row_horizontal(), expected_disks)
+
+    def test_returns_none_when_column_has_4_vertically_adjacent_disks_of_the_same_color(
+        self,
+    ):
+        self.board.set_disk(0, 6, board.RED)
+        self.board.set_disk(0, 5, board.RED)
+        self.board.set_disk(0, 4, board.RED)
+        self.board.set_disk(0, 3, board.RED)
+        self.assertIs(self.board.four_in_a_row_horizontal(), None)
+
+    def test_returns_none_when_grid_has_4_diagonally_descending_adjacent_disks_of_the_same_color(
+        self,
+    ):
+        self.board.set_disk(0, 3, board.BLUE)
+        self.board.set_disk(1, 4, board.BLUE)
+        self.board.set_disk(2, 5, board.BLUE)
+        self.board.set_disk(3, 6, board.BLUE)
+        self.assertIs(self.board.four_in_a_row_horizontal(), None)
+
+    def test_returns_none_when_grid_has_4_diagonally_ascending_adjacent_disks_of_the_same_color(
+        self,
+    ):
+        self.board.set_disk(0, 6, board.BLUE)
+        self.board.set_disk(1, 5, board.BLUE)
+        self.board.set_disk(2, 4, board.BLUE)
+        self.board.set_disk(3, 3, board.BLUE)
+        self.assertIs(self.board.four_in_a_row_horizontal(), None)
+
+
+class TestFourInARowVertical(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.board = board.Board()
+
+    def setUp(self):
+        self.board.clear()
+
+    def test_returns_none_when_grid_is_empty(self):
+        self.assertIs(self.board.four_in_a_row_vertical(), None)
+
+    def test_returns_none_when_column_has_3_vertically_adjacent_disks_of_the_same_color(
+        self,
+    ):
+        self.board.set_disk(0, 6, board.BLUE)
+        self.board.set_disk(0, 5, board.BLUE)
+        self.board.set_disk(0, 4, board.BLUE)
+        self.assertIs(self.board.four_in_a_row_vertical(), None)
+
+    def test_returns_none_when_column_has_4_vertically_adjacent_disks_of_different_colors(
+        self,
+    ):
+        self.board.set_disk(0, 6, board.RED)
+        self.board.set_disk(0, 5, board.BLUE)
+        self.board.set_disk(0, 4, board.RED)
+        self.board.set_disk(0, 3, board.BLUE)
+        self.assertIs(self.board.four_in_a_row_vertical(), None)
+
+    def test_returns_expected_disks_when_column_has_4_vertically_adjacent_disks_of_the_same_color(
+        self,
+    ):
+        expected_disks = [
+            (0, 3),
+            (0, 4),
+            (0, 5),
+            (0, 6),
+        ]
+        self.board.set_disk(0, 6, board.RED)
+        self.board.set_disk(0, 5, board.RED)
+        self.board.set_disk(0, 4, board.RED)
+        self.board.set_disk(0, 3, board.RED)
+        self.assertEqual(self.board.four_in_a_row_vertical(), expected_disks)
+
+    def test_returns_expected_disks_when_column_has_4_vertically_adjacent_disks_of_the_same_color_in_the_last_column(
+        self,
+    ):
+        expected_disks = [
+            (6, 3),
+            (6, 4),
+            (6, 5),
+            (6, 6),
+        ]
+        self.board.set_disk(6, 6, board.RED)
+        self.board.set_disk(6, 5, board.RED)
+        self.board.set_disk(6, 4, board.RED)
+        self.board.set_disk(6, 3, board.RED)
+        self.assertEqual(self.board.four_in_a_row_vertical(), expected_disks)
+
+    def test_returns_expected_disks_when_column_has_4_vertically_adjacent_disks_of_the_same_color_preceded_by_3_disks_of_varying_color(
+        self,
+    ):
+        expected_disks = [
+            (0, 0),
+            (0, 1),
+            (0, 2),
+            (0, 3),
+        ]
+        self.board.set_disk(0, 6, board.RED)
+        self.board.set_disk(0, 5, board.BLUE)
+        self.board.set_disk(0, 4, board.RED)
+        self.board.set_disk(0, 3, board.BLUE)
+        self.board.set_disk(0, 2, board.BLUE)
+        self.board.set_disk(0, 1, board.BLUE)
+        self.board.set_disk(0, 0, board.BLUE)
+        self.assertEqual(self.board.four_in_a_row_vertical(), expected_disks)
+
+    def test_returns_none_when_one_column_has_2_disks_on_the_bottom_and_another_has_2_disks_on_the_top_of_the_same_color(
+        self,
+    ):
+        self.board.set_disk(0, 6, board.RED)
+        self.board.set_disk(0, 5, board.RED)
+        self.board.set_disk(1, 0, board.RED)
+        self.board.set_disk(1, 1, board.RED)
+        self.assertIs(self.board.four_in_a_row_vertical(), None)
+
+    def test_returns_expected_disks_when_column_has_5_vertically_adjacent_disks_of_the_same_color(
+        self,
+    ):
+        expected_disks = [
+            (0, 2),
+            (0, 3),
+            (0, 4),
+            (0, 5),
+        ]
+        self.board.set_disk(0, 6, board.BLUE)
+        self.board.set_disk(0, 5, board.BLUE)
+        self.board.set_disk(0, 4, board.BLUE)
+        self.board.set_disk(0, 3, board.BLUE)
+        self.board.set_disk(0, 2, board.BLUE)
+        self.assertEqual(self.board.four_in_a_row_vertical(), expected_disks)
+
+    def test_returns_none_when_row_has_4_horizontally_adjacent_disks_of_the_same_color(
+        self,
+    ):
+        self.board.set_disk(0, 6, board.RED)
+        self.board.set_disk(1, 6, board.RED)
+        self.board.set_disk(2, 6, board.RED)
+        self.board.set_disk(3, 6, board.RED)
+        self.assertIs(self.board.four_in_a_row_vertical(), None)
+
+    def test_returns_none_when_grid_has_4_diagonally_descending_adjacent_disks_of_the_same_color(
+        self,
+    ):
+        self.board.set_disk(0, 3, board.BLUE)
+        self.board.set_disk(1, 4, board.BLUE)
+        self.board.set_disk(2, 5, board.BLUE)
+        self.board.set_disk(3, 6, board.BLUE)
+        self.assertIs(self.board.four_in_a_row_vertical(), None)
+
+    def test_returns_none_when_grid_has_4_diagonally_ascending_adjacent_disks_of_the_same_color(
+        self,
+    ):
+        self.board.set_disk(0, 6, board.BLUE)
+        self.board.set_disk(1, 5, board.BLUE)
+        self.board.set_disk(2, 4, board.BLUE)
+        self.board.set_disk(3, 3, board.BLUE)
+        self.assertIs(self.board.four_in_a_row_vertical(), None)
+
+
+class TestFourInARowDiagonalDescending(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.board = board.Board()
+
+    def setUp(self):
+        self.board.clear()
+
+    def test_returns_none_when_grid_is_empty(self):
+        self.assertIsNone(self.board.four_in_a_row_diagonal_descending())
+
+    def test_returns_none_when_grid_has_3_diagonally_adjacent_disks_of_the_same_color(
+        self,
+    ):
+        self.board.set_disk(0, 4, board.BLUE)
+        self.board.set_disk(1, 5, board.BLUE)
+        self.board.set_disk(2, 6, board.BLUE)
+        self.assertIsNone(self.board.four_in_a_row_diagonal_descending())
+
+    def test_returns_none_when_grid_has_4_diagonally_adjacent_disks_of_different_colors(
+        self,
+    ):
+        self.board.set_disk(0, 3, board.RED)
+        self.board.set_disk(1, 4, board.BLUE)
+        self.board.set_disk(2, 5, board.RED)
+        self.board.set_disk(3, 6, board.BLUE)
+        self.assertIsNone(self.board.four_in_a_row_diagonal_descending())
+
+    def test_returns_true_expected_disks_grid_has_4_diagonally_adjacent_disks_of_the_same_color(
+        self,
+    ):
+        expected_disks = [
+            (0, 3),
+            (1, 4),
+            (2, 5),
+            (3, 6),
+        ]
+        self.board.set_disk(0, 3, board.RED)
+        self.board.set_disk(1, 4, board.RED)
+        self.board.set_disk(2, 5, board.RED)
+        self.board.set_disk(3, 6, board.RED)
+        self.assertEqual(self.board.four_in_a_row_diagonal_descending(), expected_disks)
+
+    def test_returns_expected_disks_when_grid_has_4_diagonally_adjacent_disks_of_the_same_color_in_the_last_columns_and_rows(
+        self,
+    ):
+        expected_disks = [
+            (3, 3),
+            (4, 4),
+            (5, 5),
+            (6, 6),
+        ]
+        self.board.set_disk(3, 3, board.RED)
+        self.board.set_disk(4, 4, board.RED)
+        self.board.set_disk(5, 5, board.RED)
+        self.board.set_disk(6, 6, board.RED)
+        self.assertEqual(self.board.four_in_a_row_diagonal_descending(), expected_disks)
+
+    def test_returns_expected_disks_when_grid_has_4_diagonally_adjacent_disks_of_the_same_color_preceded_by_3_disks_of_varying_color(
+        self,
+    ):
+        expected_disks = [
+            (3, 3),
+            (4, 4),
+            (5, 5),
+            (6, 6),
+        ]
+        self.board.set_disk(0, 0, board.RED)
+        self.board.set_disk(1, 1, board.BLUE)
+        self.board.set_disk(2, 2, board.RED)
+        self.board.set_disk(3, 3, board.BLUE)
+        self.board.set_disk(4, 4, board.BLUE)
+        self.board.set_disk(5, 5, board.BLUE)
+        self.board.set_disk(6, 6, board.BLUE)
+        self.assertEqual(self.board.four_in_a_row_diagonal_descending(), expected_disks)
+
+    def test_returns_none_when_the_first_two_columns_have_2_disks_on_the_bottom_and_the_last_two_have_2_disks_on_the_top_of_the_same_color(
+        self,
+    ):
+        self.board.set_disk(2, 2, board.RED)
+        self.board.set_disk(3, 3, board.RED)
+        self.board.set_disk(1, 0, board.RED)
+        self.board.set_disk(2, 1, board.RED)
+        self.assertIsNone(self.board.four_in_a_row_diagonal_descending())
+
+    def test_returns_expected_disks_when_grid_has_5_diagonally_adjacent_disks_of_the_same_color(
+        self,
+    ):
+        expected_disks = [
+            (0, 2),
+            (1, 3),
+            (2, 4),
+            (3, 5),
+        ]
+        self.board.set_disk(0, 2, board.BLUE)
+        self.board.set_disk(1, 3, board.BLUE)
+        self.board.set_disk(2, 4, board.BLUE)
+        self.board.set_disk(3, 5, board.BLUE)
+        self.board.set_disk(4, 6, board.BLUE)
+        self.assertEqual(self.board.four_in_a_row_diagonal_descending(), expected_disks)
+
+    def test_returns_none_when_row_has_4_horizontally_adjacent_disks_of_the_same_color(
+        self,
+    ):
+        self.board.set_disk(0, 6, board.RED)
+        self.board.set_disk(1, 6, board.RED)
+        self.board.set_disk(2, 6, board.RED)
+        self.board.set_disk(3, 6, board.RED)
+        self.assertIsNone(self.board.four_in_a_row_diagonal_descending())
+
+    def test_returns_none_when_column_has_4_vertically_adjacent_disks_of_the_same_color(
+        self,
+    ):
+        self.board.set_disk(0, 6, board.RED)
+        self.board.set_disk(0, 5, board.RED)
+        self.board.set_disk(0, 4, board.RED)
+        self.board.set_disk(0, 3, board.RED)
+        self.assertIsNone(self.board.four_in_a_row_diagonal_descending())
+
+    def test_returns_none_when_grid_has_4_diagonally_ascending_adjacent_disks_of_the_same_color(
+        self,
+    ):
+        self.board.set_disk(0, 6, board.BLUE)
+        self.board.set_disk(1, 5, board.BLUE)
+        self.board.set_disk(2, 4, board.BLUE)
+        self.board.set_disk(3, 3, board.BLUE)
+        self.assertIsNone(self.board.four_in_a_row_diagonal_descending())
+
+
+class TestFourInARowDiagonalAscending(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.board = board.Board()
+
+    def setUp(self):
+        self.board.clear()
+
+    def test_returns_none_when_grid_is_empty(self):
+        self.assertIs(self.board.four_in_a_row_diagonal_ascending(), None)
+
+    def test_returns_none_when_grid_has_3_diagonally_adjacent_disks_of_the_same_color(
+        self,
+    ):
+        self.board.set_disk(0, 6, board.BLUE)
+        self.board.set_disk(1, 5, board.BLUE)
+        self.board.set_disk(2, 4, board.BLUE)
+        self.assertIs(self.board.four_in_a_row_diagonal_ascending(), None)
+
+    def test_returns_none_when_grid_has_4_diagonally_adjacent_disks_of_different_colors(
+        self,
+    ):
+        self.board.set_disk(0, 6, board.RED)
+        self.board.set_disk(1, 5, board.BLUE)
+        self.board.set_disk(2, 4, board.RED)
+        self.board.set_disk(3, 3, board.BLUE)
+        self.assertIs(self.board.four_in_a_row_diagonal_ascending(), None)
+
+    def test_returns_expected_disks_when_grid_has_4_diagonally_adjacent_disks_of_the_same_color(
+        self,
+    ):
+        expected_disks = [
+            (0, 6),
+            (1, 5),
+            (2, 4),
+            (3, 3),
+        ]
+        self.board.set_disk(0, 6, board.RED)
+        self.board.set_disk(1, 5, board.RED)
+        self.board.set_disk(2, 4, board.RED)
+        self.board.set_disk(3, 3, board.RED)
+        self.assertEqual(self.board.four_in_a_row_diagonal_ascending(), expected_disks)
+
+    def test_returns_expected_disks_when_grid_has_4_diagonally_adjacent_disks_of_the_same_color_in_the_last_columns_and_rows(
+        self,
+    ):
+        expected_disks = [
+            (3, 6),
+            (4, 5),
+            (5, 4),
+            (6, 3),
+        ]
+        self.board.set_disk(3, 6, board.RED)
+        self.board.set_disk(4, 5, board.RED)
+        self.board.set_disk(5, 4, board.RED)
+        self.board.set_disk(6, 3, board.RED)
+        self.assertEqual(self.board.four_in_a_row_diagonal_ascending(), expected_disks)
+
+    def test_returns_expected_disks_when_grid_has_4_diagonally_adjacent_disks_of_the_same_color_preceded_by_3_disks_of_varying_color(
+        self,
+    ):
+        expected_disks = [
+            (3, 3),
+            (4, 2),
+            (5, 1),
+            (6, 0),
+        ]
+        self.board.set_disk(0, 6, board.RED)
+        self.board.set_disk(1, 5, board.BLUE)
+        self.board.set_disk(2, 4, board.RED)
+        self.board.set_disk(3, 3, board.BLUE)
+        self.board.set_disk(4, 2, board.BLUE)
+        self.board.set_disk(5, 1, board.BLUE)
+        self.board.set_disk(6, 0, board.BLUE)
+        self.assertTrue(self.board.four_in_a_row_diagonal_ascending())
+
+    def test_returns_none_when_the_first_two_columns_have_2_disks_on_the_top_and_the_last_two_have_2_disks_on_the_bottom_of_the_same_color(
+        self,
+    ):
+        self.board.set_disk(2, 1, board.RED)
+        self.board.set_disk(3, 0, board.RED)
+        self.board.set_disk(1, 3, board.RED)
+        self.board.set_disk(2, 2, board.RED)
+        self.assertIs(self.board.four_in_a_row_diagonal_ascending(), None)
+
+    def test_returns_expected_disks_when_grid_has_5_diagonally_adjacent_disks_of_the_same_color(
+        self,
+    ):
+        expected_disks = [
+            (0, 6),
+            (1, 5),
+            (2, 4),
+            (3, 3),
+        ]
+        self.board.set_disk(0, 6, board.BLUE)
+        self.board.set_disk(1, 5, board.BLUE)
+        self.board.set_disk(2, 4, board.BLUE)
+        self.board.set_disk(3, 3, board.BLUE)
+        self.board.set_disk(4, 2, board.BLUE)
+        self.assertTrue(self.board.four_in_a_row_diagonal_ascending())
+
+    def test_returns_none_when_row_has_4_horizontally_adjacent_disks_of_the_same_color(
+        self,
+    ):
+        self.board.set_disk(0, 6, board.RED)
+        self.board.set_disk(1, 6, board.RED)
+        self.board.set_disk(2, 6, board.RED)
+        self.board.set_disk(3, 6, board.RED)
+        self.assertIs(self.board.four_in_a_row_diagonal_ascending(), None)
+
+    def test_returns_none_when_column_has_4_vertically_adjacent_disks_of_the_same_color(
+        self,
+    ):
+        self.board.set_disk(0, 6, board.RED)
+        self.board.set_disk(0, 5, board.RED)
+        self.board.set_disk(0, 4, board.RED)
+        self.board.set_disk(0, 3, board.RED)
+        self.assertIs(self.board.four_in_a_row_diagonal_ascending(), None)
+
+    def test_returns_none_when_grid_has_4_diagonally_descending_adjacent_disks_of_the_same_color(
+        self,
+    ):
+        self.board.set_disk(0, 3, board.BLUE)
+        self.board.set_disk(1, 4, board.BLUE)
+        self.board.set_disk(2, 5, board.BLUE)
+        self.board.set_disk(3, 6, board.BLUE)
+        self.assertIs(self.board.four_in_a_row_diagonal_ascending(), None)
+
+
+class TestUndoDrop(unittest.TestCase):
+
+    def test_restores_the_board_before_the_drop(self):
+        board_ = board.Board()
+        board_.drop_disk_in_column(2, board.RED)
+        disks = board_.disks[:]
+        heights = board_.heights[:]
+        board_.drop_disk_in_column(2, board.BLUE)
+        board_.undo_drop(2)
+        self.assertEqual(board_.disks, disks)
+        self.assertEqual(board_.heights, heights)
+
+
+class TestHasFourInARow(unittest.TestCase):
+
+    def test_finds_a_line_in_every_direction(self):
+        for cells in (
+            [(0, 6), (1, 6), (2, 6), (3, 6)],
+            [(0, 6), (0, 5), (0, 4), (0, 3)],
+            [(0, 3), (1, 4), (2, 5), (3, 6)],
+            [(0, 6), (1, 5), (2, 4), (3, 3)],
+        ):
+            board_ = board.Board()
+            for column, row in cells:
+                board_.set_disk(column, row, board.BLUE)
+            self.assertTrue(board_.has_four_in_a_row(board.BLUE))
+            self.assertFalse(board_.has_four_in_a_row(board.RED))
+
+    def test_lines_do_not_wrap_between_columns(self):
+        board_ = board.Board()
+        for column, row in ((0, 1), (0, 0), (1, 6), (1, 5)):
+            board_.set_disk(column, row, board.RED)
+        self.assertFalse(board_.has_four_in_a_row(board.RED))
+
+
+class TestConnect(unittest.TestCase):
+
+    def setUp(self):
+        self.board = board.Board(columns=20, rows=20, connect=6)
+
+    def test_five_in_a_row_does_not_win(self):
+        for column in range(5):
+            self.board.drop_disk_in_column(column, board.RED)
+        self.assertFalse(self.board.has_four_in_a_row(board.RED))
+        self.assertIsNone(self.board.four_in_a_row())
+        self.assertIsNone(self.board.four_in_a_row_through((4, 19)))
+
+    def test_finds_a_line_of_six_in_every_direction(self):
+        for cells in (
+            [(column, 19) for column in range(14, 20)],
+            [(19, row) for row in range(0, 6)],
+            [(offset, 14 + offset) for offset in range(6)],
+            [(14 + offset, 5 - offset) for offset in range(6)],
+        ):
+            board_ = board.Board(columns=20, rows=20, connect=6)
+            for column, row in cells:
+                board_.set_disk(column, row, board.BLUE)
+            self.assertTrue(board_.has_four_in_a_row(board.BLUE))
+            self.assertEqual(board_.four_in_a_row(), cells)
+            for cell in cells:
+                self.assertEqual(board_.four_in_a_row_through(cell), cells)
+
+    def test_lines_do_not_wrap_between_columns(self):
+        for row in range(16, 20):
+            self.board.set_disk(0, row, board.RED)
+        for row in range(0, 2):
+            self.board.set_disk(1, row, board.RED)
+        self.assertFalse(self.board.has_four_in_a_row(board.RED))
+
+    def test_copy_keeps_the_run_length(self):
+        self.assertEqual(self.board.copy().connect, 6)
+
+
+class TestGetKey(unittest.TestCase):
+
+    def test_same_disks_in_a_different_order_give_the_same_key(self):
+        first = board.Board()
+        second = board.Board()
+        for column, player in ((0, board.RED), (1, board.BLUE), (2, board.RED)):
+            first.drop_disk_in_column(column, player)
+        for column, player in ((2, board.RED), (1, board.BLUE), (0, board.RED)):
+            second.drop_disk_in_column(column, player)
+        self.assertEqual(first.get_key(), second.get_key())
+
+    def test_swapped_colors_give_a_different_key(self):
+        first = board.Board()
+        second = board.Board()
+        first.drop_disk_in_column(0, board.RED)
+        first.drop_disk_in_column(0, board.BLUE)
+        second.drop_disk_in_column(0, board.BLUE)
+        second.drop_disk_in_column(0, board.RED)
+        self.assertNotEqual(first.get_key(), second.get_key())
+
+    def test_copy_is_independent(self):
+        board_ = board.Board()
+        copy = board_.copy()
+        copy.drop_disk_in_column(0, board.RED)
+        self.assertEqual(board_.disks, [0, 0])
+        self.assertEqual(board_.heights[0], 0)
+
+    def test_copy_keeps_the_keys_and_shares_the_tables(self):
+        board_ = board.Board()
+        for column, player in ((3, board.RED), (2, board.BLUE), (3, board.RED)):
+            board_.drop_disk_in_column(column, player)
+        copy = board_.copy()
+        self.assertEqual(
+            (copy.key, copy.mirrored_key, copy.hash, copy.mirrored_hash),
+            (board_.key, board_.mirrored_key, board_.hash, board_.mirrored_hash),
+        )
+        self.assertIs(copy.zobrist_keys, board_.zobrist_keys)
+        key = board_.get_key()
+        copy.undo_drop(3)
+        self.assertEqual(board_.heights[3], 2)
+        self.assertEqual(board_.get_key(), key)
+        self.assertNotEqual(copy.get_key(), key)
+
+
+class TestGetCanonicalKey(unittest.TestCase):
+
+    def setUp(self):
+        self.board = board.Board()
+        self.mirrored = board.Board()
+        for column, player in ((0, board.RED), (1, board.BLUE), (1, board.RED)):
+            self.board.drop_disk_in_column(column, player)
+            self.mirrored.drop_disk_in_column(6 - column, player)
+
+    def test_mirror_images_share_a_key(self):
+        self.assertNotEqual(self.board.get_key(), self.mirrored.get_key())
+        self.assertEqual(
+            self.board.get_canonical_key(), self.mirrored.get_canonical_key()
+        )
+
+    def test_columns_map_to_the_canonical_side(self):
+        self.assertNotEqual(self.board.is_mirrored(), self.mirrored.is_mirrored())
+        self.assertEqual(
+            self.board.get_canonical_column(2), self.mirrored.get_canonical_column(4)
+        )
+
+    def test_undo_restores_the_keys(self):
+        keys = (self.board.get_key(), self.board.get_canonical_key())
+        self.board.drop_disk_in_column(3, board.BLUE)
+        self.board.undo_drop(3)
+        self.assertEqual((self.board.get_key(), self.board.get_canonical_key()), keys)
+
+    def test_set_disk_updates_the_keys(self):
+        board_ = board.Board()
+        board_.set_disk(0, 6, board.RED)
+        board_.set_disk(1, 6, board.BLUE)
+        board_.set_disk(1, 5, board.RED)
+        self.assertEqual(board_.get_key(), self.board.get_key())
+        self.assertEqual(board_.get_canonical_key(), self.mirrored.get_canonical_key())
+
+
+class TestGetCanonicalHash(unittest.TestCase):
+
+    def test_follows_drops_and_undos(self):
+        board_ = board.Board()
+        empty = board_.get_canonical_hash()
+        board_.drop_disk_in_column(2, board.RED)
+        board_.drop_disk_in_column(2, board.BLUE)
+        dropped = board_.get_canonical_hash()
+        self.assertNotEqual(dropped, empty)
+        board_.undo_drop(2)
+        board_.undo_drop(2)
+        self.assertEqual(board_.get_canonical_hash(), empty)
+        board_.set_disk(2, 6, board.RED)
+        board_.set_disk(2, 5, board.BLUE)
+        self.assertEqual(board_.get_canonical_hash(), dropped)
+
+    def test_mirror_images_share_a_hash(self):
+        board_ = board.Board()
+        mirrored = board.Board()
+        for column, player in ((0, board.RED), (1, board.BLUE), (1, board.RED)):
+            board_.drop_disk_in_column(column, player)
+            mirrored.drop_disk_in_column(6 - column, player)
+        self.assertEqual(board_.get_canonical_hash(), mirrored.get_canonical_hash())
+        self.assertEqual(
+            board_.copy().get_canonical_hash(), board_.get_canonical_hash()
+        )
+
+    def test_swapped_colors_give_a_different_hash(self):
+        first = board.Board()
+        second = board.Board()
+        first.drop_disk_in_column(0, board.RED)
+        second.drop_disk_in_column(0, board.BLUE)
+        self.assertNotEqual(first.get_canonical_hash(), second.get_canonical_hash())
@@ -0,0 +1,106 @@
+import os
+import tempfile
+import unittest
+
+import ai
+import board
+import book
+import perft
+import selfplay
+
+
+class TestOpeningBook(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "openings.c4b")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_holds_every_position_up_to_the_plies(self):
+        # Mirror images share an entry, so 4 columns give 2 distinct first
+        # moves and 8 distinct pairs of moves.
+        board_ = board.Board(4, 4, 3)
+        with book.OpeningBook(self.path) as opening_book:
+            self.assertEqual(book.build_book(opening_book, board_, 2, 2), 1 + 2 + 8)
+        with book.OpeningBook(self.path) as opening_book:
+            self.assertEqual(len(opening_book), 11)
+            keys = [entry[0] for entry in opening_book.items()]
+            self.assertEqual(keys, sorted(keys))
+            for moves in ([], [0], [0, 2]):
+                position, player = perft.get_position(4, 4, 3, moves)
+                computer_player = ai.ComputerPlayer(player, depth=2)
+                column = computer_player.search(position, player)
+                self.assertEqual(
+                    opening_book.get_move(position),
+                    (column, computer_player.best_score),
+                )
+                if not moves:
+                    # The empty board is its own mirror image.
+                    continue
+                mirrored, _ = perft.get_position(4, 4, 3, [3 - move for move in moves])
+                self.assertEqual(
+                    opening_book.get_move(mirrored),
+                    (3 - column, computer_player.best_score),
+                )
+            position, _ = perft.get_position(4, 4, 3, [0, 1, 2])
+            self.assertIsNone(opening_book.get_move(position))
+
+    def test_skips_finished_positions(self):
+        # Red has already won, and no move is left on the full board.
+        with book.OpeningBook(self.path) as opening_book:
+            board_, _ = perft.get_position(3, 3, 2, [0, 1, 0])
+            self.assertEqual(book.build_book(opening_book, board_, 1, 1), 0)
+            board_, _ = perft.get_position(2, 1, 4, [0, 1])
+            self.assertEqual(book.build_book(opening_book, board_, 1, 1), 0)
+
+    def test_ignores_other_board_sizes(self):
+        with book.OpeningBook(self.path) as opening_book:
+            book.build_book(opening_book, board.Board(4, 4, 3), 1, 1)
+            self.assertIsNone(opening_book.get_move(board.Board(7, 6, 4)))
+
+    def test_rejects_solution_tables(self):
+        with book.OpeningBook(self.path) as opening_book:
+            book.build_book(opening_book, board.Board(4, 4, 3), 0, 1)
+        with self.assertRaises(ValueError):
+            book.solver.SolutionTable(self.path)
+
+
+class TestBookPlayer(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        path = os.path.join(self.directory.name, "openings.c4b")
+        self.opening_book = book.OpeningBook(path)
+        self.opening_book.write(board.Board(), {board.Board().get_key(): (5, 0)})
+
+    def tearDown(self):
+        self.opening_book.close()
+        self.directory.cleanup()
+
+    def test_plays_book_moves(self):
+        book_player = book.BookPlayer(
+            self.opening_book, selfplay.RandomPlayer(board.RED, seed=0)
+        )
+        self.assertEqual(book_player.player, board.RED)
+        self.assertEqual(book_player.search(board.Board(), board.RED), 5)
+        self.assertEqual(book_player.book_moves, 1)
+
+    def test_falls_back_to_searching(self):
+        book_player = book.BookPlayer(
+            self.opening_book, ai.ComputerPlayer(board.BLUE, depth=2)
+        )
+        board_, player = perft.get_position(7, 7, 4, [3])
+        self.assertEqual(
+            book_player.search(board_, player),
+            ai.ComputerPlayer(board.BLUE, depth=2).search(board_, player),
+        )
+        self.assertEqual(book_player.book_moves, 0)
+
+    def test_falls_back_when_blue_opened(self):
+        book_player = book.BookPlayer(
+            self.opening_book, selfplay.RandomPlayer(board.BLUE, seed=0)
+        )
+        self.assertIsNotNone(book_player.search(board.Board(), board.BLUE))
+        self.assertEqual(book_player.book_moves, 0)
@@ -1,109 +1,88 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import threading
 import unittest
+import unittest.mock
 
 import pygame
 
+import ai
+import board
 import game
+import records
 
 
-class TestGetGrid(unittest.TestCase):
-
-    @classmethod
-    def setUpClass(cls):
-        cls.game = game.Game()
-        cls.game.get_grid()
+class FailingPlayer:
 
-    def test_get_grid_fills_grid_with_lists(self):
-        for item in self.game.grid:
-            self.assertIsInstance(item, list)
-
-    def test_lists_in_grid_contain_dicts(self):
-        for list_ in self.game.grid:
-            for item in list_:
-                self.assertIsInstance(item, dict)
-
-    def test_dicts_in_lists_contain_expected_keys(self):
-        for list_ in self.game.grid:
-            for dict_ in list_:
-                self.assertIn("color", dict_)
-                self.assertIn("rect", dict_)
-
-    def test_dicts_in_lists_contain_expected_values(self):
-        for list_ in self.game.grid:
-            for dict_ in list_:
-                self.assertEqual(dict_["color"], self.game.black)
-                self.assertIsInstance(dict_["rect"], pygame.Rect)
-
-    def test_grid_has_expected_number_of_columns(self):
-        expected_number_of_columns = len(self.game.rect_locations)
-        self.assertEqual(len(self.game.grid), expected_number_of_columns)
-
-    def test_grid_has_expected_number_of_rows(self):
-        expected_number_of_rows = len(self.game.rect_locations)
-        for list_ in self.game.grid:
-            self.assertEqual(len(list_), expected_number_of_rows)
-
-    def test_rects_in_dicts_are_the_expected_size_and_at_the_expected_location(self):
-        expected_size = (64, 64)
-        for list_, x in zip(self.game.grid, self.game.rect_locations):
-            for dict_, y in zip(list_, self.game.rect_locations):
-                self.assertEqual(dict_["rect"].size, expected_size)
-                self.assertEqual(dict_["rect"].x, x)
-                self.assertEqual(dict_["rect"].y, y)
+    player = board.BLUE
 
-    def test_get_grid_clears_grid(self):
-        grid = self.game.grid
-        self.game.get_grid()
-        self.assertEqual(grid, self.game.grid)
+    def search(self, board_, player, cancelled=None):
+        raise OverflowError("depth out of range")
 
 
-class TestColumnFull(unittest.TestCase):
+class TestGetGrid(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
         cls.game = game.Game()
         cls.game.get_grid()
 
-    def test_column_full_returns_false_when_column_contains_all_black_disks(self):
-        self.assertFalse(self.game.column_full(column=self.game.grid[0]))
+    def test_board_has_expected_number_of_columns(self):
+        expected_number_of_columns = len(self.game.column_locations)
+        self.assertEqual(self.game.rules.board.columns, expected_number_of_columns)
 
-    def test_column_full_returns_false_when_column_contains_some_black_disks(self):
-        self.game.grid[0][-1]["color"] = self.game.red
-        self.game.grid[0][-2]["color"] = self.game.blue
-        self.assertFalse(self.game.column_full(column=self.game.grid[0]))
+    def test_board_has_expected_number_of_rows(self):
+        expected_number_of_rows = len(self.game.row_locations)
+        self.assertEqual(self.game.rules.board.rows, expected_number_of_rows)
 
-    def test_column_full_returns_true_when_column_contains_no_black_disks(self):
-        self.game.grid[0][-1]["color"] = self.game.red
-        self.game.grid[0][-2]["color"] = self.game.blue
-        self.game.grid[0][-3]["color"] = self.game.red
-        self.game.grid[0][-4]["color"] = self.game.blue
-        self.game.grid[0][-5]["color"] = self.game.red
-        self.game.grid[0][-6]["color"] = self.game.blue
-        self.game.grid[0][-7]["color"] = self.game.red
-        self.assertTrue(self.game.column_full(column=self.game.grid[0]))
+    def test_cell_rects_are_the_expected_size_and_at_the_expected_location(self):
+        expected_size = (64, 64)
+        for column_cell_rects, x in zip(
+            self.game.cell_rects, self.game.column_locations
+        ):
+            for cell_rect, y in zip(column_cell_rects, self.game.row_locations):
+                self.assertEqual(cell_rect.size, expected_size)
+                self.assertEqual(cell_rect.x, x)
+                self.assertEqual(cell_rect.y, y)
 
+    def test_get_grid_clears_grid(self):
+        self.game.rules.board.set_disk(0, 6, board.RED)
+        self.game.rules.board.set_disk(1, 6, board.BLUE)
+        self.game.rules.winning_disks = [(0, 6)]
+        self.game.get_grid()
+        for column in range(self.game.rules.board.columns):
+            for row in range(self.game.rules.board.rows):
+                self.assertEqual(self.game.get_disk_color(column, row), self.game.black)
 
-class TestDropDiskInColumn(unittest.TestCase):
+
+class TestBoardDimensions(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.game = game.Game()
-        cls.game.get_grid()
-        cls.column_length = len(cls.game.rect_locations)
+        cls.game = game.Game(columns=20, rows=20, connect=6)
 
-    def test_last_disk_in_column_that_is_red(self):
-        column = 0
-        self.game.current_players_disk_color = self.game.red
-        self.game.drop_disk_in_column(self.game.grid[column])
-        self.assertEqual(self.game.grid[column][-1]["color"], self.game.red)
+    def test_rules_use_the_dimensions(self):
+        self.assertEqual(self.game.rules.board.columns, 20)
+        self.assertEqual(self.game.rules.board.rows, 20)
+        self.assertEqual(self.game.rules.board.connect, 6)
 
-    def test_second_to_last_disk_in_column_is_blue(self):
-        column = 0
-        self.game.current_players_disk_color = self.game.blue
-        self.game.drop_disk_in_column(self.game.grid[column])
-        self.assertEqual(self.game.grid[column][-2]["color"], self.game.blue)
+    def test_grid_fits_in_the_same_space(self):
+        self.assertEqual(len(self.game.column_rects), 20)
+        self.assertEqual(self.game.cell_size, (22, 22))
+        for column_rect, column_cell_rects in zip(
+            self.game.column_rects, self.game.cell_rects
+        ):
+            self.assertEqual(len(column_cell_rects), 20)
+            self.assertEqual(column_rect.unionall(column_cell_rects), column_rect)
+        self.assertLessEqual(
+            self.game.column_rects[-1].right, self.game.refresh_button_rect.left
+        )
 
 
-class TestFourInARow(unittest.TestCase):
+class TestGetDiskColor(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
@@ -112,468 +91,43 @@ class TestFourInARow(unittest.TestCase):
     def setUp(self):
         self.game.get_grid()
 
-    def test_returns_none_when_grid_is_empty(self):
-        self.assertIs(self.game.four_in_a_row(), None)
-
-    def test_returns_none_when_grid_is_not_empty_but_has_no_four_in_a_row(self):
-        self.game.grid[0][0]["color"] = self.game.red
-        self.game.grid[0][6]["color"] = self.game.red
-        self.game.grid[6][-6]["color"] = self.game.red
-        self.game.grid[6][0]["color"] = self.game.red
-        self.assertIs(self.game.four_in_a_row(), None)
-
-    def test_returns_expected_disks_when_grid_has_4_horizontally_adjacent_of_the_same_color(
-        self,
-    ):
-        expected_disks = [
-            self.game.grid[0][-1],
-            self.game.grid[1][-1],
-            self.game.grid[2][-1],
-            self.game.grid[3][-1],
-        ]
-        self.game.grid[0][-1]["color"] = self.game.red
-        self.game.grid[1][-1]["color"] = self.game.red
-        self.game.grid[2][-1]["color"] = self.game.red
-        self.game.grid[3][-1]["color"] = self.game.red
-        self.assertEqual(self.game.four_in_a_row(), expected_disks)
-
-    def test_returns_expected_disks_when_grid_has_4_vertically_adjacent_disks_of_the_same_color(
-        self,
-    ):
-        expected_disks = [
-            self.game.grid[0][-4],
-            self.game.grid[0][-3],
-            self.game.grid[0][-2],
-            self.game.grid[0][-1],
-        ]
-        self.game.grid[0][-1]["color"] = self.game.red
-        self.game.grid[0][-2]["color"] = self.game.red
-        self.game.grid[0][-3]["color"] = self.game.red
-        self.game.grid[0][-4]["color"] = self.game.red
-        self.assertEqual(self.game.four_in_a_row(), expected_disks)
-
-    def test_returns_expected_disks_when_grid_has_4_diagonally_descending_adjacent_disks_of_the_same_color(
-        self,
-    ):
-        expected_disks = [
-            self.game.grid[0][-4],
-            self.game.grid[1][-3],
-            self.game.grid[2][-2],
-            self.game.grid[3][-1],
-        ]
-        self.game.grid[0][-4]["color"] = self.game.red
-        self.game.grid[1][-3]["color"] = self.game.red
-        self.game.grid[2][-2]["color"] = self.game.red
-        self.game.grid[3][-1]["color"] = self.game.red
-        self.assertEqual(self.game.four_in_a_row(), expected_disks)
-
-    def test_returns_expected_disks_when_grid_has_4_diagonally_ascending_adjacent_disks_of_the_same_color(
-        self,
-    ):
-        expected_disks = [
-            self.game.grid[0][-1],
-            self.game.grid[1][-2],
-            self.game.grid[2][-3],
-            self.game.grid[3][-4],
-        ]
-        self.game.grid[0][-1]["color"] = self.game.red
-        self.game.grid[1][-2]["color"] = self.game.red
-        self.game.grid[2][-3]["color"] = self.game.red
-        self.game.grid[3][-4]["color"] = self.game.red
-        self.assertEqual(self.game.four_in_a_row(), expected_disks)
+    def test_empty_cell_is_black(self):
+        self.assertEqual(self.game.get_disk_color(0, 6), self.game.black)
 
+    def test_disks_have_their_players_color(self):
+        self.game.rules.board.set_disk(0, 6, board.RED)
+        self.game.rules.board.set_disk(1, 6, board.BLUE)
+        self.assertEqual(self.game.get_disk_color(0, 6), self.game.red)
+        self.assertEqual(self.game.get_disk_color(1, 6), self.game.blue)
 
-class TestFourInARowHorizontal(unittest.TestCase):
-
-    @classmethod
-    def setUpClass(cls):
-        cls.game = game.Game()
-
-    def setUp(self):
-        self.game.get_grid()
-
-    def test_returns_none_when_grid_is_empty(self):
-        self.assertIs(self.game.four_in_a_row_horizontal(), None)
-
-    def test_returns_none_when_row_has_3_horizontally_adjacent_disks_of_the_same_color(
-        self,
-    ):
-        self.game.grid[0][-1]["color"] = self.game.blue
-        self.game.grid[1][-1]["color"] = self.game.blue
-        self.game.grid[2][-1]["color"] = self.game.blue
-        self.assertIs(self.game.four_in_a_row_horizontal(), None)
-
-    def test_returns_none_when_row_has_4_horizontally_adjacent_disks_of_different_colors(
-        self,
-    ):
-        self.game.grid[0][-1]["color"] = self.game.red
-        self.game.grid[1][-1]["color"] = self.game.blue
-        self.game.grid[2][-1]["color"] = self.game.red
-        self.game.grid[3][-1]["color"] = self.game.blue
-        self.assertIs(self.game.four_in_a_row_horizontal(), None)
-
-    def test_returns_expected_disks_when_row_has_4_horizontally_adjacent_disks_of_the_same_color(
-        self,
-    ):
-        expected_disks = [
-            self.game.grid[0][-1],
-            self.game.grid[1][-1],
-            self.game.grid[2][-1],
-            self.game.grid[3][-1],
-        ]
-        self.game.grid[0][-1]["color"] = self.game.red
-        self.game.grid[1][-1]["color"] = self.game.red
-        self.game.grid[2][-1]["color"] = self.game.red
-        self.game.grid[3][-1]["color"] = self.game.red
-        self.assertEqual(self.game.four_in_a_row_horizontal(), expected_disks)
-
-    def test_returns_expected_disks_row_has_4_horizontally_adjacent_disks_of_the_same_color_in_the_last_row(
-        self,
-    ):
-        expected_disks = [
-            self.game.grid[3][0],
-            self.game.grid[4][0],
-            self.game.grid[5][0],
-            self.game.grid[6][0],
-        ]
-        self.game.grid[3][0]["color"] = self.game.red
-        self.game.grid[4][0]["color"] = self.game.red
-        self.game.grid[5][0]["color"] = self.game.red
-        self.game.grid[6][0]["color"] = self.game.red
-        self.assertEqual(self.game.four_in_a_row_horizontal(), expected_disks)
-
-    def test_returns_expected_disks_when_row_has_4_horizontally_adjacent_disks_of_the_same_color_preceded_by_3_disks_of_varying_color(
-        self,
-    ):
-        expected_disks = [
-            self.game.grid[3][-1],
-            self.game.grid[4][-1],
-            self.game.grid[5][-1],
-            self.game.grid[6][-1],
-        ]
-        self.game.grid[0][-1]["color"] = self.game.red
-        self.game.grid[1][-1]["color"] = self.game.blue
-        self.game.grid[2][-1]["color"] = self.game.red
-        self.game.grid[3][-1]["color"] = self.game.blue
-        self.game.grid[4][-1]["color"] = self.game.blue
-        self.game.grid[5][-1]["color"] = self.game.blue
-        self.game.grid[6][-1]["color"] = self.game.blue
-        self.assertEqual(self.game.four_in_a_row_horizontal(), expected_disks)
-
-    def test_returns_none_when_one_row_has_2_disks_at_the_end_and_another_has_2_disks_at_the_beginning_of_the_same_color(
-        self,
-    ):
-        self.game.grid[5][0]["color"] = self.game.red
-        self.game.grid[6][0]["color"] = self.game.red
-        self.game.grid[0][1]["color"] = self.game.red
-        self.game.grid[1][1]["color"] = self.game.red
-        self.assertIs(self.game.four_in_a_row_horizontal(), None)
-
-    def test_returns_expected_disks_when_row_has_5_horizontally_adjacent_disks_of_the_same_color(
-        self,
-    ):
-        expected_disks = [
-            self.game.grid[0][-1],
-            self.game.grid[1][-1],
-            self.game.grid[2][-1],
-            self.game.grid[3][-1],
+    def test_winning_disks_are_green(self):
+        disks = [
+            (0, 1),
+            (0, 2),
+            (0, 3),
+            (0, 4),
         ]
-        self.game.grid[0][-1]["color"] = self.game.blue
-        self.game.grid[1][-1]["color"] = self.game.blue
-        self.game.grid[2][-1]["color"] = self.game.blue
-        self.game.grid[3][-1]["color"] = self.game.blue
-        self.game.grid[4][-1]["color"] = self.game.blue
-        self.assertEqual(self.game.four_in_a_row_horizontal(), expected_disks)
-
-    def test_returns_none_when_column_has_4_vertically_adjacent_disks_of_the_same_color(
-        self,
-    ):
-        self.game.grid[0][-1]["color"] = self.game.red
-        self.game.grid[0][-2]["color"] = self.game.red
-        self.game.grid[0][-3]["color"] = self.game.red
-        self.game.grid[0][-4]["color"] = self.game.red
-        self.assertIs(self.game.four_in_a_row_horizontal(), None)
-
-    def test_returns_none_when_grid_has_4_diagonally_descending_adjacent_disks_of_the_same_color(
-        self,
-    ):
-        self.game.grid[0][-4]["color"] = self.game.blue
-        self.game.grid[1][-3]["color"] = self.game.blue
-        self.game.grid[2][-2]["color"] = self.game.blue
-        self.game.grid[3][-1]["color"] = self.game.blue
-        self.assertIs(self.game.four_in_a_row_horizontal(), None)
-
-    def test_returns_none_when_grid_has_4_diagonally_ascending_adjacent_disks_of_the_same_color(
-        self,
-    ):
-        self.game.grid[0][-1]["color"] = self.game.blue
-        self.game.grid[1][-2]["color"] = self.game.blue
-        self.game.grid[2][-3]["color"] = self.game.blue
-        self.game.grid[3][-4]["color"] = self.game.blue
-        self.assertIs(self.game.four_in_a_row_horizontal(), None)
-
-
-class TestFourInARowVertical(unittest.TestCase):
+        self.game.rules.board.set_disk(0, 1, board.RED)
+        self.game.rules.board.set_disk(0, 2, board.BLUE)
+        self.game.rules.winning_disks = disks
+        for column, row in disks:
+            self.assertEqual(self.game.get_disk_color(column, row), self.game.green)
 
-    @classmethod
-    def setUpClass(cls):
-        cls.game = game.Game()
 
-    def setUp(self):
-        self.game.get_grid()
-
-    def test_returns_none_when_grid_is_empty(self):
-        self.assertIs(self.game.four_in_a_row_vertical(), None)
-
-    def test_returns_none_when_column_has_3_vertically_adjacent_disks_of_the_same_color(
-        self,
-    ):
-        self.game.grid[0][-1]["color"] = self.game.blue
-        self.game.grid[0][-2]["color"] = self.game.blue
-        self.game.grid[0][-3]["color"] = self.game.blue
-        self.assertIs(self.game.four_in_a_row_vertical(), None)
-
-    def test_returns_none_when_column_has_4_vertically_adjacent_disks_of_different_colors(
-        self,
-    ):
-        self.game.grid[0][-1]["color"] = self.game.red
-        self.game.grid[0][-2]["color"] = self.game.blue
-        self.game.grid[0][-3]["color"] = self.game.red
-        self.game.grid[0][-4]["color"] = self.game.blue
-        self.assertIs(self.game.four_in_a_row_vertical(), None)
-
-    def test_returns_expected_disks_when_column_has_4_vertically_adjacent_disks_of_the_same_color(
-        self,
-    ):
-        expected_disks = [
-            self.game.grid[0][-4],
-            self.game.grid[0][-3],
-            self.game.grid[0][-2],
-            self.game.grid[0][-1],
-        ]
-        self.game.grid[0][-1]["color"] = self.game.red
-        self.game.grid[0][-2]["color"] = self.game.red
-        self.game.grid[0][-3]["color"] = self.game.red
-        self.game.grid[0][-4]["color"] = self.game.red
-        self.assertEqual(self.game.four_in_a_row_vertical(), expected_disks)
-
-    def test_returns_expected_disks_when_column_has_4_vertically_adjacent_disks_of_the_same_color_in_the_last_column(
-        self,
-    ):
-        expected_disks = [
-            self.game.grid[6][-4],
-            self.game.grid[6][-3],
-            self.game.grid[6][-2],
-            self.game.grid[6][-1],
-        ]
-        self.game.grid[6][-1]["color"] = self.game.red
-        self.game.grid[6][-2]["color"] = self.game.red
-        self.game.grid[6][-3]["color"] = self.game.red
-        self.game.grid[6][-4]["color"] = self.game.red
-        self.assertEqual(self.game.four_in_a_row_vertical(), expected_disks)
-
-    def test_returns_expected_disks_when_column_has_4_vertically_adjacent_disks_of_the_same_color_preceded_by_3_disks_of_varying_color(
-        self,
-    ):
-        expected_disks = [
-            self.game.grid[0][-7],
-            self.game.grid[0][-6],
-            self.game.grid[0][-5],
-            self.game.grid[0][-4],
-        ]
-        self.game.grid[0][-1]["color"] = self.game.red
-        self.game.grid[0][-2]["color"] = self.game.blue
-        self.game.grid[0][-3]["color"] = self.game.red
-        self.game.grid[0][-4]["color"] = self.game.blue
-        self.game.grid[0][-5]["color"] = self.game.blue
-        self.game.grid[0][-6]["color"] = self.game.blue
-        self.game.grid[0][-7]["color"] = self.game.blue
-        self.assertEqual(self.game.four_in_a_row_vertical(), expected_disks)
-
-    def test_returns_none_when_one_column_has_2_disks_on_the_bottom_and_another_has_2_disks_on_the_top_of_the_same_color(
-        self,
-    ):
-        self.game.grid[0][-1]["color"] = self.game.red
-        self.game.grid[0][-2]["color"] = self.game.red
-        self.game.grid[1][0]["color"] = self.game.red
-        self.game.grid[1][1]["color"] = self.game.red
-        self.assertIs(self.game.four_in_a_row_vertical(), None)
-
-    def test_returns_expected_disks_when_column_has_5_vertically_adjacent_disks_of_the_same_color(
-        self,
-    ):
-        expected_disks = [
-            self.game.grid[0][-5],
-            self.game.grid[0][-4],
-            self.game.grid[0][-3],
-            self.game.grid[0][-2],
-        ]
-        self.game.grid[0][-1]["color"] = self.game.blue
-        self.game.grid[0][-2]["color"] = self.game.blue
-        self.game.grid[0][-3]["color"] = self.game.blue
-        self.game.grid[0][-4]["color"] = self.game.blue
-        self.game.grid[0][-5]["color"] = self.game.blue
-        self.assertEqual(self.game.four_in_a_row_vertical(), expected_disks)
-
-    def test_returns_none_when_row_has_4_horizontally_adjacent_disks_of_the_same_color(
-        self,
-    ):
-        self.game.grid[0][-1]["color"] = self.game.red
-        self.game.grid[1][-1]["color"] = self.game.red
-        self.game.grid[2][-1]["color"] = self.game.red
-        self.game.grid[3][-1]["color"] = self.game.red
-        self.assertIs(self.game.four_in_a_row_vertical(), None)
-
-    def test_returns_none_when_grid_has_4_diagonally_descending_adjacent_disks_of_the_same_color(
-        self,
-    ):
-        self.game.grid[0][-4]["color"] = self.game.blue
-        self.game.grid[1][-3]["color"] = self.game.blue
-        self.game.grid[2][-2]["color"] = self.game.blue
-        self.game.grid[3][-1]["color"] = self.game.blue
-        self.assertIs(self.game.four_in_a_row_vertical(), None)
-
-    def test_returns_none_when_grid_has_4_diagonally_ascending_adjacent_disks_of_the_same_color(
-        self,
-    ):
-        self.game.grid[0][-1]["color"] = self.game.blue
-        self.game.grid[1][-2]["color"] = self.game.blue
-        self.game.grid[2][-3]["color"] = self.game.blue
-        self.game.grid[3][-4]["color"] = self.game.blue
-        self.assertIs(self.game.four_in_a_row_vertical(), None)
-
-
-class TestFourInARowDiagonalDescending(unittest.TestCase):
+class TestCurrentPlayersDiskColor(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
         cls.game = game.Game()
 
-    def setUp(self):
-        self.game.get_grid()
+    def test_follows_the_current_player(self):
+        self.game.rules.current_player = board.RED
+        self.assertEqual(self.game.current_players_disk_color, self.game.red)
+        self.game.rules.current_player = board.BLUE
+        self.assertEqual(self.game.current_players_disk_color, self.game.blue)
 
-    def test_returns_none_when_grid_is_empty(self):
-        self.assertIsNone(self.game.four_in_a_row_diagonal_descending())
-
-    def test_returns_none_when_grid_has_3_diagonally_adjacent_disks_of_the_same_color(
-        self,
-    ):
-        self.game.grid[0][-3]["color"] = self.game.blue
-        self.game.grid[1][-2]["color"] = self.game.blue
-        self.game.grid[2][-1]["color"] = self.game.blue
-        self.assertIsNone(self.game.four_in_a_row_diagonal_descending())
-
-    def test_returns_none_when_grid_has_4_diagonally_adjacent_disks_of_different_colors(
-        self,
-    ):
-        self.game.grid[0][-4]["color"] = self.game.red
-        self.game.grid[1][-3]["color"] = self.game.blue
-        self.game.grid[2][-2]["color"] = self.game.red
-        self.game.grid[3][-1]["color"] = self.game.blue
-        self.assertIsNone(self.game.four_in_a_row_diagonal_descending())
-
-    def test_returns_true_expected_disks_grid_has_4_diagonally_adjacent_disks_of_the_same_color(
-        self,
-    ):
-        expected_disks = [
-            self.game.grid[0][-4],
-            self.game.grid[1][-3],
-            self.game.grid[2][-2],
-            self.game.grid[3][-1],
-        ]
-        self.game.grid[0][-4]["color"] = self.game.red
-        self.game.grid[1][-3]["color"] = self.game.red
-        self.game.grid[2][-2]["color"] = self.game.red
-        self.game.grid[3][-1]["color"] = self.game.red
-        self.assertEqual(self.game.four_in_a_row_diagonal_descending(), expected_disks)
-
-    def test_returns_expected_disks_when_grid_has_4_diagonally_adjacent_disks_of_the_same_color_in_the_last_columns_and_rows(
-        self,
-    ):
-        expected_disks = [
-            self.game.grid[3][-4],
-            self.game.grid[4][-3],
-            self.game.grid[5][-2],
-            self.game.grid[6][-1],
-        ]
-        self.game.grid[3][-4]["color"] = self.game.red
-        self.game.grid[4][-3]["color"] = self.game.red
-        self.game.grid[5][-2]["color"] = self.game.red
-        self.game.grid[6][-1]["color"] = self.game.red
-        self.assertEqual(self.game.four_in_a_row_diagonal_descending(), expected_disks)
-
-    def test_returns_expected_disks_when_grid_has_4_diagonally_adjacent_disks_of_the_same_color_preceded_by_3_disks_of_varying_color(
-        self,
-    ):
-        expected_disks = [
-            self.game.grid[3][-4],
-            self.game.grid[4][-3],
-            self.game.grid[5][-2],
-            self.game.grid[6][-1],
-        ]
-        self.game.grid[0][-7]["color"] = self.game.red
-        self.game.grid[1][-6]["color"] = self.game.blue
-        self.game.grid[2][-5]["color"] = self.game.red
-        self.game.grid[3][-4]["color"] = self.game.blue
-        self.game.grid[4][-3]["color"] = self.game.blue
-        self.game.grid[5][-2]["color"] = self.game.blue
-        self.game.grid[6][-1]["color"] = self.game.blue
-        self.assertEqual(self.game.four_in_a_row_diagonal_descending(), expected_disks)
-
-    def test_returns_none_when_the_first_two_columns_have_2_disks_on_the_bottom_and_the_last_two_have_2_disks_on_the_top_of_the_same_color(
-        self,
-    ):
-        self.game.grid[2][-5]["color"] = self.game.red
-        self.game.grid[3][-4]["color"] = self.game.red
-        self.game.grid[1][-7]["color"] = self.game.red
-        self.game.grid[2][-6]["color"] = self.game.red
-        self.assertIsNone(self.game.four_in_a_row_diagonal_descending())
-
-    def test_returns_expected_disks_when_grid_has_5_diagonally_adjacent_disks_of_the_same_color(
-        self,
-    ):
-        expected_disks = [
-            self.game.grid[0][-5],
-            self.game.grid[1][-4],
-            self.game.grid[2][-3],
-            self.game.grid[3][-2],
-        ]
-        self.game.grid[0][-5]["color"] = self.game.blue
-        self.game.grid[1][-4]["color"] = self.game.blue
-        self.game.grid[2][-3]["color"] = self.game.blue
-        self.game.grid[3][-2]["color"] = self.game.blue
-        self.game.grid[4][-1]["color"] = self.game.blue
-        self.assertEqual(self.game.four_in_a_row_diagonal_descending(), expected_disks)
-
-    def test_returns_none_when_row_has_4_horizontally_adjacent_disks_of_the_same_color(
-        self,
-    ):
-        self.game.grid[0][-1]["color"] = self.game.red
-        self.game.grid[1][-1]["color"] = self.game.red
-        self.game.grid[2][-1]["color"] = self.game.red
-        self.game.grid[3][-1]["color"] = self.game.red
-        self.assertIsNone(self.game.four_in_a_row_diagonal_descending())
-
-    def test_returns_none_when_column_has_4_vertically_adjacent_disks_of_the_same_color(
-        self,
-    ):
-        self.game.grid[0][-1]["color"] = self.game.red
-        self.game.grid[0][-2]["color"] = self.game.red
-        self.game.grid[0][-3]["color"] = self.game.red
-        self.game.grid[0][-4]["color"] = self.game.red
-        self.assertIsNone(self.game.four_in_a_row_diagonal_descending())
-
-    def test_returns_none_when_grid_has_4_diagonally_ascending_adjacent_disks_of_the_same_color(
-        self,
-    ):
-        self.game.grid[0][-1]["color"] = self.game.blue
-        self.game.grid[1][-2]["color"] = self.game.blue
-        self.game.grid[2][-3]["color"] = self.game.blue
-        self.game.grid[3][-4]["color"] = self.game.blue
-        self.assertIsNone(self.game.four_in_a_row_diagonal_descending())
-
-
-class TestFourInARowDiagonalAscending(unittest.TestCase):
+
+class TestRender(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
@@ -581,192 +135,245 @@ class TestFourInARowDiagonalAscending(unittest.TestCase):
 
     def setUp(self):
         self.game.get_grid()
-
-    def test_returns_none_when_grid_is_empty(self):
-        self.assertIs(self.game.four_in_a_row_diagonal_ascending(), None)
-
-    def test_returns_none_when_grid_has_3_diagonally_adjacent_disks_of_the_same_color(
-        self,
-    ):
-        self.game.grid[0][-1]["color"] = self.game.blue
-        self.game.grid[1][-2]["color"] = self.game.blue
-        self.game.grid[2][-3]["color"] = self.game.blue
-        self.assertIs(self.game.four_in_a_row_diagonal_ascending(), None)
-
-    def test_returns_none_when_grid_has_4_diagonally_adjacent_disks_of_different_colors(
-        self,
-    ):
-        self.game.grid[0][-1]["color"] = self.game.red
-        self.game.grid[1][-2]["color"] = self.game.blue
-        self.game.grid[2][-3]["color"] = self.game.red
-        self.game.grid[3][-4]["color"] = self.game.blue
-        self.assertIs(self.game.four_in_a_row_diagonal_ascending(), None)
-
-    def test_returns_expected_disks_when_grid_has_4_diagonally_adjacent_disks_of_the_same_color(
-        self,
-    ):
-        expected_disks = [
-            self.game.grid[0][-1],
-            self.game.grid[1][-2],
-            self.game.grid[2][-3],
-            self.game.grid[3][-4],
-        ]
-        self.game.grid[0][-1]["color"] = self.game.red
-        self.game.grid[1][-2]["color"] = self.game.red
-        self.game.grid[2][-3]["color"] = self.game.red
-        self.game.grid[3][-4]["color"] = self.game.red
-        self.assertEqual(self.game.four_in_a_row_diagonal_ascending(), expected_disks)
-
-    def test_returns_expected_disks_when_grid_has_4_diagonally_adjacent_disks_of_the_same_color_in_the_last_columns_and_rows(
-        self,
-    ):
-        expected_disks = [
-            self.game.grid[3][-1],
-            self.game.grid[4][-2],
-            self.game.grid[5][-3],
-            self.game.grid[6][-4],
-        ]
-        self.game.grid[3][-1]["color"] = self.game.red
-        self.game.grid[4][-2]["color"] = self.game.red
-        self.game.grid[5][-3]["color"] = self.game.red
-        self.game.grid[6][-4]["color"] = self.game.red
-        self.assertEqual(self.game.four_in_a_row_diagonal_ascending(), expected_disks)
-
-    def test_returns_expected_disks_when_grid_has_4_diagonally_adjacent_disks_of_the_same_color_preceded_by_3_disks_of_varying_color(
-        self,
-    ):
-        expected_disks = [
-            self.game.grid[3][-4],
-            self.game.grid[4][-5],
-            self.game.grid[5][-6],
-            self.game.grid[6][-7],
-        ]
-        self.game.grid[0][-1]["color"] = self.game.red
-        self.game.grid[1][-2]["color"] = self.game.blue
-        self.game.grid[2][-3]["color"] = self.game.red
-        self.game.grid[3][-4]["color"] = self.game.blue
-        self.game.grid[4][-5]["color"] = self.game.blue
-        self.game.grid[5][-6]["color"] = self.game.blue
-        self.game.grid[6][-7]["color"] = self.game.blue
-        self.assertTrue(self.game.four_in_a_row_diagonal_ascending())
-
-    def test_returns_none_when_the_first_two_columns_have_2_disks_on_the_top_and_the_last_two_have_2_disks_on_the_bottom_of_the_same_color(
-        self,
-    ):
-        self.game.grid[2][-6]["color"] = self.game.red
-        self.game.grid[3][-7]["color"] = self.game.red
-        self.game.grid[1][-4]["color"] = self.game.red
-        self.game.grid[2][-5]["color"] = self.game.red
-        self.assertIs(self.game.four_in_a_row_diagonal_ascending(), None)
-
-    def test_returns_expected_disks_when_grid_has_5_diagonally_adjacent_disks_of_the_same_color(
-        self,
-    ):
-        expected_disks = [
-            self.game.grid[0][-1],
-            self.game.grid[1][-2],
-            self.game.grid[2][-3],
-            self.game.grid[3][-4],
-        ]
-        self.game.grid[0][-1]["color"] = self.game.blue
-        self.game.grid[1][-2]["color"] = self.game.blue
-        self.game.grid[2][-3]["color"] = self.game.blue
-        self.game.grid[3][-4]["color"] = self.game.blue
-        self.game.grid[4][-5]["color"] = self.game.blue
-        self.assertTrue(self.game.four_in_a_row_diagonal_ascending())
-
-    def test_returns_none_when_row_has_4_horizontally_adjacent_disks_of_the_same_color(
-        self,
-    ):
-        self.game.grid[0][-1]["color"] = self.game.red
-        self.game.grid[1][-1]["color"] = self.game.red
-        self.game.grid[2][-1]["color"] = self.game.red
-        self.game.grid[3][-1]["color"] = self.game.red
-        self.assertIs(self.game.four_in_a_row_diagonal_ascending(), None)
-
-    def test_returns_none_when_column_has_4_vertically_adjacent_disks_of_the_same_color(
-        self,
-    ):
-        self.game.grid[0][-1]["color"] = self.game.red
-        self.game.grid[0][-2]["color"] = self.game.red
-        self.game.grid[0][-3]["color"] = self.game.red
-        self.game.grid[0][-4]["color"] = self.game.red
-        self.assertIs(self.game.four_in_a_row_diagonal_ascending(), None)
-
-    def test_returns_none_when_grid_has_4_diagonally_descending_adjacent_disks_of_the_same_color(
-        self,
-    ):
-        self.game.grid[0][-4]["color"] = self.game.blue
-        self.game.grid[1][-3]["color"] = self.game.blue
-        self.game.grid[2][-2]["color"] = self.game.blue
-        self.game.grid[3][-1]["color"] = self.game.blue
-        self.assertIs(self.game.four_in_a_row_diagonal_ascending(), None)
-
-
-class TestColorDisksGreen(unittest.TestCase):
+        self.game.rect_to_highlight = None
+        self.game.redraw_all = True
+        self.game.render()
+
+    def test_first_frame_updates_the_whole_window(self):
+        self.assertEqual(self.game.dirty_rects, [self.game.displaysurf.get_rect()])
+
+    def test_unchanged_frame_updates_nothing(self):
+        self.game.render()
+        self.assertEqual(self.game.dirty_rects, [])
+
+    def test_dropped_disk_updates_only_its_cell(self):
+        self.game.rules.drop_disk_in_column(2)
+        self.game.render()
+        self.assertEqual(self.game.dirty_rects, [self.game.cell_rects[2][6]])
+
+    def test_moving_the_highlight_updates_the_old_and_new_rects(self):
+        self.game.rect_to_highlight = self.game.column_rects[0]
+        self.game.render()
+        self.game.rect_to_highlight = self.game.refresh_button_rect
+        self.game.render()
+        self.assertEqual(
+            self.game.dirty_rects,
+            [self.game.column_rects[0], self.game.refresh_button_rect],
+        )
+
+    def test_score_change_updates_the_score_rects(self):
+        self.game.rules.red_score += 1
+        self.game.render()
+        self.assertEqual(
+            self.game.dirty_rects, [self.game.red_score_rect, self.game.blue_score_rect]
+        )
+
+
+class TestGetHighlightLayer(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
         cls.game = game.Game()
-        cls.game.get_grid()
 
-    def test_disks_become_green(self):
-        disks = [
-            self.game.grid[0][1],
-            self.game.grid[0][2],
-            self.game.grid[0][3],
-            self.game.grid[0][4],
-        ]
-        self.game.grid[0][1]["color"] = self.game.red
-        self.game.grid[0][2]["color"] = self.game.blue
-        self.game.color_disks_green(disks)
-        for disk in disks:
-            self.assertEqual(disk["color"], self.game.green)
+    def test_layer_is_rendered_once_per_rect_and_color(self):
+        rect = self.game.column_rects[0]
+        layer = self.game.get_highlight_layer(rect, self.game.red)
+        self.assertIs(self.game.get_highlight_layer(rect, self.game.red), layer)
+        self.assertIsNot(self.game.get_highlight_layer(rect, self.game.blue), layer)
 
+    def test_layer_has_the_size_of_its_rect(self):
+        rect = self.game.refresh_button_rect
+        layer = self.game.get_highlight_layer(rect, self.game.red)
+        self.assertEqual(layer.get_size(), rect.size)
 
-class TestIncrementScore(unittest.TestCase):
-
-    @classmethod
-    def setUpClass(cls):
-        cls.game = game.Game()
-
-    def setUp(self):
-        self.game.red_score = 0
-        self.game.blue_score = 0
-
-    def test_red_score_is_incremented(self):
-        self.game.current_players_disk_color = self.game.red
-        self.game.increment_score()
-        self.assertEqual(self.game.red_score, 1)
-
-    def test_blue_score_is_incremented(self):
-        self.game.current_players_disk_color = self.game.blue
-        self.game.increment_score()
-        self.assertEqual(self.game.blue_score, 1)
-
-    def test_red_score_is_not_incremented(self):
-        self.game.current_players_disk_color = self.game.blue
-        self.game.increment_score()
-        self.assertEqual(self.game.red_score, 0)
-
-    def test_blue_score_is_not_incremented(self):
-        self.game.current_players_disk_color = self.game.red
-        self.game.increment_score()
-        self.assertEqual(self.game.blue_score, 0)
 
-
-class TestSwapCurrentPlayersDiskColor(unittest.TestCase):
+class TestComputerPlayer(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.game = game.Game()
+        cls.game = game.Game(computer_players=[ai.ComputerPlayer(board.BLUE, depth=2)])
 
-    def test_disk_color_becomes_blue(self):
-        self.game.current_players_disk_color = self.game.red
-        self.game.swap_current_players_disk_color()
-        self.assertEqual(self.game.current_players_disk_color, self.game.blue)
+    def setUp(self):
+        self.game.get_grid()
+        self.game.rules.current_player = board.RED
+
+    def test_computer_answers_a_human_move(self):
+        self.game.input_manager.cursor_location = self.game.column_rects[0].center
+        self.game.input_manager.mouse[1] = self.game.input_manager.pressed
+        self.game.handle_input()
+        self.game.input_manager.mouse[1] = self.game.input_manager.held
+        self.game.search.thread.join()
+        self.game.handle_input()
+        self.assertEqual(self.game.rules.current_player, board.RED)
+        self.assertEqual(sum(self.game.rules.board.heights), 2)
+
+    def test_get_grid_cancels_the_search(self):
+        self.game.rules.current_player = board.BLUE
+        self.game.handle_input()
+        search = self.game.search
+        self.game.get_grid()
+        self.assertIsNone(self.game.search)
+        self.assertTrue(search.cancelled.is_set())
+        self.assertFalse(search.thread.is_alive())
+
+    def test_failed_search_plays_the_first_open_column(self):
+        self.game.rules.current_player = board.BLUE
+        self.game.computer_players[board.BLUE] = FailingPlayer()
+        try:
+            with unittest.mock.patch.object(threading, "excepthook"):
+                self.game.handle_input()
+                self.game.search.thread.join()
+            self.game.handle_input()
+        finally:
+            self.game.computer_players[board.BLUE] = ai.ComputerPlayer(
+                board.BLUE, depth=2
+            )
+        self.assertEqual(self.game.rules.board.get_disk(0, 6), board.BLUE)
+
+    def test_computer_is_to_move_only_on_its_turn_while_the_game_is_on(self):
+        self.assertFalse(self.game.computer_to_move())
+        self.game.rules.current_player = board.BLUE
+        self.assertTrue(self.game.computer_to_move())
+        self.game.rules.game_over = True
+        self.assertFalse(self.game.computer_to_move())
+
+
+class TestRecorder(unittest.TestCase):
+
+    def test_records_each_game_as_it_is_played(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "games.c4")
+            game_ = game.Game(recorder=records.GameWriter(path))
+            for column in (0, 1, 0, 1, 0, 1, 0):
+                game_.play_column(column)
+            self.assertTrue(game_.rules.game_over)
+            game_.get_grid()
+            game_.play_column(3)
+            game_.get_grid()
+            game_.recorder.close()
+            records_ = list(records.read_games(path))
+        self.assertEqual(
+            [record.moves for record in records_],
+            [bytes((0, 1, 0, 1, 0, 1, 0)), bytes((3,))],
+        )
+        self.assertEqual((records_[0].red, records_[0].blue), ("human", "human"))
+
+    def test_replays_a_game_blue_opened(self):
+        # Red wins the first game, so blue opens and wins the second.
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "games.c4")
+            game_ = game.Game(recorder=records.GameWriter(path))
+            for column in (0, 1, 0, 1, 0, 1, 0):
+                game_.play_column(column)
+            game_.get_grid()
+            for column in (0, 1, 0, 1, 0, 1, 0):
+                game_.play_column(column)
+            self.assertEqual((game_.rules.red_score, game_.rules.blue_score), (1, 1))
+            game_.recorder.close()
+            records_ = list(records.read_games(path))
+        self.assertEqual(
+            [record.first_player for record in records_], [board.RED, board.BLUE]
+        )
+        scores = [
+            (game_rules.red_score, game_rules.blue_score)
+            for game_rules in (record.replay() for record in records_)
+        ]
+        self.assertEqual(scores, [(1, 0), (0, 1)])
+
+    def test_taken_back_moves_are_not_recorded(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "games.c4")
+            game_ = game.Game(recorder=records.GameWriter(path))
+            for column in (0, 1, 0, 1, 0, 1, 0):
+                game_.play_column(column)
+            game_.take_back_move()
+            game_.take_back_move()
+            game_.play_column(6)
+            game_.take_back_move()
+            game_.redo_move()
+            game_.get_grid()
+            game_.recorder.close()
+            records_ = list(records.read_games(path))
+        self.assertEqual(
+            [record.moves for record in records_],
+            [bytes((0, 1, 0, 1, 0, 1, 0)), bytes((0, 1, 0, 1, 0, 6))],
+        )
+
+
+class TestTakeBack(unittest.TestCase):
 
-    def test_disk_color_becomes_red(self):
-        self.game.current_players_disk_color = self.game.blue
-        self.game.swap_current_players_disk_color()
-        self.assertEqual(self.game.current_players_disk_color, self.game.red)
+    def setUp(self):
+        self.game = game.Game()
+
+    def click(self, rect):
+        self.game.input_manager.cursor_location = rect.center
+        self.game.input_manager.mouse[1] = self.game.input_manager.pressed
+        self.game.handle_input()
+        self.game.input_manager.mouse[1] = self.game.input_manager.held
+
+    def test_buttons_undo_and_redo_a_move(self):
+        self.click(self.game.column_rects[3])
+        self.click(self.game.undo_button_rect)
+        self.assertEqual(self.game.rules.board.heights[3], 0)
+        self.assertEqual(self.game.rules.current_player, board.RED)
+        self.assertEqual(self.game.rect_to_highlight, self.game.undo_button_rect)
+        self.click(self.game.redo_button_rect)
+        self.assertEqual(self.game.rules.board.get_disk(3, 6), board.RED)
+
+    def test_takes_back_the_computer_reply_too(self):
+        self.game.computer_players = {
+            board.BLUE: ai.ComputerPlayer(board.BLUE, depth=2)
+        }
+        self.game.play_column(3)
+        self.game.play_column(2)
+        self.game.take_back_move()
+        self.assertEqual(sum(self.game.rules.board.heights), 0)
+        self.assertEqual(self.game.rules.current_player, board.RED)
+        self.game.redo_move()
+        self.assertEqual(self.game.rules.board.heights[2:4], [1, 1])
+        self.assertEqual(self.game.rules.current_player, board.RED)
+
+    def test_move_buttons_have_highlight_layers(self):
+        for rect, _ in self.game.move_buttons:
+            layer = self.game.get_highlight_layer(rect, self.game.red)
+            self.assertEqual(layer.get_size(), rect.size)
+
+
+class TestReplayInput(unittest.TestCase):
+
+    def test_replays_a_recorded_session_and_reports_timings(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "input.json")
+            game_ = game.Game()
+            center = game_.column_rects[2].center
+            frames = [
+                [[pygame.MOUSEMOTION, {"pos": center}]],
+                [[pygame.MOUSEBUTTONDOWN, {"button": 1, "pos": center}]],
+                [[pygame.MOUSEBUTTONUP, {"button": 1, "pos": center}]],
+                [],
+            ]
+            with open(path, "w") as file:
+                json.dump(frames, file)
+            game_.replay_input(path)
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output), self.assertRaises(SystemExit):
+                game_.main()
+        self.assertEqual(game_.rules.board.get_disk(2, 6), board.RED)
+        self.assertEqual(game_.profiler.frames, len(frames))
+        self.assertIn("frames:         4", output.getvalue())
+        self.assertIn("render:", output.getvalue())
+
+
+class TestProfiling(unittest.TestCase):
+
+    def test_draw_calls_are_only_timed_once_enabled(self):
+        game_ = game.Game()
+        self.assertNotIn("draw_disks", vars(game_))
+        game_.enable_profiling(overlay=True)
+        game_.render()
+        self.assertEqual(len(game_.profiler.samples["draw_disks"]), 1)
+        self.assertEqual(len(game_.profiler.samples["draw_profiler_overlay"]), 1)
+        self.assertEqual(
+            list(game_.profiler.samples)[:4],
+            ["get_input", "handle_input", "render", "tick"],
+        )
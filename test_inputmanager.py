@@ -0,0 +1,131 @@
+import os
+import tempfile
+import unittest
+
+import pygame
+
+import inputmanager
+
+
+class TestWaitForEvents(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+
+    def setUp(self):
+        pygame.event.clear()
+        self.input_manager = inputmanager.InputManager()
+
+    def test_returns_no_events_when_the_timeout_expires(self):
+        self.input_manager.wait_for_events(timeout=1)
+        self.assertEqual(self.input_manager.events, [])
+
+    def test_returns_every_pending_event(self):
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a))
+        pygame.event.post(pygame.event.Event(pygame.KEYUP, key=pygame.K_a))
+        self.input_manager.wait_for_events(timeout=1)
+        self.assertEqual(
+            [event.type for event in self.input_manager.events],
+            [pygame.KEYDOWN, pygame.KEYUP],
+        )
+
+
+class TestDispatchEvents(unittest.TestCase):
+
+    def setUp(self):
+        self.input_manager = inputmanager.InputManager()
+
+    def dispatch(self, *events):
+        self.input_manager.events = list(events)
+        self.input_manager.dispatch_events()
+
+    def test_quit_event_sets_quit(self):
+        self.dispatch(pygame.event.Event(pygame.QUIT))
+        self.assertTrue(self.input_manager.quit)
+
+    def test_expose_event_sets_exposed_for_one_frame(self):
+        self.dispatch(pygame.event.Event(pygame.VIDEOEXPOSE))
+        self.assertTrue(self.input_manager.exposed)
+        self.dispatch()
+        self.assertFalse(self.input_manager.exposed)
+
+    def test_mouse_motion_moves_the_cursor(self):
+        self.dispatch(pygame.event.Event(pygame.MOUSEMOTION, pos=(3, 4)))
+        self.assertEqual(self.input_manager.cursor_location, (3, 4))
+
+    def test_key_goes_from_pressed_to_held_to_released_to_gone(self):
+        self.dispatch(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a))
+        self.assertEqual(self.input_manager.keyboard[pygame.K_a], "pressed")
+        self.dispatch()
+        self.assertEqual(self.input_manager.keyboard[pygame.K_a], "held")
+        self.dispatch(pygame.event.Event(pygame.KEYUP, key=pygame.K_a))
+        self.assertEqual(self.input_manager.keyboard[pygame.K_a], "released")
+        self.dispatch()
+        self.assertNotIn(pygame.K_a, self.input_manager.keyboard)
+
+    def test_button_goes_from_pressed_to_held_to_released_to_gone(self):
+        self.dispatch(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1))
+        self.assertEqual(self.input_manager.mouse[1], "pressed")
+        self.dispatch()
+        self.assertEqual(self.input_manager.mouse[1], "held")
+        self.dispatch(pygame.event.Event(pygame.MOUSEBUTTONUP, button=1))
+        self.assertEqual(self.input_manager.mouse[1], "released")
+        self.dispatch()
+        self.assertNotIn(1, self.input_manager.mouse)
+
+    def test_held_keys_are_not_aged_again(self):
+        self.dispatch(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a))
+        self.dispatch()
+        self.assertEqual(self.input_manager.changed_keys, set())
+
+    def test_input_managers_do_not_share_state(self):
+        self.dispatch(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1))
+        self.assertEqual(inputmanager.InputManager().mouse, {})
+
+    def test_instances_have_no_dict(self):
+        with self.assertRaises(AttributeError):
+            self.input_manager.other = None
+
+
+class TestRecordAndReplay(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+
+    def setUp(self):
+        pygame.event.clear()
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "input.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_replays_the_recorded_frames_then_quits(self):
+        recorder = inputmanager.InputManager()
+        recorder.start_recording()
+        pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=(3, 4)))
+        recorder.get_events()
+        recorder.wait_for_events(timeout=1)
+        pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1))
+        recorder.get_events()
+        recorder.save_recording(self.path)
+
+        replayer = inputmanager.InputManager()
+        replayer.load_replay(self.path)
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a))
+        replayer.get_events()
+        replayer.dispatch_events()
+        self.assertEqual(replayer.cursor_location, (3, 4))
+        replayer.wait_for_events(timeout=1000)
+        self.assertEqual(replayer.events, [])
+        replayer.get_events()
+        replayer.dispatch_events()
+        self.assertEqual(replayer.mouse, {1: replayer.pressed})
+        self.assertEqual(replayer.keyboard, {})
+        replayer.get_events()
+        replayer.dispatch_events()
+        self.assertTrue(replayer.quit)
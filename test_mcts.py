@@ -0,0 +1,71 @@
+import threading
+import unittest
+
+import board
+import mcts
+import rules
+
+
+class TestChooseColumn(unittest.TestCase):
+
+    def setUp(self):
+        self.rules = rules.Rules()
+
+    def play(self, *columns):
+        for column in columns:
+            self.rules.play_column(column)
+
+    def test_takes_a_winning_move(self):
+        self.play(0, 6, 1, 6, 2, 5)
+        monte_carlo_player = mcts.MonteCarloPlayer(board.RED, time_budget=0.2, seed=1)
+        self.assertEqual(monte_carlo_player.choose_column(self.rules), 3)
+
+    def test_blocks_the_opponents_winning_move(self):
+        self.play(0, 6, 1, 6, 2)
+        monte_carlo_player = mcts.MonteCarloPlayer(board.BLUE, time_budget=0.2, seed=1)
+        self.assertEqual(monte_carlo_player.choose_column(self.rules), 3)
+
+    def test_does_not_change_the_board(self):
+        self.play(3, 3, 2)
+        disks = self.rules.board.disks[:]
+        mcts.MonteCarloPlayer(board.BLUE, time_budget=0.05).choose_column(self.rules)
+        self.assertEqual(self.rules.board.disks, disks)
+
+    def test_reports_playouts_per_second(self):
+        monte_carlo_player = mcts.MonteCarloPlayer(board.RED, time_budget=0.05)
+        monte_carlo_player.choose_column(self.rules)
+        self.assertGreater(monte_carlo_player.playouts, 0)
+        self.assertGreater(monte_carlo_player.playouts_per_second, 0)
+
+
+class TestSearch(unittest.TestCase):
+
+    def test_reuses_the_subtree_after_a_reply(self):
+        game_rules = rules.Rules()
+        monte_carlo_player = mcts.MonteCarloPlayer(board.RED, time_budget=0.1, seed=1)
+        column = monte_carlo_player.choose_column(game_rules)
+        game_rules.play_column(column)
+        reply = next(iter(monte_carlo_player.root.children[column].children))
+        subtree = monte_carlo_player.root.children[column].children[reply]
+        game_rules.play_column(reply)
+        monte_carlo_player.choose_column(game_rules)
+        self.assertIs(monte_carlo_player.root, subtree)
+        self.assertIsNone(subtree.parent)
+
+    def test_starts_a_new_tree_for_an_unrelated_position(self):
+        game_rules = rules.Rules()
+        monte_carlo_player = mcts.MonteCarloPlayer(board.RED, time_budget=0.05)
+        monte_carlo_player.choose_column(game_rules)
+        root = monte_carlo_player.root
+        game_rules.board.set_disk(0, 6, board.BLUE)
+        game_rules.board.set_disk(0, 5, board.BLUE)
+        monte_carlo_player.choose_column(game_rules)
+        self.assertIsNot(monte_carlo_player.root, root)
+
+    def test_returns_none_when_cancelled(self):
+        cancelled = threading.Event()
+        cancelled.set()
+        monte_carlo_player = mcts.MonteCarloPlayer(board.RED, time_budget=0.05)
+        self.assertIsNone(
+            monte_carlo_player.search(board.Board(), board.RED, cancelled)
+        )
@@ -0,0 +1,36 @@
+import unittest
+
+import perft
+
+
+class TestPerft(unittest.TestCase):
+
+    def test_matches_the_reference_counts(self):
+        board_, player = perft.get_position(7, 6, 4, [])
+        self.assertEqual(
+            perft.perft(board_, player, 6), perft.REFERENCE_COUNTS[(7, 6, 4)][:6]
+        )
+
+    def test_does_not_continue_past_a_win(self):
+        # Red wins by playing column 0 and blue must answer any other move.
+        board_, player = perft.get_position(7, 6, 4, [0, 1, 0, 1, 0, 1])
+        self.assertEqual(perft.perft(board_, player, 2), [7, 6 * 7])
+
+    def test_a_won_position_has_no_continuations(self):
+        board_, player = perft.get_position(7, 6, 4, [0, 1, 0, 1, 0, 1, 0])
+        self.assertEqual(perft.perft(board_, player, 3), [0, 0, 0])
+
+    def test_stops_when_the_board_is_full(self):
+        board_, player = perft.get_position(2, 1, 4, [])
+        self.assertEqual(perft.perft(board_, player, 4), [2, 2, 0, 0])
+
+    def test_parallel_matches_serial(self):
+        board_, player = perft.get_position(4, 4, 3, [1])
+        self.assertEqual(
+            perft.perft_parallel(4, 4, 3, [1], 5, processes=2),
+            perft.perft(board_, player, 5),
+        )
+
+    def test_rejects_moves_into_a_full_column(self):
+        with self.assertRaises(ValueError):
+            perft.get_position(7, 1, 4, [0, 0])
@@ -0,0 +1,51 @@
+import os
+import tempfile
+import unittest
+
+import profiler
+
+
+class TestFrameProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.profiler = profiler.FrameProfiler(fps=50, window=100)
+
+    def test_percentiles_cover_the_rolling_window(self):
+        for millisecond in range(200):
+            self.profiler.end_frame(millisecond / 1000, 0.02)
+        p50, p95, p99 = self.profiler.get_percentiles(self.profiler.frame_times)
+        self.assertEqual(len(self.profiler.frame_times), 100)
+        self.assertAlmostEqual(p50, 0.150)
+        self.assertAlmostEqual(p95, 0.195)
+        self.assertAlmostEqual(p99, 0.199)
+
+    def test_counts_frames_over_the_budget_as_dropped(self):
+        for seconds in (0.01, 0.019, 0.021, 0.5):
+            self.profiler.end_frame(seconds, seconds)
+        self.assertEqual(self.profiler.frames, 4)
+        self.assertEqual(self.profiler.dropped_frames, 2)
+
+    def test_uncapped_frames_are_never_dropped(self):
+        uncapped = profiler.FrameProfiler(fps=0)
+        uncapped.end_frame(1.0, 1.0)
+        self.assertEqual(uncapped.dropped_frames, 0)
+
+    def test_timed_records_every_call(self):
+        timed = self.profiler.timed("double", lambda value: value * 2)
+        self.assertEqual(timed(3), 6)
+        self.assertEqual(timed(value=4), 8)
+        self.assertEqual(len(self.profiler.samples["double"]), 2)
+        self.assertGreater(self.profiler.totals["double"], 0)
+
+    def test_dumps_a_report_every_dump_frames(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "frames.txt")
+            dumping = profiler.FrameProfiler(fps=30, dump_path=path, dump_frames=2)
+            dumping.add("render", 0.001)
+            for _ in range(5):
+                dumping.end_frame(0.001, 0.001)
+            with open(path) as file:
+                reports = file.read().split("\n\n")
+        self.assertEqual(len([report for report in reports if report]), 2)
+        self.assertIn("frames:         4", reports[1])
+        self.assertIn("render:", reports[1])
@@ -0,0 +1,114 @@
+import os
+import tempfile
+import unittest
+
+import board
+import records
+
+
+class TestRecords(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "games.c4")
+        self.games = [
+            (7, 7, 4, "human", "ComputerPlayer", bytes((3, 3, 4, 4, 5, 5, 6))),
+            (20, 20, 6, "random", "greedy", bytes((19, 0, 19))),
+            (7, 7, 4, "human", "human", b""),
+        ]
+        with records.GameWriter(self.path) as writer:
+            for columns, rows, connect, red, blue, moves in self.games:
+                writer.start_game(columns, rows, connect, red, blue)
+                for column in moves:
+                    writer.write_move(column)
+                writer.end_game()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def assert_record(self, record, game):
+        self.assertEqual(
+            (
+                record.columns,
+                record.rows,
+                record.connect,
+                record.red,
+                record.blue,
+                record.moves,
+            ),
+            game,
+        )
+
+    def test_reads_back_every_game_in_order(self):
+        records_ = list(records.read_games(self.path))
+        self.assertEqual(len(records_), len(self.games))
+        for record, game in zip(records_, self.games):
+            self.assert_record(record, game)
+
+    def test_one_byte_per_move(self):
+        size = os.path.getsize(self.path)
+        with records.GameWriter(self.path) as writer:
+            writer.start_game(7, 7, 4, "", "")
+            for column in range(5):
+                writer.write_move(column)
+        self.assertEqual(os.path.getsize(self.path) - size, 4 + 2 + 5 + 1)
+
+    def test_jumps_to_a_game_through_the_index(self):
+        self.assertEqual(records.count_games(self.path), 3)
+        self.assert_record(records.read_game(self.path, 1), self.games[1])
+        with self.assertRaises(IndexError):
+            records.read_game(self.path, 3)
+
+    def test_appending_extends_the_archive_and_the_index(self):
+        with records.GameWriter(self.path) as writer:
+            writer.start_game(7, 7, 4, "a", "b")
+            writer.write_move(0)
+        self.assertEqual(records.count_games(self.path), 4)
+        self.assertEqual(records.read_game(self.path, 3).moves, bytes((0,)))
+
+    def test_taking_back_moves_cuts_them_from_the_game(self):
+        with records.GameWriter(self.path) as writer:
+            writer.start_game(7, 7, 4, "a", "b")
+            writer.write_move(0)
+            writer.write_move(1)
+            writer.take_back_move()
+            writer.write_move(2)
+            writer.end_game()
+            writer.start_game(7, 7, 4, "a", "b")
+            with self.assertRaises(ValueError):
+                writer.take_back_move()
+            writer.write_move(3)
+        self.assertEqual(records.read_game(self.path, 3).moves, bytes((0, 2)))
+        self.assertEqual(records.read_game(self.path, 4).moves, bytes((3,)))
+
+    def test_build_index_matches_the_written_index(self):
+        index_path = os.path.join(self.directory.name, "rebuilt.idx")
+        self.assertEqual(records.build_index(self.path, index_path), 3)
+        with open(index_path, "rb") as rebuilt, open(
+            records.get_index_path(self.path), "rb"
+        ) as written:
+            self.assertEqual(rebuilt.read(), written.read())
+
+    def test_replay_plays_the_moves_through_the_rules(self):
+        game_rules = records.read_game(self.path, 0).replay()
+        self.assertTrue(game_rules.game_over)
+        self.assertEqual(game_rules.red_score, 1)
+        self.assertEqual(game_rules.board.get_disk(6, 6), board.RED)
+
+    def test_replay_starts_with_the_first_player(self):
+        with records.GameWriter(self.path) as writer:
+            writer.start_game(7, 7, 4, "a", "b", board.BLUE)
+            for column in (3, 3, 4, 4, 5, 5, 6):
+                writer.write_move(column)
+        record = records.read_game(self.path, 3)
+        self.assertEqual(record.first_player, board.BLUE)
+        game_rules = record.replay()
+        self.assertEqual((game_rules.red_score, game_rules.blue_score), (0, 1))
+        self.assertEqual(game_rules.board.get_disk(6, 6), board.BLUE)
+        self.assertEqual(records.read_game(self.path, 0).first_player, board.RED)
+
+    def test_rejects_other_files(self):
+        with open(self.path, "r+b") as file:
+            file.write(b"X")
+        with self.assertRaises(ValueError):
+            list(records.read_games(self.path))
@@ -0,0 +1,195 @@
+import unittest
+
+import board
+import rules
+
+
+class TestColumnFull(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.rules = rules.Rules()
+        cls.rules.get_grid()
+
+    def test_column_full_returns_false_when_column_contains_all_black_disks(self):
+        self.assertFalse(self.rules.column_full(column=0))
+
+    def test_column_full_returns_false_when_column_contains_some_black_disks(self):
+        self.rules.board.set_disk(0, 6, board.RED)
+        self.rules.board.set_disk(0, 5, board.BLUE)
+        self.assertFalse(self.rules.column_full(column=0))
+
+    def test_column_full_returns_true_when_column_contains_no_black_disks(self):
+        self.rules.board.set_disk(0, 6, board.RED)
+        self.rules.board.set_disk(0, 5, board.BLUE)
+        self.rules.board.set_disk(0, 4, board.RED)
+        self.rules.board.set_disk(0, 3, board.BLUE)
+        self.rules.board.set_disk(0, 2, board.RED)
+        self.rules.board.set_disk(0, 1, board.BLUE)
+        self.rules.board.set_disk(0, 0, board.RED)
+        self.assertTrue(self.rules.column_full(column=0))
+
+
+class TestDropDiskInColumn(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.rules = rules.Rules()
+        cls.rules.get_grid()
+
+    def test_last_disk_in_column_that_is_red(self):
+        column = 0
+        self.rules.current_player = board.RED
+        self.rules.drop_disk_in_column(column)
+        self.assertEqual(self.rules.board.get_disk(column, 6), board.RED)
+
+    def test_second_to_last_disk_in_column_is_blue(self):
+        column = 0
+        self.rules.current_player = board.BLUE
+        self.rules.drop_disk_in_column(column)
+        self.assertEqual(self.rules.board.get_disk(column, 5), board.BLUE)
+
+
+class TestIncrementScore(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.rules = rules.Rules()
+
+    def setUp(self):
+        self.rules.red_score = 0
+        self.rules.blue_score = 0
+
+    def test_red_score_is_incremented(self):
+        self.rules.current_player = board.RED
+        self.rules.increment_score()
+        self.assertEqual(self.rules.red_score, 1)
+
+    def test_blue_score_is_incremented(self):
+        self.rules.current_player = board.BLUE
+        self.rules.increment_score()
+        self.assertEqual(self.rules.blue_score, 1)
+
+    def test_red_score_is_not_incremented(self):
+        self.rules.current_player = board.BLUE
+        self.rules.increment_score()
+        self.assertEqual(self.rules.red_score, 0)
+
+    def test_blue_score_is_not_incremented(self):
+        self.rules.current_player = board.RED
+        self.rules.increment_score()
+        self.assertEqual(self.rules.blue_score, 0)
+
+
+class TestSwapCurrentPlayer(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.rules = rules.Rules()
+
+    def test_current_player_becomes_blue(self):
+        self.rules.current_player = board.RED
+        self.rules.swap_current_player()
+        self.assertEqual(self.rules.current_player, board.BLUE)
+
+    def test_current_player_becomes_red(self):
+        self.rules.current_player = board.BLUE
+        self.rules.swap_current_player()
+        self.assertEqual(self.rules.current_player, board.RED)
+
+
+class TestPlayColumn(unittest.TestCase):
+
+    def setUp(self):
+        self.rules = rules.Rules()
+
+    def test_drops_a_disk_and_swaps_the_current_player(self):
+        self.assertIsNone(self.rules.play_column(3))
+        self.assertEqual(self.rules.board.get_disk(3, 6), board.RED)
+        self.assertEqual(self.rules.current_player, board.BLUE)
+
+    def test_winning_move_scores_and_ends_the_game(self):
+        for column in (0, 0, 1, 1, 2, 2):
+            self.rules.play_column(column)
+        disks = self.rules.play_column(3)
+        self.assertEqual(disks, [(0, 6), (1, 6), (2, 6), (3, 6)])
+        self.assertEqual(self.rules.winning_disks, disks)
+        self.assertEqual(self.rules.red_score, 1)
+        self.assertEqual(self.rules.blue_score, 0)
+        self.assertTrue(self.rules.game_over)
+
+    def test_raises_when_the_game_is_over(self):
+        self.rules.game_over = True
+        with self.assertRaises(ValueError):
+            self.rules.play_column(0)
+
+    def test_raises_when_the_column_is_full(self):
+        for _ in range(self.rules.board.rows):
+            self.rules.board.drop_disk_in_column(0, board.RED)
+        with self.assertRaises(ValueError):
+            self.rules.play_column(0)
+
+    def test_connect_sets_the_winning_run_length(self):
+        rules_ = rules.Rules(columns=9, rows=8, connect=5)
+        for column in (0, 0, 1, 1, 2, 2, 3, 3):
+            self.assertIsNone(rules_.play_column(column))
+        self.assertEqual(rules_.play_column(4), [(column, 7) for column in range(5)])
+
+
+class TestUndoMove(unittest.TestCase):
+
+    def setUp(self):
+        self.rules = rules.Rules()
+        for column in (0, 0, 1, 1, 2, 2):
+            self.rules.play_column(column)
+
+    def test_restores_the_position_before_the_move(self):
+        disks = self.rules.board.disks[:]
+        key = self.rules.board.get_key()
+        self.rules.play_column(5)
+        self.assertEqual(self.rules.undo_move(), 5)
+        self.assertEqual(self.rules.board.disks, disks)
+        self.assertEqual(self.rules.board.get_key(), key)
+        self.assertEqual(self.rules.board.heights, [2, 2, 2, 0, 0, 0, 0])
+        self.assertEqual(self.rules.current_player, board.RED)
+
+    def test_undoing_a_win_restores_the_score_and_the_game(self):
+        self.rules.play_column(3)
+        self.rules.undo_move()
+        self.assertFalse(self.rules.game_over)
+        self.assertEqual(self.rules.winning_disks, [])
+        self.assertEqual((self.rules.red_score, self.rules.blue_score), (0, 0))
+        self.assertEqual(self.rules.current_player, board.RED)
+
+    def test_redo_replays_undone_moves(self):
+        self.rules.play_column(3)
+        self.rules.undo_move()
+        self.rules.undo_move()
+        self.assertEqual(self.rules.redo_move(), 2)
+        self.assertEqual(self.rules.redo_move(), 3)
+        self.assertIsNone(self.rules.redo_move())
+        self.assertTrue(self.rules.game_over)
+        self.assertEqual(self.rules.red_score, 1)
+
+    def test_playing_a_move_clears_the_redo_moves(self):
+        self.rules.undo_move()
+        self.rules.play_column(6)
+        self.assertIsNone(self.rules.redo_move())
+
+    def test_nothing_to_undo_after_get_grid(self):
+        self.rules.get_grid()
+        self.assertIsNone(self.rules.undo_move())
+        self.assertIsNone(self.rules.redo_move())
+
+
+class TestGetGrid(unittest.TestCase):
+
+    def test_clears_the_board_and_keeps_the_scores(self):
+        rules_ = rules.Rules()
+        for column in (0, 1, 0, 1, 0, 1, 0):
+            rules_.play_column(column)
+        rules_.get_grid()
+        self.assertEqual(rules_.board.disks, [0, 0])
+        self.assertEqual(rules_.winning_disks, [])
+        self.assertFalse(rules_.game_over)
+        self.assertEqual(rules_.red_score, 1)
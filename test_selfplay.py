@@ -0,0 +1,57 @@
+import argparse
+import unittest
+
+import board
+import selfplay
+
+
+class TestGreedyPlayer(unittest.TestCase):
+
+    def setUp(self):
+        self.board = board.Board()
+        self.greedy_player = selfplay.GreedyPlayer(board.RED, seed=1)
+
+    def test_takes_a_winning_move(self):
+        for column in (0, 1, 2):
+            self.board.drop_disk_in_column(column, board.RED)
+            self.board.drop_disk_in_column(column, board.BLUE)
+        self.assertEqual(self.greedy_player.search(self.board, board.RED), 3)
+
+    def test_blocks_the_opponents_winning_move(self):
+        for _ in range(3):
+            self.board.drop_disk_in_column(5, board.BLUE)
+        self.board.drop_disk_in_column(0, board.RED)
+        self.assertEqual(self.greedy_player.search(self.board, board.RED), 5)
+
+
+class TestPlayChunk(unittest.TestCase):
+
+    def test_every_game_ends_in_a_win_or_a_draw(self):
+        games, red_wins, blue_wins, draws, moves = selfplay.play_chunk(
+            ("random", "greedy", 20, 0, 2, None, 2)
+        )
+        self.assertEqual(games, 20)
+        self.assertEqual(red_wins + blue_wins + draws, 20)
+        self.assertGreaterEqual(moves, 20 * 7)
+
+    def test_same_seed_gives_the_same_results(self):
+        task = ("random", "random", 20, 5, 2, None, 2)
+        self.assertEqual(selfplay.play_chunk(task), selfplay.play_chunk(task))
+
+
+class TestGetTasks(unittest.TestCase):
+
+    def test_chunks_cover_every_game_once(self):
+        args = argparse.Namespace(
+            red="random",
+            blue="search",
+            games=250,
+            seed=0,
+            depth=4,
+            think_time=None,
+            opening_plies=2,
+            chunk_size=100,
+        )
+        tasks = list(selfplay.get_tasks(args))
+        self.assertEqual([task[2] for task in tasks], [100, 100, 50])
+        self.assertEqual(len({task[3] for task in tasks}), 3)
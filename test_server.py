@@ -0,0 +1,116 @@
+import asyncio
+import unittest
+
+import board
+import server
+
+
+class TestGameServer(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.game_server = server.GameServer()
+        self.server = await asyncio.start_server(
+            self.game_server.handle_connection, "127.0.0.1", 0
+        )
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.red = await server.Client.connect("127.0.0.1", self.port)
+        self.blue = await server.Client.connect("127.0.0.1", self.port)
+
+    async def asyncTearDown(self):
+        await self.red.close()
+        await self.blue.close()
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def start_match(self):
+        number = (await self.red.request("new"))["match"]
+        reply = await self.blue.request("join", match=number)
+        self.assertEqual(reply["player"], board.BLUE)
+        return number
+
+    async def test_plays_a_match_to_a_win(self):
+        number = await self.start_match()
+        for column in (0, 1, 0, 1, 0, 1):
+            client = self.red if column == 0 else self.blue
+            self.assertTrue(
+                (await client.request("play", match=number, column=column))["ok"]
+            )
+        reply = await self.red.request("play", match=number, column=0)
+        self.assertTrue(reply["game_over"])
+        self.assertEqual(reply["winning_disks"], [[0, 3], [0, 4], [0, 5], [0, 6]])
+        self.assertEqual(reply["scores"], [1, 0])
+
+    async def test_pushes_moves_to_the_opponent(self):
+        number = await self.start_match()
+        await self.red.request("play", match=number, column=3)
+        await self.blue.request("state", match=number)
+        self.assertEqual(
+            [(event["event"], event["column"]) for event in self.blue.events],
+            [("move", 3)],
+        )
+
+    async def test_rejects_moves_out_of_turn(self):
+        number = await self.start_match()
+        reply = await self.blue.request("play", match=number, column=3)
+        self.assertFalse(reply["ok"])
+        self.assertEqual(reply["error"], "not your turn")
+
+    async def test_reports_bad_requests(self):
+        for reply in (
+            await self.red.request("nonsense"),
+            await self.red.request("state", match=99),
+            await self.red.request("new", columns="seven"),
+        ):
+            self.assertFalse(reply["ok"])
+
+    async def test_limits_board_sizes(self):
+        for size in (
+            {"columns": 21},
+            {"rows": 255},
+            {"columns": 0},
+            {"connect": 1},
+            {"columns": 5, "rows": 5, "connect": 6},
+            {"columns": True},
+            {"connect": 4.0},
+        ):
+            reply = await self.red.request("new", **size)
+            self.assertFalse(reply["ok"], size)
+        reply = await self.red.request("new", columns=20, rows=20, connect=6)
+        self.assertTrue(reply["ok"])
+        self.assertEqual(len(self.game_server.matches), 1)
+
+    async def test_rejects_columns_that_are_not_integers(self):
+        number = await self.start_match()
+        for column in (True, 3.0, "3", None):
+            reply = await self.red.request("play", match=number, column=column)
+            self.assertFalse(reply["ok"], column)
+        reply = await self.red.request("play", match=True, column=3)
+        self.assertFalse(reply["ok"])
+        self.assertEqual(self.game_server.matches[number].rules.moves, [])
+
+    async def test_match_is_dropped_once_both_seats_leave(self):
+        number = await self.start_match()
+        await self.red.request("leave", match=number)
+        self.assertIn(number, self.game_server.matches)
+        await self.blue.request("leave", match=number)
+        self.assertNotIn(number, self.game_server.matches)
+
+    async def test_load_reports_memory_and_latency(self):
+        stats = await server.run_load("127.0.0.1", self.port, matches=20, moves=200)
+        self.assertEqual(stats["matches"], 20)
+        self.assertEqual(stats["moves"], 200)
+        self.assertGreater(stats["match_bytes"], 0)
+        self.assertGreater(stats["round_trip_us"]["p50"], 0)
+
+
+class TestMatchBytes(unittest.TestCase):
+
+    def test_leaves_out_the_shared_zobrist_tables(self):
+        match = server.Match(1, 7, 7, 4)
+        board_ = match.rules.board
+        shared = server.get_size(board_.zobrist_keys, set()) + server.get_size(
+            board_.player_hashes, set()
+        )
+        self.assertLessEqual(
+            server.get_match_bytes({1: match}), server.get_size(match, set()) - shared
+        )
@@ -0,0 +1,147 @@
+import os
+import tempfile
+import unittest
+
+import board
+import perft
+import solver
+
+
+def solve_fully(board_: board.Board, player: int) -> int:
+    # Plain negamax over every continuation, for checking the solver on
+    # boards small enough to search exhaustively.
+    moves = sum(board_.heights)
+    cells = board_.columns * board_.rows
+    if board_.has_four_in_a_row(board.OPPONENTS[player]):
+        return -((cells + 2 - moves) // 2)
+    if board_.board_full():
+        return 0
+    best = None
+    for column in range(board_.columns):
+        if not board_.column_full(column):
+            board_.drop_disk_in_column(column, player)
+            score = -solve_fully(board_, board.OPPONENTS[player])
+            board_.undo_drop(column)
+            if best is None or score > best:
+                best = score
+    return best
+
+
+class TestSolver(unittest.TestCase):
+
+    def test_matches_an_exhaustive_search(self):
+        for columns, rows, connect, moves in (
+            (3, 3, 3, []),
+            (4, 3, 3, []),
+            (4, 4, 3, [1, 2, 1]),
+            (5, 4, 4, [2, 2, 1, 3, 0, 4, 4, 2, 1, 0]),
+        ):
+            board_, player = perft.get_position(columns, rows, connect, moves)
+            self.assertEqual(
+                solver.Solver().solve(board_),
+                solve_fully(board_.copy(), player),
+                (columns, rows, connect, moves),
+            )
+
+    def test_solves_standard_board_endgames(self):
+        # Positions and scores from a published solver test set, with the
+        # moves numbered from 1.
+        for moves, score in (
+            ("2252576253462244111563365343671351441", -1),
+            ("7422341735647741166133573473242566", 1),
+            ("23163416124767223154467471272416755633", 0),
+        ):
+            board_, _ = perft.get_position(7, 6, 4, [int(move) - 1 for move in moves])
+            self.assertEqual(solver.Solver().solve(board_), score)
+
+    def test_does_not_change_the_board(self):
+        board_, _ = perft.get_position(4, 4, 3, [1, 2])
+        disks = list(board_.disks)
+        solver.Solver().solve(board_)
+        self.assertEqual(board_.disks, disks)
+        self.assertEqual(board_.heights, [0, 1, 1, 0])
+
+    def test_results(self):
+        board_, _ = perft.get_position(7, 6, 4, [0, 1, 0, 1, 0, 1])
+        self.assertEqual(solver.analyse(board_), ("win", 1))
+        board_.drop_disk_in_column(0, board.RED)
+        self.assertEqual(solver.analyse(board_), ("loss", 0))
+        board_, _ = perft.get_position(3, 1, 4, [0, 1])
+        self.assertEqual(solver.analyse(board_), ("draw", 1))
+        board_, _ = perft.get_position(
+            7, 6, 4, [int(move) - 1 for move in "2252576253462244111563365343671351441"]
+        )
+        self.assertEqual(solver.analyse(board_), ("loss", 4))
+
+    def test_positions_blue_opened(self):
+        # Blue opens with 3, 4 and 5 along the bottom, so red to move loses.
+        board_ = board.Board(7, 6, 4)
+        player = board.BLUE
+        for column in (3, 3, 4, 4, 5):
+            board_.drop_disk_in_column(column, player)
+            player = board.OPPONENTS[player]
+        disks = list(board_.disks)
+        self.assertEqual(solver.analyse(board_, player=board.RED), ("loss", 2))
+        self.assertEqual(board_.disks, disks)
+        # It shares a solution with the same moves with red opening.
+        solver_ = solver.Solver()
+        self.assertEqual(solver_.solve(board_, board.RED), -18)
+        red_opened, _ = perft.get_position(7, 6, 4, [3, 3, 4, 4, 5])
+        self.assertEqual(solver_.solve(red_opened), -18)
+        self.assertEqual(len(solver_.solved), 1)
+
+
+class TestSolutionTable(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "solutions.c4s")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_stores_solved_positions(self):
+        board_, _ = perft.get_position(4, 4, 3, [])
+        solver_ = solver.Solver()
+        for position in solver.get_positions(board_, 2):
+            solver_.solve(position)
+        with solver.SolutionTable(self.path) as table:
+            table.add(board_, solver_.solved)
+            self.assertEqual(len(table), len(solver_.solved))
+        with solver.SolutionTable(self.path) as table:
+            self.assertEqual(dict(table.items()), solver_.solved)
+            for key, score in solver_.solved.items():
+                self.assertEqual(table.get(key), score)
+            self.assertIsNone(table.get(1))
+
+    def test_uses_stored_scores(self):
+        board_, _ = perft.get_position(4, 4, 3, [1])
+        with solver.SolutionTable(self.path) as table:
+            table.add(board_, {board_.get_key(): 5})
+            solver_ = solver.Solver(table)
+            self.assertEqual(solver_.solve(board_), 5)
+            self.assertEqual(solver_.nodes, 0)
+
+    def test_merges_new_positions(self):
+        board_, _ = perft.get_position(4, 4, 3, [])
+        with solver.SolutionTable(self.path) as table:
+            table.add(board_, {3: 1, 1: -2})
+            table.add(board_, {2: 0, 3: 2})
+            self.assertEqual(list(table.items()), [(1, -2), (2, 0), (3, 2)])
+
+    def test_rejects_other_board_sizes(self):
+        with solver.SolutionTable(self.path) as table:
+            table.add(board.Board(4, 4, 3), {1: 0})
+            with self.assertRaises(ValueError):
+                table.add(board.Board(7, 6, 4), {1: 0})
+            self.assertFalse(table.matches(board.Board(7, 6, 4)))
+
+    def test_rejects_other_files(self):
+        with open(self.path, "wb") as file:
+            file.write(b"not a table")
+        with self.assertRaises(ValueError):
+            solver.SolutionTable(self.path)
+
+    def test_rejects_boards_too_big_for_the_keys(self):
+        with self.assertRaises(ValueError):
+            solver.get_table_key(board.Board(20, 20, 6))
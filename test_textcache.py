@@ -0,0 +1,37 @@
+import unittest
+
+import pygame
+
+import textcache
+
+
+class TestRender(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()
+
+    def setUp(self):
+        self.text_cache = textcache.TextCache(max_surfaces=2)
+
+    def test_same_text_returns_the_cached_surface(self):
+        surface = self.text_cache.render("1", (255, 255, 0))
+        self.assertIs(self.text_cache.render("1", (255, 255, 0)), surface)
+
+    def test_different_color_renders_a_new_surface(self):
+        surface = self.text_cache.render("1", (255, 255, 0))
+        self.assertIsNot(self.text_cache.render("1", (0, 0, 0)), surface)
+
+    def test_font_is_loaded_once(self):
+        self.text_cache.render("1", (255, 255, 0))
+        self.text_cache.render("2", (255, 255, 0))
+        self.assertEqual(len(self.text_cache.fonts), 1)
+
+    def test_least_recently_used_surface_is_evicted(self):
+        first = self.text_cache.render("1", (255, 255, 0))
+        self.text_cache.render("2", (255, 255, 0))
+        self.text_cache.render("1", (255, 255, 0))
+        self.text_cache.render("3", (255, 255, 0))
+        self.assertEqual(len(self.text_cache.surfaces), 2)
+        self.assertIs(self.text_cache.render("1", (255, 255, 0)), first)
+        self.assertNotIn(("2", (255, 255, 0), None, 24), self.text_cache.surfaces)
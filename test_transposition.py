@@ -0,0 +1,80 @@
+import unittest
+
+import transposition
+
+
+class TestTranspositionTable(unittest.TestCase):
+
+    def setUp(self):
+        # One bucket, so every key competes for the same two slots.
+        self.table = transposition.TranspositionTable(
+            megabytes=2 * transposition.SLOT_BYTES / 2**20
+        )
+
+    def test_memory_is_fixed_up_front(self):
+        table = transposition.TranspositionTable(megabytes=1)
+        slots = table.get_stats()["slots"]
+        self.assertLessEqual(slots * transposition.SLOT_BYTES, 2**20)
+        self.assertGreater((slots + 2) * transposition.SLOT_BYTES, 2**20)
+        for key in range(1, 200000):
+            table.put(key, 1, transposition.EXACT, key, 0)
+        self.assertEqual(len(table.keys), 2 * table.buckets)
+        self.assertLessEqual(len(table), 2 * table.buckets)
+
+    def test_returns_stored_entries(self):
+        self.table.put(7, 3, transposition.LOWER_BOUND, -5, 2)
+        self.assertEqual(self.table.get(7), (3, transposition.LOWER_BOUND, -5, 2))
+        self.table.put(9, 1, transposition.UPPER_BOUND, 4, None)
+        self.assertEqual(self.table.get(9), (1, transposition.UPPER_BOUND, 4, None))
+        self.assertIsNone(self.table.get(11))
+
+    def test_keeps_the_deepest_entry(self):
+        self.table.put(1, 5, transposition.EXACT, 0, 0)
+        self.table.put(2, 2, transposition.EXACT, 0, 0)
+        self.table.put(3, 1, transposition.EXACT, 0, 0)
+        self.assertIsNotNone(self.table.get(1))
+        self.assertIsNone(self.table.get(2))
+        self.assertIsNotNone(self.table.get(3))
+        self.assertEqual(len(self.table), 2)
+
+    def test_deeper_entries_take_the_first_slot(self):
+        self.table.put(1, 2, transposition.EXACT, 0, 0)
+        self.table.put(2, 4, transposition.EXACT, 0, 0)
+        self.table.put(3, 1, transposition.EXACT, 0, 0)
+        self.assertIsNone(self.table.get(1))
+        self.assertIsNotNone(self.table.get(2))
+
+    def test_updates_an_entry_in_place(self):
+        self.table.put(1, 5, transposition.EXACT, 0, 0)
+        self.table.put(2, 2, transposition.EXACT, 0, 0)
+        self.table.put(2, 3, transposition.EXACT, 6, 1)
+        self.assertEqual(self.table.get(2), (3, transposition.EXACT, 6, 1))
+        self.assertEqual(len(self.table), 2)
+        self.assertEqual(self.table.overwrites, 0)
+
+    def test_counts_hits_misses_and_overwrites(self):
+        self.table.put(1, 5, transposition.EXACT, 0, 0)
+        self.table.put(2, 2, transposition.EXACT, 0, 0)
+        self.table.put(3, 2, transposition.EXACT, 0, 0)
+        self.table.get(1)
+        self.table.get(2)
+        self.table.get(3)
+        stats = self.table.get_stats()
+        self.assertEqual(
+            (stats["used"], stats["hits"], stats["misses"], stats["overwrites"]),
+            (2, 2, 1, 1),
+        )
+        self.assertAlmostEqual(stats["hit_rate"], 2 / 3)
+
+    def test_clear(self):
+        keys = self.table.keys
+        self.table.put(1, 9, transposition.EXACT, 0, 0)
+        self.table.clear()
+        self.assertIsNone(self.table.get(1))
+        self.assertEqual(len(self.table), 0)
+        self.assertIs(self.table.keys, keys)
+        self.table.put(2, 1, transposition.EXACT, 0, 0)
+        self.table.put(3, 1, transposition.EXACT, 0, 0)
+        self.assertIsNotNone(self.table.get(2))
+        self.assertIsNotNone(self.table.get(3))
+        self.assertEqual(len(self.table), 2)
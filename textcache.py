@@ -0,0 +1,37 @@
+import collections
+from typing import Optional, Tuple
+
+import pygame
+
+
+class TextCache:
+
+    def __init__(self, max_surfaces: int = 64):
+        self.max_surfaces = max_surfaces
+        self.fonts = {}
+        self.surfaces = collections.OrderedDict()
+
+    def get_font(self, name: Optional[str], size: int) -> pygame.font.Font:
+        font = self.fonts.get((name, size))
+        if font is None:
+            font = pygame.font.Font(name, size)
+            self.fonts[(name, size)] = font
+        return font
+
+    def render(
+        self,
+        text: str,
+        color: Tuple[int, int, int],
+        name: Optional[str] = None,
+        size: int = 24,
+    ) -> pygame.Surface:
+        key = (text, color, name, size)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+        surface = self.get_font(name, size).render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_surfaces:
+            self.surfaces.popitem(last=False)
+        return surface
@@ -0,0 +1,101 @@
+import array
+from typing import Dict, Optional, Tuple
+
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+# Bytes a slot takes across the arrays: an 8 byte key, a 4 byte value and a
+# byte each for the depth, the bound flag and the best column.
+SLOT_BYTES = 15
+NO_COLUMN = 255
+
+
+class TranspositionTable:
+
+    # Each bucket has two slots. The first keeps whichever entry was searched
+    # deepest, so expensive results survive, and the second always takes the
+    # newest entry that did not go in the first, so recent results do too.
+
+    def __init__(self, megabytes: float = 16):
+        self.buckets = max(1, int(megabytes * 2**20) // (2 * SLOT_BYTES))
+        slots = 2 * self.buckets
+        self.keys = array.array("Q", bytes(8 * slots))
+        self.values = array.array("i", bytes(4 * slots))
+        self.depths = array.array("B", bytes(slots))
+        self.flags = array.array("B", bytes(slots))
+        self.columns = array.array("B", bytes(slots))
+        self.used = 0
+        self.hits = 0
+        self.misses = 0
+        self.overwrites = 0
+
+    def __len__(self) -> int:
+        return self.used
+
+    def clear(self) -> None:
+        # Zeroes the arrays in place, since a leftover depth would still keep
+        # newer entries out of the first slot.
+        for values in (self.keys, self.values, self.depths, self.flags, self.columns):
+            memoryview(values).cast("B")[:] = bytes(len(values) * values.itemsize)
+        self.used = 0
+
+    def get(self, key: int) -> Optional[Tuple[int, int, int, Optional[int]]]:
+        slot = key % self.buckets * 2
+        keys = self.keys
+        if keys[slot] != key:
+            slot += 1
+            if keys[slot] != key:
+                self.misses += 1
+                return None
+        self.hits += 1
+        column = self.columns[slot]
+        return (
+            self.depths[slot],
+            self.flags[slot],
+            self.values[slot],
+            None if column == NO_COLUMN else column,
+        )
+
+    def put(
+        self, key: int, depth: int, flag: int, value: int, column: Optional[int]
+    ) -> None:
+        slot = key % self.buckets * 2
+        keys = self.keys
+        if keys[slot] == key:
+            pass
+        elif keys[slot + 1] == key or depth < self.depths[slot]:
+            slot += 1
+        elif keys[slot]:
+            # The entry losing the first slot is still the newest one for the
+            # second.
+            self.move_entry(slot, slot + 1)
+        if keys[slot] != key:
+            if keys[slot]:
+                self.overwrites += 1
+            else:
+                self.used += 1
+            keys[slot] = key
+        self.depths[slot] = depth
+        self.flags[slot] = flag
+        self.values[slot] = value
+        self.columns[slot] = NO_COLUMN if column is None else column
+
+    def move_entry(self, source: int, destination: int) -> None:
+        if self.keys[destination]:
+            self.overwrites += 1
+            self.used -= 1
+        for values in (self.keys, self.values, self.depths, self.flags, self.columns):
+            values[destination] = values[source]
+        self.keys[source] = 0
+
+    def get_stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "slots": 2 * self.buckets,
+            "used": self.used,
+            "hits": self.hits,
+            "misses": self.misses,
+            "overwrites": self.overwrites,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }